@@ -12,6 +12,15 @@ def cli():
     parser.add_argument("--demo", action="store_true")
     parser.add_argument("--aschild", action="store_true",
                         help="Run as child of another process")
+    parser.add_argument("--framing", choices=["line", "binary"],
+                        help="Framing of messages passed to and from "
+                             "the parent process")
+    parser.add_argument("--socket", metavar="ADDRESS",
+                        help="Pass messages to and from the parent "
+                             "process over a local socket")
+    parser.add_argument("--codecs", nargs="+",
+                        help="Codecs offered by the parent process, "
+                             "in order of preference")
     parser.add_argument(
         "--targets",
         nargs="*",
@@ -4,7 +4,6 @@
 import os
 import sys
 import time
-import json
 import traceback
 import threading
 
@@ -69,12 +68,18 @@ class Application(QtGui.QGuiApplication):
     validated = QtCore.Signal()
 
     targeted = QtCore.Signal("QVariant")
+    streamed = QtCore.Signal(object)
 
     risen = QtCore.Signal()
     inFocused = QtCore.Signal()
     outFocused = QtCore.Signal()
 
-    def __init__(self, source, targets=None):
+    def __init__(self,
+                 source,
+                 targets=None,
+                 framing="line",
+                 socket=None,
+                 codecs=None):
         super(Application, self).__init__(sys.argv)
 
         self.setWindowIcon(QtGui.QIcon(ICON_PATH))
@@ -85,7 +90,9 @@ class Application(QtGui.QGuiApplication):
         engine = window.engine()
         engine.addImportPath(QML_IMPORT_DIR)
 
-        host = ipc.client.Proxy()
+        host = ipc.client.Proxy(framing=framing,
+                                socket=socket,
+                                codecs=codecs)
         controller = control.Controller(host, targets=targets, parent=window)
         controller.finished.connect(lambda: window.alert(0))
 
@@ -106,6 +113,11 @@ class Application(QtGui.QGuiApplication):
         self.validated.connect(self.validate)
 
         self.targeted.connect(self.target)
+        self.streamed.connect(self.stream)
+
+        # Emitted from the thread receiving messages, ahead
+        # of results following the records, see Proxy.stream
+        host.stream = self.streamed.emit
 
         self.risen.connect(self.rise)
         self.inFocused.connect(self.inFocus)
@@ -228,6 +240,10 @@ class Application(QtGui.QGuiApplication):
     def target(self, targets):
         self.controller.targets = targets
 
+    def stream(self, stream):
+        """Append records of a pair still being processed"""
+        self.controller.update_with_stream(stream)
+
     def listen(self):
         """Listen on incoming messages from host
 
@@ -240,8 +256,8 @@ class Application(QtGui.QGuiApplication):
 
         def _listen():
             while True:
-                line = self.host.channels["parent"].get()
-                payload = json.loads(line)["payload"]
+                message = self.host.channels["parent"].get()
+                payload = message["payload"]
 
                 # We can't call methods directly, as we are running
                 # in a thread. Instead, we emit signals that do the
@@ -277,18 +293,31 @@ class Application(QtGui.QGuiApplication):
         thread.start()
 
 
-def main(demo=False, aschild=False, targets=None):
+def main(demo=False,
+         aschild=False,
+         targets=None,
+         framing=None,
+         socket=None,
+         codecs=None):
     """Start the Qt-runtime and show the window
 
     Arguments:
         aschild (bool, optional): Run as child of parent process
+        framing (str, optional): Framing of messages, "line" or "binary"
+        socket (str, optional): Address of parent, to pass messages
+            over a local socket rather than stdin and stdout
+        codecs (list, optional): Codecs offered by parent, by preference
 
     """
 
     if aschild:
         print("Starting pyblish-qml")
         compat.main()
-        app = Application(APP_PATH, targets)
+        app = Application(APP_PATH,
+                          targets,
+                          framing=framing or "line",
+                          socket=socket,
+                          codecs=codecs)
         app.listen()
 
         print("Done, don't forget to call `show()`")
@@ -297,7 +326,7 @@ def main(demo=False, aschild=False, targets=None):
     else:
         print("Starting pyblish-qml server..")
         service = ipc.service.MockService() if demo else ipc.service.Service()
-        server = ipc.server.Server(service, targets=targets)
+        server = ipc.server.Server(service, targets=targets, framing=framing)
 
         proxy = ipc.server.Proxy(server)
         proxy.show(settings.to_dict())
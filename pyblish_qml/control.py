@@ -51,6 +51,10 @@ class Controller(QtCore.QObject):
 
     state_changed = QtCore.Signal(str, arguments=["state"])
 
+    # Seconds of processing after which the host returns results,
+    # such that publishing may be stopped in between
+    batch_duration = 0.5
+
     # Statically expose these members to the QML run-time.
     itemModel = qtproperty(lambda self: self.data["models"]["item"])
     itemProxy = qtproperty(lambda self: self.data["proxies"]["item"])
@@ -89,20 +93,20 @@ class Controller(QtCore.QObject):
 
                 "plugin": models.ProxyModel(
                     self.data["models"]["item"],
-                    includes={"itemType": "plugin"},
+                    includes={"itemType": ["plugin"]},
                     excludes={"hasCompatible": [False]}),
 
                 # Terminal
-                "result": models.ProxyModel(
+                "result": models.ResultProxyModel(
                     self.data["models"]["result"],
                     excludes={"levelname": ["DEBUG"]}),
 
                 # Perspective
-                "record": models.ProxyModel(
+                "record": models.ResultProxyModel(
                     self.data["models"]["result"],
                     includes={"type": ["record"]}),
 
-                "error": models.ProxyModel(
+                "error": models.ResultProxyModel(
                     self.data["models"]["result"],
                     includes={"type": ["error"]})
             },
@@ -340,9 +344,14 @@ class Controller(QtCore.QObject):
             pyblish.api.IntegratorOrder: self.integrating,
         }
 
-        for plug, instance in iterator(plugins, context):
+        for plug, instances in batches(plugins, context):
+
+            instances = [
+                instance for instance in instances
+                if instance is None or instance.data.get("publish", True)
+            ]
 
-            if instance is not None and not instance.data.get("publish", True):
+            if not instances:
                 continue
 
             state["nextOrder"] = plug.order
@@ -351,33 +360,42 @@ class Controller(QtCore.QObject):
                 if pyblish.lib.inrange(plug.order, order):
                     signals.pop(order).emit()
 
-            if not self.data["state"]["is_running"]:
-                return StopIteration("Stopped")
+            pairs = [(plug, instance) for instance in instances]
 
-            test_result = self.host.test(**state)
-            if test_result:
-                self.data["state"]["testPassed"] = False
-                return StopIteration("Stopped due to %s" % test_result)
+            while pairs:
+                if not self.data["state"]["is_running"]:
+                    return StopIteration("Stopped")
 
-            self.data["state"]["testPassed"] = True
+                # Notify GUI before commencing remote processing,
+                # of the pair processed first. Any other pair of the
+                # batch is reflected as its result comes back.
+                self.about_to_process.emit(*pairs[0])
 
-            try:
-                # Notify GUI before commencing remote processing
-                self.about_to_process.emit(plug, instance)
-
-                result = self.host.process(plug, context, instance)
+                try:
+                    # Instances of this plug-in are processed in
+                    # batches lasting up to `batch_duration`, the
+                    # test being run host-side.
+                    batch = self.host.process_batch(
+                        pairs, duration=self.batch_duration, **state)
 
-            except Exception as e:
-                return StopIteration("Unknown error: %s" % e)
+                except Exception as e:
+                    return StopIteration("Unknown error: %s" % e)
 
-            else:
                 # Make note of the order at which the
                 # potential error error occured.
-                has_error = result["error"] is not None
-                if has_error:
-                    state["ordersWithError"].add(plug.order)
+                state["ordersWithError"] = set(
+                    batch["vars"]["ordersWithError"])
+
+                stopped = batch["stopped"]
+                self.data["state"]["testPassed"] = stopped is None
+
+                if batch["results"]:
+                    yield batch
 
-            yield result
+                if stopped:
+                    return StopIteration("Stopped due to %s" % stopped)
+
+                pairs = pairs[len(batch["results"]):]
 
     @QtCore.Slot(int, result="QVariant")
     def getPluginActions(self, index):
@@ -491,7 +509,8 @@ class Controller(QtCore.QObject):
             plugin.actionHasError = not result["success"]
 
             # Allow running action upon action, without resetting
-            models["result"].update_with_result(result)
+            models["result"].update_with_result(
+                result, models["item"].items)
             self.info.emit("Success" if result["success"] else "Failed")
             util.echo("Finished with states.. %s" % self.states)
 
@@ -532,14 +551,16 @@ class Controller(QtCore.QObject):
             # are the same state.
             checkState = not states.pop()
 
-        for item in model.items:
-            if item.itemType == "instance" and sectionLabel == item.category:
-                if item.isToggled != checkState and item.optional:
-                    self.__toggle_item(model, model.items.index(item))
+        with model.batch():
+            for item in model.items:
+                if (item.itemType == "instance" and
+                        sectionLabel == item.category):
+                    if item.isToggled != checkState and item.optional:
+                        self.__toggle_item(model, model.items.index(item))
 
-            if item.itemType == "plugin" and sectionLabel == item.verb:
-                if item.isToggled != checkState and item.optional:
-                    self.__toggle_item(model, model.items.index(item))
+                if item.itemType == "plugin" and sectionLabel == item.verb:
+                    if item.isToggled != checkState and item.optional:
+                        self.__toggle_item(model, model.items.index(item))
 
     @QtCore.Slot(bool, str)
     def hideSection(self, hideState, sectionLabel):
@@ -659,12 +680,45 @@ class Controller(QtCore.QObject):
                            old_value=old_value)
 
         item.isToggled = new_value
-        self.data["models"]["item"].update_compatibility()
+
+        # Plug-ins are compatible with toggled instances only
+        if item.itemType == "instance":
+            model.update_compatibility(item)
 
     def echo(self, data):
         """Append `data` to result model"""
         self.data["models"]["result"].add_item(data)
 
+    def update_with_stream(self, stream):
+        """Append records streamed from host to result model"""
+        self.data["models"]["result"].update_with_stream(
+            stream, self.data["models"]["item"].items)
+
+    @QtCore.Slot(str)
+    def showDropped(self, reference):
+        """Append records left out of a result by the host
+
+        See `Service.set_record_filter`.
+
+        Arguments:
+            reference (str): JSON of the ids of the plug-in
+                and instance of the result
+
+        """
+
+        plugin, instance = json.loads(reference)
+
+        def on_records(records):
+            self.update_with_stream({
+                "plugin": {"id": plugin},
+                "instance": {"id": instance} if instance else None,
+                "records": records,
+            })
+
+        util.defer(self.host.dropped_records,
+                   args=[plugin, instance],
+                   callback=on_records)
+
     def comment_sync(self, comment, item):
         """Update comments to host and notify subscribers"""
         name = item.name
@@ -718,14 +772,15 @@ class Controller(QtCore.QObject):
 
         plugin_item = self.data["models"]["item"].plugins[plugin.id]
 
-        for section in self.data["models"]["item"].sections:
-            if section.name == plugin_item.verb:
-                section.isProcessing = True
-            if section.name == instance_item.category:
-                section.isProcessing = True
+        with self.data["models"]["item"].batch():
+            for section in self.data["models"]["item"].sections:
+                if section.name == plugin_item.verb:
+                    section.isProcessing = True
+                if section.name == instance_item.category:
+                    section.isProcessing = True
 
-        instance_item.isProcessing = True
-        plugin_item.isProcessing = True
+            instance_item.isProcessing = True
+            plugin_item.isProcessing = True
 
     def on_state_changed(self, state):
         util.echo("Entering state: \"%s\"" % state)
@@ -800,13 +855,17 @@ class Controller(QtCore.QObject):
 
         def on_finished(plugins, context):
             # Compute compatibility
-            for plugin in self.data["models"]["item"].plugins:
-                if plugin.instanceEnabled:
-                    instances = pyblish.logic.instances_by_plugin(context,
-                                                                  plugin)
-                    plugin.compatibleInstances = list(i.id for i in instances)
-                else:
-                    plugin.compatibleInstances = [context.id]
+            model = self.data["models"]["item"]
+
+            with model.batch():
+                compatible = instances_by_plugins(context, model.plugins)
+
+                for plugin, instances in zip(model.plugins, compatible):
+                    if plugin.instanceEnabled:
+                        plugin.compatibleInstances = list(
+                            i.id for i in instances)
+                    else:
+                        plugin.compatibleInstances = [context.id]
 
             self.data["models"]["item"].reorder(context)
 
@@ -887,8 +946,10 @@ class Controller(QtCore.QObject):
             if hasattr(pyblish.api, "plugins_by_targets"):
                 plugins = pyblish.api.plugins_by_targets(plugins, self.targets)
 
+            self.data["models"]["item"].add_plugins(
+                [plugin.to_json() for plugin in plugins])
+
             for plugin in plugins:
-                self.data["models"]["item"].add_plugin(plugin.to_json())
 
                 # Sort out which of these are Collectors
                 if not pyblish.lib.inrange(
@@ -922,7 +983,12 @@ class Controller(QtCore.QObject):
         def on_reset():
             util.defer(self.host.context, callback=on_context)
 
-        util.defer(self.host.reset, callback=on_reset)
+        def reset():
+            self.host.set_record_filter(settings.RecordLevel,
+                                        settings.RecordLimit)
+            self.host.reset()
+
+        util.defer(reset, callback=on_reset)
 
     @QtCore.Slot()
     def publish(self):
@@ -1053,36 +1119,64 @@ class Controller(QtCore.QObject):
         util.timer("publishing")
         stats = {"requestCount": self.host.stats()["totalRequestCount"]}
 
-        # For each completed task, update
-        # the GUI and commence next task.
-        def on_next(result):
-            if isinstance(result, StopIteration):
-                return on_finished(str(result))
+        # For each completed batch of tasks, update
+        # the GUI and commence next batch.
+        def on_next(batch):
+            if isinstance(batch, StopIteration):
+                return on_finished(str(batch))
 
-            self.data["models"]["item"].update_with_result(result)
-            self.data["models"]["result"].update_with_result(result)
+            with self.data["models"]["item"].batch():
+                for result in batch["results"]:
+                    self.data["models"]["item"].update_with_result(result)
+                    self.data["models"]["result"].update_with_result(
+                        result, self.data["models"]["item"].items)
 
-            # Once the main thread has finished updating
-            # the GUI, we can proceed handling of next task.
-            util.defer(self.host.context, callback=update_context)
+            # The context as it was after the last task of the batch
+            update_context(batch["context"])
 
-        def update_context(ctx):
+        def update_context(delta):
+            """Reflect changes made to the context by the last batch"""
             item_model = self.data["models"]["item"]
-            instance_items = {item.id: item for item in item_model.instances}
-            for instance in ctx:
-                id = instance.id
-                item = instance_items.get(id)
+
+            # The host proxy may already have applied these
+            # changes, in case `context` is its very own.
+            is_cached = context is self.host.cached_context
+
+            for id in delta["removed"]:
+                # Remove from model
+                item = item_model.instances.get(id)
                 if item is not None:
-                    proxy = next((i for i in context if i.id == id), None)
-                    update_instance(item, proxy, instance.data)
-                    continue
+                    item_model.remove_instance(item)
+
+                # Remove instance from list
+                proxy = proxies.pop(id, None)
+                if proxy is not None and not is_cached:
+                    context.remove(proxy)
+
+            added = list()
+
+            with item_model.batch():
+                for instance in delta["changed"] + delta["added"]:
+                    item = item_model.instances.get(instance.id)
 
-                context.append(instance)
-                item_model.add_instance(instance.to_json())
+                    if item is not None:
+                        proxy = proxies.get(instance.id)
+                        update_instance(item, proxy, instance.data)
 
-            if len(ctx) < item_model.instance_count():
-                remove_instance(ctx, instance_items)
+                        # Plug-ins are compatible with toggled instances only
+                        item_model.update_compatibility(item)
+                        continue
 
+                    proxies[instance.id] = instance
+                    if not is_cached:
+                        context.append(instance)
+
+                    added.append(instance.to_json())
+
+            item_model.add_instances(added)
+
+            # Once the main thread has finished updating
+            # the GUI, we can proceed handling of next task.
             util.defer(lambda: next(iterator), callback=on_next)
 
         def update_instance(item, proxy, data):
@@ -1106,18 +1200,6 @@ class Controller(QtCore.QObject):
             proxy.data["family"] = data["family"]
             proxy.data["families"] = data.get("families", [])
 
-        def remove_instance(ctx, items):
-            """Remove instance"""
-            instances = {i.id: i for i in context}
-            instance_ids = set(i.id for i in ctx)
-            instance_ids.add(ctx.id)
-            for id, item in items.items():
-                if id not in instance_ids:
-                    # Remove from model
-                    self.data["models"]["item"].remove_instance(item)
-                    # Remove instance from list
-                    context.remove(instances[id])
-
         def on_finished(message=None):
             """Locally running function"""
             self.data["state"]["is_running"] = False
@@ -1135,6 +1217,9 @@ class Controller(QtCore.QObject):
             if callback:
                 callback(*callback_args)
 
+        # Instances being processed, by id
+        proxies = dict((instance.id, instance) for instance in context)
+
         # The iterator initiates processing and is
         # executed one item at a time in a separate thread.
         # Once the thread finishes execution, it signals
@@ -1204,7 +1289,8 @@ class Controller(QtCore.QObject):
                 return on_finished()
 
             self.data["models"]["item"].update_with_result(result)
-            self.data["models"]["result"].update_with_result(result)
+            self.data["models"]["result"].update_with_result(
+                result, self.data["models"]["item"].items)
 
             # Run next again
             util.defer(lambda: next(iterator), callback=on_next)
@@ -1225,6 +1311,20 @@ class Controller(QtCore.QObject):
 
 def iterator(plugins, context):
     """An iterator for plug-in and instance pairs"""
+    for plugin, instances in batches(plugins, context):
+        for instance in instances:
+            yield plugin, instance
+
+
+def batches(plugins, context):
+    """An iterator for plug-ins along with every instance they process
+
+    Instances are looked up once each plug-in is reached, such that
+    instances added by previous plug-ins are taken into account. A
+    plug-in processing the Context is paired with a single None.
+
+    """
+
     test = pyblish.logic.registered_test()
     state = {
         "nextOrder": None,
@@ -1240,8 +1340,66 @@ def iterator(plugins, context):
 
         instances = pyblish.api.instances_by_plugin(context, plugin)
         if plugin.__instanceEnabled__:
-            for instance in instances:
-                yield plugin, instance
+            yield plugin, list(instances)
 
         else:
-            yield plugin, None
+            yield plugin, [None]
+
+
+def instances_by_plugins(context, plugins):
+    """Yield compatible instances per plug-in, as per instances_by_plugin
+
+    Instances are indexed by family once, such that each plug-in is
+    matched by the families it supports rather than against every
+    instance, via its matching algorithm.
+
+    Arguments:
+        context (pyblish.api.Context): Context of instances
+        plugins (list): Plug-ins, with `families` and `match`
+
+    """
+
+    instances = list(context)
+
+    families = list()
+    index = dict()
+
+    for position, instance in enumerate(instances):
+        family = instance.data.get("family")
+        members = set([family] if family else [])
+        members.update(instance.data.get("families", []))
+
+        families.append(members)
+
+        for member in members:
+            index.setdefault(member, set()).add(position)
+
+    for plugin in plugins:
+        if "*" in plugin.families:
+            yield list(instances)
+            continue
+
+        supported = set(plugin.families)
+
+        if plugin.match == pyblish.logic.Intersection:
+            positions = set().union(
+                *(index.get(family, ()) for family in supported))
+
+        elif plugin.match in (pyblish.logic.Subset, pyblish.logic.Exact):
+            positions = set(range(len(instances)))
+
+            for family in supported:
+                positions &= index.get(family, set())
+
+            if plugin.match == pyblish.logic.Exact:
+                positions = set(
+                    position for position in positions
+                    if families[position] == supported
+                )
+
+        else:
+            # Unknown to us, e.g. from a future version of pyblish
+            yield pyblish.logic.instances_by_plugin(instances, plugin)
+            continue
+
+        yield [instances[position] for position in sorted(positions)]
@@ -11,32 +11,87 @@
 |             |        |           |
 |_____________|        |___________|
 
+Alternatively, messages may be passed over a local socket,
+see :mod:`sockets`, with stdout reserved for plain output.
+
 """
 
 import os
 import sys
-import json
+import logging
 import threading
+import itertools
 
 import pyblish.api
 import pyblish.plugin
 
+from . import framing, serialization, sockets
 from ..vendor import six
 from ..vendor.six.moves import queue
 
+_log = logging.getLogger("pyblish-qml")
+
+
+class Request(object):
+    """A request in flight, awaiting its response from the parent
+
+    Arguments:
+        id (int): Unique identifier, echoed by the parent in its response
+
+    """
+
+    def __init__(self, id):
+        self.id = id
+        self._response = queue.Queue(maxsize=1)
+
+    def put(self, response):
+        self._response.put(response)
+
+    def result(self):
+        """Block until the response has arrived and return its payload"""
+        response = self._response.get()
+        assert response["header"] == "pyblish-qml:popen.response", response
+        return response["payload"]
+
 
 class Proxy(object):
-    """Messages sent from QML to parent process"""
+    """Messages sent from QML to parent process
+
+    Arguments:
+        framing (str, optional): Either "line" or "binary", as
+            negotiated with the parent, see :mod:`framing`
+        socket (str, optional): Address of parent, see :mod:`sockets`
+        codecs (list, optional): Codecs offered by the parent, by
+            preference, see :mod:`serialization`
+
+    """
 
     channels = {
-        "response": queue.Queue(),
         "parent": queue.Queue(),
     }
 
-    def __init__(self):
+    # Callable passed records of a pair still being processed by the
+    # parent. Unlike other messages of the parent, these are passed
+    # on as they are received, ahead of the result of the pair.
+    stream = None
+
+    def __init__(self, framing="line", socket=None, codecs=None):
+        self.framing = framing
+        self.connection = sockets.connect(socket) if socket else None
+        self.codec = serialization.negotiate(
+            codecs or [serialization.JSON.name],
+            binary=socket is not None or framing == "binary")
         self.cached_context = list()
         self.cached_discover = list()
 
+        # Version of `cached_context`, see `context_delta`
+        self.context_version = None
+
+        # Requests awaiting a response, by id
+        self._pending = dict()
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
         self._self_destruct()
         self._listen()
 
@@ -73,15 +128,127 @@ class Proxy(object):
         instance = instance.to_json() if instance is not None else None
         return self._dispatch("process", args=[plugin, instance, action])
 
+    def process_batch(self, pairs, duration=None, **vars):
+        """Transmit many pairs to host, to be processed in one request
+
+        Arguments:
+            pairs (list): Tuples of (PluginProxy, InstanceProxy), where
+                the instance is None for plug-ins processing the Context.
+            duration (float, optional): Seconds after which the host
+                leaves the remaining pairs unprocessed
+            vars: State of the test, see :func:`test`
+
+        Returns:
+            dict: Results and resulting context, see `Service.process_batch`
+
+        """
+
+        # -> Support JSON, see #364
+        vars["ordersWithError"] = list(vars["ordersWithError"])
+
+        pairs = [
+            [plugin.id, instance.id if instance is not None else None]
+            for plugin, instance in pairs
+        ]
+
+        batch = self._dispatch("process_batch", args=[
+            pairs, vars, self.context_version, duration])
+
+        batch["context"] = self._apply_delta(batch["context"])
+
+        return batch
+
     def repair(self, plugin, context, instance=None):
         plugin = plugin.to_json()
         instance = instance.to_json() if instance is not None else None
         return self._dispatch("repair", args=[plugin, instance])
 
+    def set_record_filter(self, level=0, limit=None):
+        """Limit the records sent with each result, see `Service`"""
+        self._dispatch("set_record_filter", args=[level, limit])
+
+    def dropped_records(self, plugin, instance=None):
+        """Return records dropped from the last result of a pair
+
+        Arguments:
+            plugin (str): Id of processed plug-in
+            instance (str, optional): Id of processed instance
+
+        """
+
+        return self._dispatch("dropped_records", args=[plugin, instance])
+
     def context(self):
-        self.cached_context = ContextProxy.from_json(self._dispatch("context"))
+        context = self._dispatch("context")
+        self.cached_context = ContextProxy.from_json(context)
+        self.context_version = context.get("version")
         return self.cached_context
 
+    def context_delta(self):
+        """Fetch changes to the context since it was last fetched
+
+        The changes are applied to `cached_context`.
+
+        Returns:
+            dict: Added and changed InstanceProxy objects, along
+                with the ids of removed instances.
+
+        """
+
+        delta = self._dispatch("context_delta", args=[self.context_version])
+        return self._apply_delta(delta)
+
+    def _apply_delta(self, delta):
+        """Apply changes from host onto `cached_context`"""
+        if delta["full"]:
+            previous = self.cached_context
+            self.cached_context = ContextProxy.from_json({
+                "id": delta["id"],
+                "data": delta["data"],
+                "children": delta["added"],
+            })
+
+            current = set(instance.id for instance in self.cached_context)
+
+            delta["added"] = list(self.cached_context)
+            delta["removed"] = [
+                instance.id for instance in previous
+                if instance.id not in current
+            ]
+
+        else:
+            context = self.cached_context
+            instances = dict((instance.id, instance) for instance in context)
+
+            if delta["data"] is not None:
+                context._data = delta["data"]
+                context._data["pyblishClientVersion"] = pyblish.api.version
+
+            for id in delta["removed"]:
+                instance = instances.pop(id, None)
+                if instance is not None:
+                    context.remove(instance)
+
+            changed = list()
+            for instance in delta["changed"]:
+                proxy = instances.get(instance["id"])
+                if proxy is None:
+                    proxy = InstanceProxy.from_json(instance)
+                    context.append(proxy)
+                else:
+                    proxy._data = instance["data"]
+                changed.append(proxy)
+
+            delta["changed"] = changed
+            delta["added"] = [
+                InstanceProxy.from_json(instance)
+                for instance in delta["added"]
+            ]
+            context.extend(delta["added"])
+
+        self.context_version = delta["version"]
+        return delta
+
     def discover(self):
         self.cached_discover[:] = list()
         for plugin in self._dispatch("discover"):
@@ -105,94 +272,178 @@ class Proxy(object):
     def _listen(self):
         """Listen for messages passed from parent
 
-        This method distributes messages received via stdin to their
-        corresponding channel. Based on the format of the incoming
+        This method distributes messages received via stdin or socket
+        to their corresponding channel. Based on the format of the incoming
         message, the message is forwarded to its corresponding channel
         to be processed by its corresponding handler.
 
         """
 
-        def _listen():
+        def _listen_lines():
             """This runs in a thread"""
-            for line in iter(sys.stdin.readline, b""):
-                try:
-                    response = json.loads(line)
+            fd = sys.stdin.fileno()
+            remainder = b""
 
-                except Exception as e:
-                    # The parent has passed on a message that
-                    # isn't formatted in any particular way.
-                    # This is likely a bug.
-                    raise e
+            while True:
+                data = os.read(fd, 65536)
 
-                else:
-                    if response.get("header") == "pyblish-qml:popen.response":
-                        self.channels["response"].put(line)
+                if not data:
+                    break
+
+                lines = (remainder + data).split(b"\n")
+                remainder = lines.pop()
+
+                for line in lines:
+                    if line.strip():
+                        self._receive(line)
+
+        def _listen_frames():
+            """This runs in a thread"""
+            decoder = framing.Decoder()
+            fd = sys.stdin.fileno()
 
-                    elif response.get("header") == "pyblish-qml:popen.parent":
-                        self.channels["parent"].put(line)
+            while True:
+                data = os.read(fd, 65536)
 
-                    elif response.get("header") == "pyblish-qml:server.pulse":
-                        self._kill.cancel()  # reset timer
-                        self._self_destruct()
+                if not data:
+                    break
 
-                    else:
-                        # The parent has passed on a message that
-                        # is JSON, but not in any format we recognise.
-                        # This is likely a bug.
-                        raise Exception("Unhandled message "
-                                        "passed to Popen, '%s'" % line)
+                for kind, chunk in decoder.feed(data):
+                    if kind == framing.MESSAGE:
+                        self._receive(chunk)
+
+        def _listen_socket():
+            """This runs in a thread"""
+            for message in self.connection.messages():
+                self._receive(message)
+
+        if self.connection is not None:
+            _listen = _listen_socket
+        else:
+            _listen = {
+                "line": _listen_lines,
+                "binary": _listen_frames,
+            }[self.framing]
 
         thread = threading.Thread(target=_listen)
         thread.daemon = True
         thread.start()
 
-    def _dispatch(self, func, args=None, kwargs=None):
-        """Send message to parent process
+    def _receive(self, line):
+        """Forward serialised message `line` to its recipient"""
+        codec = serialization.detect(line)
+
+        try:
+            response = codec.loads(line)
+
+        except Exception as e:
+            # The parent has passed on a message that
+            # isn't formatted in any particular way.
+            # This is likely a bug.
+            raise e
+
+        else:
+            if response.get("header") == "pyblish-qml:popen.response":
+                with self._lock:
+                    request = self._pending.pop(response.get("id"), None)
+
+                if request is None:
+                    # A response to no request in flight, e.g. from a
+                    # parent unaware of request ids. There is no one
+                    # awaiting it, so it is dropped.
+                    _log.warning("Dropped response to unknown "
+                                 "request: %r" % response.get("id"))
+                else:
+                    if six.PY2 and not codec.binary:
+                        # Binary codecs decode to native strings
+                        response = _byteify(response)
+                    request.put(response)
+
+            elif response.get("header") == "pyblish-qml:popen.parent":
+                payload = response["payload"]
+
+                if payload["name"] == "stream" and self.stream is not None:
+                    # Called upon from this thread, such that records
+                    # are passed on in order with the responses that
+                    # follow, rather than via the "parent" channel.
+                    self.stream(*payload["args"])
+                else:
+                    self.channels["parent"].put(response)
+
+            elif response.get("header") == "pyblish-qml:server.pulse":
+                self._kill.cancel()  # reset timer
+                self._self_destruct()
+
+            else:
+                # The parent has passed on a message that
+                # is JSON, but not in any format we recognise.
+                # This is likely a bug.
+                raise Exception("Unhandled message "
+                                "passed to Popen, '%s'" % line)
+
+    def _request(self, func, args=None, kwargs=None):
+        """Send message to parent process, without awaiting its response
+
+        Each request carries a unique id which the parent echoes in its
+        response, such that multiple requests may be in flight at once
+        and be responded to in any order.
 
         Arguments:
             func (str): Name of function for parent to call
             args (list, optional): Arguments passed to function when called
+            kwargs (dict, optional): Keyword arguments passed to function
+
+        Returns:
+            Request: Call `result()` to await the response
 
         """
 
-        data = json.dumps(
-            {
-                "header": "pyblish-qml:popen.request",
-                "payload": {
-                    "name": func,
-                    "args": args or list(),
-                    "kwargs": kwargs or dict(),
+        with self._lock:
+            request = Request(next(self._ids))
+            self._pending[request.id] = request
+
+            data = self.codec.dumps(
+                {
+                    "header": "pyblish-qml:popen.request",
+                    "id": request.id,
+                    "payload": {
+                        "name": func,
+                        "args": args or list(),
+                        "kwargs": kwargs or dict(),
+                    }
                 }
-            }
-        )
-
-        # This should never happen. Each request is immediately
-        # responded to, always. If it isn't the next line will block.
-        # If multiple responses were made, then this will fail.
-        # Both scenarios are bugs.
-        assert self.channels["response"].empty(), (
-            "There were pending messages in the response channel")
-
-        # To ensure successful IPC message parsing, the message and the
-        # surrounding delimiters must be passed to the stream object at once.
-        # See https://github.com/pyblish/pyblish-qml/pull/325 for more info.
-        sys.stdout.write("\n" + data + "\n")
-        sys.stdout.flush()
+            )
 
-        try:
-            message = self.channels["response"].get()
+            if self.connection is not None:
+                self.connection.send(data)
+
+            elif self.framing == "binary":
+                # Anything printed so far goes first
+                sys.stdout.flush()
+                framing.write(getattr(sys.stdout, "buffer", sys.stdout), data)
 
-            if six.PY3:
-                response = json.loads(message)
             else:
-                response = _byteify(json.loads(message, object_hook=_byteify))
+                # To ensure successful IPC message parsing, the message and
+                # the surrounding delimiters must be passed to the stream
+                # object at once, and never interleaved with those of another
+                # thread. See https://github.com/pyblish/pyblish-qml/pull/325
+                sys.stdout.flush()
+                stdout = getattr(sys.stdout, "buffer", sys.stdout)
+                stdout.write(b"\n" + data + b"\n")
+                stdout.flush()
 
-        except TypeError as e:
-            raise e
+        return request
 
-        else:
-            assert response["header"] == "pyblish-qml:popen.response", response
-            return response["payload"]
+    def _dispatch(self, func, args=None, kwargs=None):
+        """Send message to parent process and await its response
+
+        Arguments:
+            func (str): Name of function for parent to call
+            args (list, optional): Arguments passed to function when called
+
+        """
+
+        return self._request(func, args, kwargs).result()
 
 
 def _byteify(data):
@@ -2,6 +2,7 @@ import os
 import sys
 import logging
 import inspect
+import itertools
 import traceback
 
 from . import schema
@@ -12,6 +13,38 @@ import pyblish.plugin
 
 log = logging.getLogger("pyblish")
 
+# Plug-in class -> ((mtime, order), serialised), see format_plugin
+_plugin_cache = dict()
+
+# Number of messages considered for validation, see _validate
+_validations = itertools.count()
+
+# These are the only data members
+# accessible from the client, see format_data
+data_keys = (
+
+    # Essential data from each instance
+    "name",
+    "label",
+    "family",
+    "families",
+    "category",
+    "publish",
+    "comment",
+
+    # Allows an instance to be non-optional (ie, mandatory)
+    "optional",
+
+    # Provided by service.py
+    "host",
+    "port",
+    "user",
+    "connectTime",
+    "pyblishVersion",
+    "pyblishRPCVersion",
+    "pythonVersion",
+)
+
 if six.PY2:
     get_arg_spec = inspect.getargspec
 else:
@@ -30,42 +63,107 @@ def extract_traceback(exception):
         del(exc_type, exc_value, exc_traceback)
 
 
+def _validate(data, name):
+    """Validate `data` against schema `name` when running safe
+
+    Safe mode is enabled via PYBLISH_SAFE. With PYBLISH_SAFE_SAMPLE=N,
+    only every Nth message is validated.
+
+    """
+
+    if not os.getenv("PYBLISH_SAFE"):
+        return
+
+    try:
+        every = max(1, int(os.getenv("PYBLISH_SAFE_SAMPLE") or 1))
+    except ValueError:
+        every = 1
+
+    if next(_validations) % every == 0:
+        schema.validate(data, name)
+
+
 def format_result(result):
-    """Serialise Result"""
+    """Serialise Result
+
+    The plug-in and instance are referenced by id alone, as the
+    client already holds them from `discover` and `context`.
+
+    The result is validated as a whole, including its
+    records, when running safe.
+
+    """
+
     instance = None
     error = None
 
     if result["instance"] is not None:
-        instance = format_instance(result["instance"])
+        instance = {"id": result["instance"].id}
 
     if result["error"] is not None:
         error = format_error(result["error"])
 
-    result = {
+    formatted = {
         "success": result["success"],
-        "plugin": format_plugin(result["plugin"]),
+        "plugin": {"id": result["plugin"].id},
         "instance": instance,
         "error": error,
-        "records": format_records(result["records"]),
+        "records": format_records(result["records"], validate=False),
         "duration": result["duration"]
     }
 
-    if os.getenv("PYBLISH_SAFE"):
-        schema.validate(result, "result")
+    # Records left out by the service, by level
+    for key in ("streamed", "dropped"):
+        if result.get(key):
+            formatted[key] = result[key]
+
+    _validate(formatted, "result")
+
+    return formatted
+
 
-    return result
+def format_batch(batch):
+    """Serialise results of Service.process_batch"""
+    return dict(batch, results=[
+        format_result(result) for result in batch["results"]
+    ])
 
 
-def format_records(records):
+def format_records(records, validate=True):
     """Serialise multiple records"""
     formatted = list()
     for record_ in records:
-        formatted.append(format_record(record_))
+        formatted.append(format_record(record_, validate))
     return formatted
 
 
-def format_record(record):
-    """Serialise LogRecord instance"""
+def format_record(record, validate=True):
+    """Serialise LogRecord instance
+
+    Arguments:
+        record (logging.LogRecord): Record to serialise, or as
+            already captured by :func:`capture_record`
+        validate (bool, optional): Validate when running safe
+
+    """
+
+    if isinstance(record, logging.LogRecord):
+        record = capture_record(record)
+
+    if validate:
+        _validate(record, "record")
+
+    return record
+
+
+def capture_record(record):
+    """Copy what is sent of LogRecord `record`, as plain data
+
+    Its message and arguments may be objects of the host, e.g. nodes
+    of Maya, and are converted by whichever thread calls upon this;
+    the host's thread, as opposed to that of the server encoding it.
+
+    """
 
     record = dict(
         (key, getattr(record, key, None))
@@ -94,14 +192,41 @@ def format_record(record):
     # Humanise output and conform to Exceptions
     record["message"] = str(record.pop("msg"))
 
-    if os.getenv("PYBLISH_SAFE"):
-        schema.validate(record, "record")
+    record["args"] = _plain(record["args"])
+    record["exc_info"] = _plain(record["exc_info"])
 
     return record
 
 
+def _plain(value):
+    """Return `value` as data of types any codec supports
+
+    Other objects are converted to their string representation.
+
+    """
+
+    if value is None or isinstance(
+            value, (bool, float) + six.integer_types + six.string_types):
+        return value
+
+    if isinstance(value, (list, tuple)):
+        return [_plain(item) for item in value]
+
+    if isinstance(value, dict):
+        return dict(
+            (key if isinstance(key, six.string_types) else str(key),
+             _plain(item))
+            for key, item in value.items()
+        )
+
+    return str(value)
+
+
 def format_error(error):
-    """Serialise exception"""
+    """Serialise exception, unless already serialised"""
+    if isinstance(error, dict):
+        return error
+
     formatted = {"message": str(error)}
 
     if hasattr(error, "traceback"):
@@ -127,36 +252,10 @@ def format_data(data):
 
     """
 
-    # These are the only data members
-    # accessible from the client
-    return dict((key, data[key]) for key in (
-
-        # Essential data from each instance
-        "name",
-        "label",
-        "family",
-        "families",
-        "category",
-        "publish",
-        "comment",
-
-        # Allows an instance to be non-optional (ie, mandatory)
-        "optional",
-
-        # Provided by service.py
-        "host",
-        "port",
-        "user",
-        "connectTime",
-        "pyblishVersion",
-        "pyblishRPCVersion",
-        "pythonVersion")
-
-        if key in data
-    )
+    return dict((key, data[key]) for key in data_keys if key in data)
 
 
-def format_instance(instance):
+def format_instance(instance, validate=True):
     """Serialise `instance`
 
     For children to be visualised and modified,
@@ -173,6 +272,10 @@ def format_instance(instance):
         data (dict, optional): Associated data
         publish (bool): Whether or not instance should be published
 
+    Arguments:
+        instance (pyblish.api.Instance): Instance to serialise
+        validate (bool, optional): Validate when running safe
+
     Returns:
         Dictionary of JSON-compatible instance
 
@@ -185,8 +288,8 @@ def format_instance(instance):
         "children": list(),
     }
 
-    if os.getenv("PYBLISH_SAFE"):
-        schema.validate(instance, "instance")
+    if validate:
+        _validate(instance, "instance")
 
     return instance
 
@@ -200,9 +303,14 @@ def format_context(context):
     }
 
 
-def format_plugins(plugins):
+def format_plugins(plugins, cached_only=False):
     """Serialise multiple plug-in
 
+    Arguments:
+        plugins (list): Plug-ins to serialise
+        cached_only (bool, optional): Return None unless every
+            plug-in is cached, see :func:`format_plugin`
+
     Returns:
         List of JSON-compatible plug-ins
 
@@ -210,13 +318,17 @@ def format_plugins(plugins):
 
     formatted = []
     for plugin_ in plugins:
-        formatted_plugin = format_plugin(plugin_)
+        formatted_plugin = format_plugin(plugin_, cached_only=cached_only)
+
+        if formatted_plugin is None:
+            return None
+
         formatted.append(formatted_plugin)
 
     return formatted
 
 
-def format_plugin(plugin):
+def format_plugin(plugin, validate=True, cached_only=False):
     """Serialise `plugin`
 
     Attributes:
@@ -235,37 +347,18 @@ def format_plugin(plugin):
         contextEnabled: Does it process the Context?
         instanceEnabled: Does it process Instance(s)?
 
-    """
-
-    type = "Other"
-
-    for order, _type in {pyblish.plugin.CollectorOrder: "Collector",
-                         pyblish.plugin.ValidatorOrder: "Validator",
-                         pyblish.plugin.ExtractorOrder: "Extractor",
-                         pyblish.plugin.IntegratorOrder: "Integrator"}.items():
-        if pyblish.lib.inrange(plugin.order, base=order):
-            type = _type
-
-    module = plugin.__module__
-
-    if module == "__main__":
-        # Support for in-memory plug-ins.
-        path = "mem:%s" % plugin.__name__
-    else:
-        try:
-            path = os.path.abspath(sys.modules[module].__file__)
-        except Exception:
-            path = "unknown"
+    Arguments:
+        plugin (pyblish.api.Plugin): Plug-in to serialise
+        validate (bool, optional): Validate when running safe
+        cached_only (bool, optional): Return None rather than
+            serialise what is costly of `plugin`, unless cached
 
-    has_repair = False
+    """
 
-    args = get_arg_spec(plugin.repair).args
-    if "context" in args or "instance" in args:
-        has_repair = True
+    static = _format_plugin_static(plugin, cached_only)
 
-    # Legacy abilities
-    if hasattr(plugin, "repair_context") or hasattr(plugin, "repair_instance"):
-        has_repair = True
+    if static is None:
+        return None
 
     output = {
         "label": plugin.label,
@@ -281,7 +374,6 @@ def format_plugin(plugin):
         # New in pyblish-base 1.5.2
         "targets": getattr(plugin, "targets", list()),
 
-        "doc": inspect.getdoc(plugin),
         "active": plugin.active,
         "match": plugin.match,
 
@@ -290,10 +382,80 @@ def format_plugin(plugin):
         "__contextEnabled__": plugin.__contextEnabled__,
         "__instanceEnabled__": plugin.__instanceEnabled__,
 
-        "path": path,
         "pre11": plugin.__pre11__,
         "contextEnabled": plugin.__contextEnabled__,
         "instanceEnabled": plugin.__instanceEnabled__,
+
+        "actions": [format_action(a) for a in plugin.actions],
+    }
+
+    output.update(static)
+
+    if validate:
+        _validate(output, "plugin")
+
+    return output
+
+
+def _format_plugin_static(plugin, cached_only=False):
+    """Serialise what is costly to compute and rarely changes of `plugin`
+
+    The result is cached per plug-in class, until either its order
+    or the file in which it was defined changes, or the cache is
+    cleared via :func:`clear_plugin_cache`. With `cached_only`, None
+    is returned where it is not cached.
+
+    """
+
+    module = plugin.__module__
+
+    if module == "__main__":
+        # Support for in-memory plug-ins.
+        path = "mem:%s" % plugin.__name__
+        mtime = None
+    else:
+        try:
+            path = os.path.abspath(sys.modules[module].__file__)
+            mtime = os.path.getmtime(path)
+        except Exception:
+            path = "unknown"
+            mtime = None
+
+    key = (mtime, plugin.order)
+
+    try:
+        cached_key, cached = _plugin_cache[plugin]
+    except KeyError:
+        pass
+    else:
+        if cached_key == key:
+            return cached
+
+    if cached_only:
+        return None
+
+    type = "Other"
+
+    for order, _type in {pyblish.plugin.CollectorOrder: "Collector",
+                         pyblish.plugin.ValidatorOrder: "Validator",
+                         pyblish.plugin.ExtractorOrder: "Extractor",
+                         pyblish.plugin.IntegratorOrder: "Integrator"}.items():
+        if pyblish.lib.inrange(plugin.order, base=order):
+            type = _type
+
+    has_repair = False
+
+    args = get_arg_spec(plugin.repair).args
+    if "context" in args or "instance" in args:
+        has_repair = True
+
+    # Legacy abilities
+    if hasattr(plugin, "repair_context") or hasattr(plugin, "repair_instance"):
+        has_repair = True
+
+    static = {
+        "doc": inspect.getdoc(plugin),
+        "path": path,
         "name": plugin.__name__,
         "type": type,
         "module": module,
@@ -302,16 +464,29 @@ def format_plugin(plugin):
             "args":  get_arg_spec(plugin.process).args,
         },
         "repair": {
-            "args":  get_arg_spec(plugin.repair).args,
+            "args":  args,
         },
-
-        "actions": [format_action(a) for a in plugin.actions],
     }
 
-    if os.getenv("PYBLISH_SAFE"):
-        schema.validate(output, "plugin")
+    _plugin_cache[plugin] = (key, static)
 
-    return output
+    return static
+
+
+def clear_plugin_cache(keep=None):
+    """Forget about previously serialised plug-ins
+
+    Arguments:
+        keep (list, optional): Plug-ins to remember, e.g. those
+            still discovered, defaults to forgetting all plug-ins
+
+    """
+
+    keep = set(keep or [])
+
+    for plugin in list(_plugin_cache):
+        if plugin not in keep:
+            _plugin_cache.pop(plugin)
 
 
 def format_action(action):
@@ -0,0 +1,117 @@
+"""Length-prefixed framing of messages
+
+An alternative to newline-delimited messages, where each message
+is prefixed by a header carrying the length of its payload.
+
+ ____________________________________________
+|         |          |                       |
+|  MAGIC  |  length  |        payload        |
+|_________|__________|_______________________|
+  8 bytes    4 bytes       `length` bytes
+
+The receiving end reads exactly `length` bytes per message, rather
+than attempting to parse every line of output as a message. Bytes
+outside of any frame, such as those of print(), are passed through
+as text.
+
+"""
+
+import struct
+
+MAGIC = b"\x00pyblish"
+LENGTH = struct.Struct(">I")
+HEADER_SIZE = len(MAGIC) + LENGTH.size
+
+TEXT = "text"
+MESSAGE = "message"
+
+
+def encode(payload):
+    """Return `payload` as a frame
+
+    Arguments:
+        payload (bytes): Serialised message
+
+    """
+
+    return MAGIC + LENGTH.pack(len(payload)) + payload
+
+
+def write(stream, payload):
+    """Write `payload` as a frame to binary `stream`
+
+    The frame is written in full, even to unbuffered streams
+    that only write part of what they are given at a time. Streams
+    returning None, such as files of Python 2, write it all at once.
+
+    """
+
+    view = memoryview(encode(payload))
+    while len(view):
+        written = stream.write(view)
+        view = view[len(view) if written is None else written:]
+    stream.flush()
+
+
+class Decoder(object):
+    """Split a stream of bytes into messages and text
+
+    Usage:
+        >>> decoder = Decoder()
+        >>> decoder.feed(b"Hello" + encode(b"{}")[:6]) == [
+        ...     (TEXT, b"Hello")]
+        True
+        >>> decoder.feed(encode(b"{}")[6:] + b"World") == [
+        ...     (MESSAGE, b"{}"), (TEXT, b"World")]
+        True
+
+    """
+
+    def __init__(self):
+        self._buffer = bytearray()
+
+    def feed(self, data):
+        """Append `data` and return what is now complete
+
+        Returns:
+            list: Tuples of (TEXT or MESSAGE, bytes), in order of arrival
+
+        """
+
+        buffer = self._buffer
+        buffer += data
+
+        chunks = list()
+
+        while buffer:
+            index = buffer.find(MAGIC)
+
+            if index == -1:
+                # Hold on to what may be the beginning of a header
+                index = len(buffer) - _partial_magic(buffer)
+
+            if index > 0:
+                chunks.append((TEXT, bytes(buffer[:index])))
+                del buffer[:index]
+
+            if len(buffer) < HEADER_SIZE:
+                break
+
+            length, = LENGTH.unpack_from(buffer, len(MAGIC))
+            end = HEADER_SIZE + length
+
+            if len(buffer) < end:
+                break
+
+            chunks.append((MESSAGE, bytes(buffer[HEADER_SIZE:end])))
+            del buffer[:end]
+
+        return chunks
+
+
+def _partial_magic(buffer):
+    """Return length of the end of `buffer` matching the start of MAGIC"""
+    for length in range(min(len(MAGIC) - 1, len(buffer)), 0, -1):
+        if buffer[-length:] == MAGIC[:length]:
+            return length
+    return 0
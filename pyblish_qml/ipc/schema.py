@@ -2,6 +2,7 @@
 
 Attributes:
     cache: Cache of previously loaded schemas
+    validators: Validators of loaded schemas, by name
 
 Resources:
     http://json-schema.org/
@@ -12,11 +13,18 @@ Resources:
 
 import os
 import json
+import threading
 
 from ..vendor import six, jsonschema
 
 cache = {}
 
+# Validators are built once and shared by threads. Their resolver
+# tracks its scope whilst descending into references, but schemas
+# all reside side by side and resolve alike from any scope.
+validators = {}
+_validators_lock = threading.Lock()
+
 MODULE_DIR = os.path.dirname(__file__)
 SCHEMA_DIR = os.path.join(MODULE_DIR, "schema")
 
@@ -33,17 +41,51 @@ def load_all():
             cache[schema] = json.load(f)
 
 
+def validator(name):
+    """Return validator of schema `name`, built once
+
+    The schema itself is checked as the validator is built,
+    rather than every time it is used.
+
+    Arguments:
+        name (str): Name of schema, e.g. "result"
+
+    """
+
+    try:
+        return validators[name]
+    except KeyError:
+        pass
+
+    with _validators_lock:
+        if name not in validators:
+            schema = cache[name + ".json"]
+
+            cls = jsonschema.validators.validator_for(schema)
+            cls.check_schema(schema)
+
+            validators[name] = cls(
+                schema,
+                types={"array": (list, tuple)},
+                resolver=_resolver())
+
+    return validators[name]
+
+
 def validate(data, schema):
     if isinstance(schema, six.string_types):
-        schema = cache[schema + ".json"]
+        return validator(schema).validate(data)
 
-    resolver = jsonschema.RefResolver(
+    return jsonschema.validate(data, schema, types={"array": (list, tuple)},
+                               resolver=_resolver())
+
+
+def _resolver():
+    return jsonschema.RefResolver(
         "",
         None,
         store=cache,
         cache_remote=True)
-    return jsonschema.validate(data, schema, types={"array": (list, tuple)},
-                               resolver=resolver)
 
 
 ValidationError = jsonschema.ValidationError
@@ -0,0 +1,150 @@
+"""Serialisation of messages passed between processes
+
+Each end encodes messages with a codec agreed upon at startup, in
+order of preference. The parent offers the codecs it has available,
+and the child picks the first one it has available too.
+
+    json    - Accelerated by orjson where available, on either end
+    msgpack - Compact binary, requires length-prefixed framing
+
+JSON is preferred where the parent has orjson, msgpack otherwise.
+
+Messages are always dictionaries, which is how a message is told
+apart from the next regardless of codec; a JSON object starts with
+"{" whereas a msgpack map never does. The parent responds to each
+request in the codec of that request, and encodes messages of its own,
+such as pulses and streamed records, in the codec of the last request.
+Until the child has made a request, that is JSON.
+
+"""
+
+import json
+
+from ..vendor import six
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+
+    # `raw` is new in msgpack 0.5.2
+    if tuple(msgpack.version) < (0, 6):
+        raise ImportError("msgpack %s unsupported" % (msgpack.version,))
+
+except ImportError:
+    msgpack = None
+
+# Keys of maps other than strings, e.g. in data of instances, are
+# refused as of msgpack 1.0 unless told otherwise. JSON accepts them,
+# encoding them as strings.
+_unpack_options = dict(raw=six.PY2)
+
+if msgpack is not None and tuple(msgpack.version) >= (1, 0):
+    _unpack_options["strict_map_key"] = False
+
+
+class Json(object):
+    """JSON, encoded as UTF-8"""
+
+    name = "json"
+
+    # Safe to pass as lines of text
+    binary = False
+
+    def dumps(self, message):
+        if orjson is not None:
+            try:
+                return orjson.dumps(message, option=orjson.OPT_NON_STR_KEYS)
+            except TypeError:
+                # E.g. integers beyond 64 bits, which
+                # the standard library handles just fine.
+                pass
+
+        return json.dumps(message).encode("utf8")
+
+    def loads(self, data):
+        if orjson is not None:
+            return orjson.loads(data)
+
+        if isinstance(data, bytes) and six.PY3:
+            data = data.decode("utf8")
+
+        return json.loads(data)
+
+
+class Msgpack(object):
+    """msgpack, decoded to native strings on either Python 2 or 3"""
+
+    name = "msgpack"
+    binary = True
+
+    def dumps(self, message):
+        return msgpack.packb(message, use_bin_type=True)
+
+    def loads(self, data):
+        return msgpack.unpackb(data, **_unpack_options)
+
+
+JSON = Json()
+MSGPACK = Msgpack()
+
+
+def available(binary=True):
+    """Return names of codecs available in this process, by preference
+
+    Arguments:
+        binary (bool, optional): Include codecs requiring framing
+
+    """
+
+    codecs = [JSON.name]
+
+    if msgpack is not None and binary:
+
+        # orjson outpaces msgpack, but the standard library does not
+        if orjson is not None:
+            codecs.append(MSGPACK.name)
+        else:
+            codecs.insert(0, MSGPACK.name)
+
+    return codecs
+
+
+def negotiate(offered, binary=True):
+    """Return the first of the `offered` codecs available in this process
+
+    Arguments:
+        offered (list): Names of codecs, by preference
+        binary (bool, optional): Whether codecs requiring framing are allowed
+
+    """
+
+    supported = available(binary)
+
+    for name in offered:
+        if name in supported:
+            return get(name)
+
+    return JSON
+
+
+def get(name):
+    return {
+        JSON.name: JSON,
+        MSGPACK.name: MSGPACK,
+    }[name]
+
+
+def detect(data):
+    """Return the codec which encoded message `data`"""
+    if data[:1] in (b"{", u"{"):
+        return JSON
+    return MSGPACK
+
+
+def loads(data):
+    """Decode message `data`, whichever codec it was encoded with"""
+    return detect(data).loads(data)
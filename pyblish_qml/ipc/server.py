@@ -1,4 +1,4 @@
-"""Speak to parent process
+"""Speak to child process
 
  _______________          _____________
 |               |        |             |
@@ -12,15 +12,21 @@
 |               |        |             |
 |_______________|        |_____________|
 
+Alternatively, messages may be passed over a local socket,
+see :mod:`sockets`, with stdout reserved for plain output.
+
 """
 
 import os
 import sys
-import json
+import codecs
+import socket
+import functools
 import threading
 import subprocess
 import time
 
+from . import framing, serialization, sockets
 from .. import _state
 from ..vendor import six
 
@@ -36,6 +42,7 @@ class Proxy(object):
     """Speak to child process"""
 
     def __init__(self, server):
+        self.server = server
         self.popen = server.popen
 
     def show(self, settings=None):
@@ -80,8 +87,19 @@ class Proxy(object):
     def target(self, targets):
         self._dispatch("target", args=[targets])
 
+    def stream(self, stream):
+        """Pass records of a pair still being processed
+
+        Arguments:
+            stream (dict): Plug-in and instance references, along
+                with formatted records, see `Service.process`
+
+        """
+
+        self._dispatch("stream", args=[stream])
+
     def _dispatch(self, func, args=None, kwargs=None):
-        data = json.dumps(
+        data = self.server.codec.dumps(
             {
                 "header": "pyblish-qml:popen.parent",
                 "payload": {
@@ -92,17 +110,14 @@ class Proxy(object):
             },
         )
 
-        if six.PY3:
-            data = data.encode("ascii")
-
-        self.popen.stdin.write(data + b"\n")
-        self.popen.stdin.flush()
+        self.server.write(data)
 
 
 class Server(object):
     """A subprocess server
 
-    This server relies on stdout and stdin for interprocess communication.
+    This server relies on stdout and stdin for interprocess communication,
+    or a local socket where `transport` is "socket".
 
     Arguments:
         service (service.Service): Dispatch requests to this service
@@ -110,24 +125,66 @@ class Server(object):
         pyqt5 (str, optional): Absolute path to PyQt5
         targets (list, optional): Publishing targets, e.g. `ftrack`
         modal (bool, optional): Block interactions to parent
+        framing (str, optional): Either "line" for newline-delimited
+            messages or "binary" for length-prefixed messages, defaults
+            to the PYBLISH_QML_FRAMING environment variable or "line"
+        transport (str, optional): Either "stdio" for messages over
+            stdin and stdout or "socket" for messages over a local
+            socket, defaults to the PYBLISH_QML_TRANSPORT environment
+            variable or "stdio"
 
     """
 
+    # Seconds to await the child connecting over a socket,
+    # such that the server does not wait on a dead child.
+    accept_timeout = 60
+
+    # Codec of messages to the child, other than responses. That is
+    # JSON until the child has made its first request, in the codec
+    # it picked of those offered, see `_receive`.
+    codec = serialization.JSON
+
     def __init__(self,
                  service,
                  python=None,
                  pyqt5=None,
                  targets=None,
                  modal=False,
-                 environ=None):
+                 environ=None,
+                 framing=None,
+                 transport=None):
 
         super(Server, self).__init__()
         self.service = service
         self.listening = False
 
+        # Requests are handled in parallel, whereas writes to
+        # the child and calls to an unwrapped service are not.
+        self._write_lock = threading.Lock()
+        self._service_lock = threading.Lock()
+
         # Store modal state
         self.modal = modal
 
+        self.framing = framing or os.getenv("PYBLISH_QML_FRAMING", "line")
+        if self.framing not in ("line", "binary"):
+            raise ValueError("Unsupported framing: %s" % self.framing)
+
+        self.transport = (
+            transport or os.getenv("PYBLISH_QML_TRANSPORT", "stdio"))
+        if self.transport not in ("stdio", "socket"):
+            raise ValueError("Unsupported transport: %s" % self.transport)
+
+        # Codecs offered to the child, see :mod:`serialization`
+        self.codecs = serialization.available(
+            binary=self.transport == "socket" or self.framing == "binary")
+
+        # Over a socket, messages written before the child
+        # has connected are held back until it does.
+        self._listener = None
+        self._connection = None
+        self._backlog = list()
+
         # The server may be run within Maya or some other host,
         # in which case we refer to it as running embedded.
         is_embedded = os.path.split(sys.executable)[-1].lower() != "python.exe"
@@ -184,7 +241,9 @@ class Server(object):
 
             # Indicate that this is a child of the parent process,
             # and that it should expect to speak with the parent
-            "--aschild"],
+            "--aschild",
+            "--framing", self.framing,
+            "--codecs"] + self.codecs,
 
             # Any path other than where the host was launched from
             # to prevent accidental pickup of e.g. PyQt5 binaries.
@@ -206,8 +265,15 @@ class Server(object):
         kwargs["args"].append("--targets")
         kwargs["args"].extend(targets)
 
+        if self.transport == "socket":
+            self._listener = sockets.Listener()
+            kwargs["args"].extend(["--socket", self._listener.address])
+
         self.popen = subprocess.Popen(**kwargs)
 
+        # Records are passed to the child as they are emitted
+        service.stream = Proxy(self).stream
+
     def stop(self):
         try:
             return self.popen.kill()
@@ -218,101 +284,130 @@ class Server(object):
     def wait(self):
         return self.popen.wait()
 
-    def listen(self):
-        """Listen to both stdout and stderr
+    def write(self, data):
+        """Write a single message to the child process
 
-        We'll want messages of a particular origin and format to
-        cause QML to perform some action. Other messages are simply
-        forwarded, as they are expected to be plain print or error messages.
+        Arguments:
+            data (bytes): Serialised message
 
         """
 
-        def _listen():
-            """This runs in a thread"""
-            HEADER = "pyblish-qml:popen.request"
+        if isinstance(data, six.text_type):
+            data = data.encode("ascii")
 
-            # To ensure successful IPC message parsing, the message got a
-            # delimiter newline in front of it. To differentiate between
-            # real newlines and message preambles we need to buffer them
-            # until the next part arrives.
-            last_msg_newline = False
+        with self._write_lock:
+            if self.transport == "socket":
+                if self._connection is None:
+                    self._backlog.append(data)
+                else:
+                    self._connection.send(data)
 
-            for line in iter(self.popen.stdout.readline, b""):
+            elif self.framing == "binary":
+                framing.write(self.popen.stdin, data)
+            else:
+                self.popen.stdin.write(data + b"\n")
+                self.popen.stdin.flush()
 
-                if six.PY3:
-                    line = line.decode("utf8")
+    def handle(self, request, codec=serialization.JSON):
+        """Call upon the service and respond to `request`
 
-                try:
-                    response = json.loads(line)
-                except Exception:
-                    if last_msg_newline:
-                        # last newline message was a real newline
-                        sys.stdout.write("\n")
-                        last_msg_newline = False
-
-                    if line == "\n":
-                        # buffer and print newlines only if they are not
-                        # preambles of messages
-                        last_msg_newline = True
-                    else:
-                        # This must be a regular message.
-                        line = line.strip()
-                        if line:
-                            sys.stdout.write(line + "\n")
+        The response carries the id of its request, such that
+        the child may pair them up regardless of the order in
+        which responses are sent.
 
-                else:
+        Arguments:
+            request (dict): Request from the child process
+            codec (optional): Codec of the request, and its response
+
+        """
+
+        payload = request["payload"]
+        args = payload["args"]
+        kwargs = payload["kwargs"]
 
-                    if (hasattr(response, "get") and
-                            response.get("header") == HEADER):
+        func_name = payload["name"]
 
-                        payload = response["payload"]
-                        args = payload["args"]
-                        kwargs = payload["kwargs"]
+        wrapper = _state.get("dispatchWrapper", default_wrapper)
 
-                        func_name = payload["name"]
+        func = getattr(self.service, func_name)
 
-                        wrapper = _state.get("dispatchWrapper",
-                                             default_wrapper)
+        # Only what must be is called upon via the wrapper, e.g.
+        # in the host's main thread, whereas its result is serialised
+        # in this thread, see `service.formatted`
+        formatter = getattr(func, "formatter", None)
 
-                        func = getattr(self.service, func_name)
-                        result = wrapper(func, *args, **kwargs)  # block..
+        lookup = getattr(func, "cached", None)
+        result = None
 
-                        # Note(marcus): This is where we wait for the host to
-                        # finish. Technically, we could kill the GUI at this
-                        # point which would make the following commands throw
-                        # an exception. However, no host is capable of kill
-                        # the GUI whilst running a command. The host is locked
-                        # until finished, which means we are guaranteed to
-                        # always respond.
+        if lookup is not None:
+            # Served right away where cached, see `service.cached`.
+            # Otherwise, serialising remains within the wrapper too,
+            # as that is what is cached.
+            result = lookup(self.service, *args, **kwargs)
+            formatter = None
 
-                        data = json.dumps(
-                            {
-                                "header": "pyblish-qml:popen.response",
-                                "payload": result
-                            },
-                        )
+        if result is None and getattr(func, "threadsafe", False):
+            # Served right away, see `service.threadsafe`
+            result = func(*args, **kwargs)
 
-                        if six.PY3:
-                            data = data.encode("ascii")
+        elif result is None:
+            if formatter is not None:
+                func = functools.partial(func.unformatted, self.service)
 
-                        self.popen.stdin.write(data + b"\n")
-                        self.popen.stdin.flush()
+            if wrapper is default_wrapper:
+                # Without a wrapper, the service would otherwise
+                # be called upon by multiple threads at once.
+                with self._service_lock:
+                    result = wrapper(func, *args, **kwargs)  # block..
+            else:
+                result = wrapper(func, *args, **kwargs)  # block..
 
-                    else:
-                        # In the off chance that a message
-                        # was successfully decoded as JSON,
-                        # but *wasn't* a request, just print it.
-                        if last_msg_newline:
-                            # last newline message was a real newline
-                            sys.stdout.write("\n")
-                        sys.stdout.write(line)
+            if formatter is not None:
+                result = formatter(result)
 
-                    # Last newline has been handled at this point.
-                    last_msg_newline = False
+        # Note(marcus): This is where we wait for the host to
+        # finish. Technically, we could kill the GUI at this
+        # point which would make the following commands throw
+        # an exception. However, no host is capable of kill
+        # the GUI whilst running a command. The host is locked
+        # until finished, which means we are guaranteed to
+        # always respond.
+
+        data = codec.dumps(
+            {
+                "header": "pyblish-qml:popen.response",
+                "id": request.get("id"),
+                "payload": result
+            },
+        )
+
+        self.write(data)
+
+    def listen(self):
+        """Listen to both stdout and stderr
+
+        We'll want messages of a particular origin and format to
+        cause QML to perform some action. Other messages are simply
+        forwarded, as they are expected to be plain print or error messages.
+
+        """
+
+        if self.transport == "socket":
+            _listen = self._listen_socket
+        else:
+            _listen = {
+                "line": self._listen_lines,
+                "binary": self._listen_frames,
+            }[self.framing]
 
         if not self.listening:
             self._start_pulse()
 
+            if self.transport == "socket":
+                thread = threading.Thread(target=self._listen_output)
+                thread.daemon = True
+                thread.start()
+
             if self.modal:
                 _listen()
             else:
@@ -322,6 +417,169 @@ class Server(object):
 
             self.listening = True
 
+    def _receive(self, message, codec=serialization.JSON):
+        """Handle a decoded `message` from the child
+
+        Arguments:
+            message (dict): Decoded message
+            codec (optional): Codec `message` was encoded with
+
+        Returns:
+            bool: Whether `message` was a request
+
+        """
+
+        if not (hasattr(message, "get") and
+                message.get("header") == "pyblish-qml:popen.request"):
+            return False
+
+        self.codec = codec
+
+        if self.modal:
+            self.handle(message, codec)
+        else:
+            # Handle requests in parallel, responding
+            # to each as soon as it is finished.
+            thread = threading.Thread(target=self.handle,
+                                      args=[message, codec])
+            thread.daemon = True
+            thread.start()
+
+        return True
+
+    def _listen_lines(self):
+        """Listen for newline-delimited messages
+
+        This runs in a thread
+
+        """
+
+        # To ensure successful IPC message parsing, the message got a
+        # delimiter newline in front of it. To differentiate between
+        # real newlines and message preambles we need to buffer them
+        # until the next part arrives.
+        last_msg_newline = False
+
+        for line in iter(self.popen.stdout.readline, b""):
+
+            if six.PY3:
+                line = line.decode("utf8")
+
+            try:
+                response = serialization.JSON.loads(line)
+            except Exception:
+                if last_msg_newline:
+                    # last newline message was a real newline
+                    sys.stdout.write("\n")
+                    last_msg_newline = False
+
+                if line == "\n":
+                    # buffer and print newlines only if they are not
+                    # preambles of messages
+                    last_msg_newline = True
+                else:
+                    # This must be a regular message.
+                    line = line.strip()
+                    if line:
+                        sys.stdout.write(line + "\n")
+
+            else:
+
+                if not self._receive(response):
+                    # In the off chance that a message
+                    # was successfully decoded as JSON,
+                    # but *wasn't* a request, just print it.
+                    if last_msg_newline:
+                        # last newline message was a real newline
+                        sys.stdout.write("\n")
+                    sys.stdout.write(line)
+
+                # Last newline has been handled at this point.
+                last_msg_newline = False
+
+    def _listen_frames(self):
+        """Listen for length-prefixed messages, see :mod:`framing`
+
+        Output in between messages is printed as-is, and never
+        parsed as a potential message.
+
+        This runs in a thread
+
+        """
+
+        decoder = framing.Decoder()
+        text = codecs.getincrementaldecoder("utf8")("replace")
+        fd = self.popen.stdout.fileno()
+
+        while True:
+            data = os.read(fd, 65536)
+
+            if not data:
+                break
+
+            for kind, chunk in decoder.feed(data):
+                if kind == framing.MESSAGE:
+                    self._receive_frame(chunk)
+
+                elif six.PY3:
+                    sys.stdout.write(text.decode(chunk))
+
+                else:
+                    sys.stdout.write(chunk)
+
+    def _listen_socket(self):
+        """Listen for messages over a local socket, see :mod:`sockets`
+
+        This runs in a thread
+
+        """
+
+        try:
+            connection = self._listener.accept(timeout=self.accept_timeout)
+        except socket.timeout as e:
+            sys.stdout.write("%s, stopping..\n" % e)
+            return self.stop()
+
+        with self._write_lock:
+            for data in self._backlog:
+                connection.send(data)
+
+            self._backlog[:] = []
+            self._connection = connection
+
+        for message in connection.messages():
+            self._receive_frame(message)
+
+    def _receive_frame(self, data):
+        """Handle serialised message `data`, a frame from the child"""
+        codec = serialization.detect(data)
+
+        try:
+            message = codec.loads(data)
+
+        except Exception as e:
+            # Unlike lines, a frame is always meant as a
+            # message, such that failing to decode it is
+            # likely a bug. It is reported and skipped.
+            sys.stdout.write("Could not decode message "
+                             "from child: %s\n" % e)
+
+        else:
+            self._receive(message, codec)
+
+    def _listen_output(self):
+        """Print output of the child, when messages are passed elsewhere
+
+        This runs in a thread
+
+        """
+
+        for line in iter(self.popen.stdout.readline, b""):
+            if six.PY3:
+                line = line.decode("utf8", "replace")
+
+            sys.stdout.write(line)
+
     def _start_pulse(self):
         """Send pulse to child process
 
@@ -338,14 +596,11 @@ class Server(object):
             start_time = time.time()
 
             while True:
-                data = json.dumps({"header": "pyblish-qml:server.pulse"})
-
-                if six.PY3:
-                    data = data.encode("ascii")
+                data = self.codec.dumps(
+                    {"header": "pyblish-qml:server.pulse"})
 
                 try:
-                    self.popen.stdin.write(data + b"\n")
-                    self.popen.stdin.flush()
+                    self.write(data)
                 except IOError:
                     break
 
@@ -1,10 +1,15 @@
 
 import os
 import sys
+import copy
 import time
 import getpass
 import logging
+import functools
+import threading
 import traceback
+import contextlib
+import collections
 
 import pyblish.api
 import pyblish.lib
@@ -19,15 +24,268 @@ def IdList(items):
     return pyblish.lib.ItemList("id", items)
 
 
+class IdIndex(object):
+    """Look up items of `items` by id, without scanning it each time
+
+    The position of each item is remembered and validated on
+    lookup, such that `items` may change in between lookups, e.g.
+    as plug-ins add instances to the Context.
+
+    Arguments:
+        items (list): Items with an `id`
+
+    """
+
+    def __init__(self, items):
+        self.items = items
+        self._positions = dict()
+
+    def __getitem__(self, id):
+        items = self.items
+        position = self._positions.get(id)
+
+        if (position is None or
+                position >= len(items) or
+                items[position].id != id):
+
+            # The first of any items sharing an id takes precedence
+            self._positions = dict(
+                (items[position].id, position)
+                for position in range(len(items) - 1, -1, -1)
+            )
+
+            position = self._positions.get(id)
+
+            if position is None:
+                raise KeyError("%s not in list" % id)
+
+        return items[position]
+
+
+# Data not set, see _fingerprint
+_missing = object()
+
+
+def _fingerprint(entity):
+    """Return what is sent of `entity`, cheaply compared to a later call
+
+    Lists and dicts of data are copied one level deep only, enough
+    to notice e.g. families appended to, without copying all of it.
+
+    """
+
+    data = entity.data
+    values = [data.get(key, _missing) for key in formatting.data_keys]
+    values.append(entity.name)
+
+    return [
+        copy.copy(value) if isinstance(value, (list, dict)) else value
+        for value in values
+    ]
+
+
+def formatted(formatter):
+    """Serialise what a call returns with `formatter`
+
+    The call remains available as-is as `unformatted`, such that the
+    server may call upon it in the host's main thread and serialise
+    its result in a thread of its own, see `Server.handle`.
+
+    Arguments:
+        formatter (callable): Passed what the call returns
+
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def decorated(*args, **kwargs):
+            return formatter(func(*args, **kwargs))
+
+        decorated.unformatted = func
+        decorated.formatter = formatter
+        return decorated
+
+    return decorator
+
+
+def threadsafe(func):
+    """Mark `func` as safe to call upon from any thread
+
+    Such calls only read data left alone by plug-ins, and are served
+    by the server in a thread of its own rather than via the dispatch
+    wrapper of the host, see `Server.handle`.
+
+    """
+
+    func.threadsafe = True
+    return func
+
+
+def cached(lookup):
+    """Serve a call from any thread via `lookup`, where it has the result
+
+    Unlike `threadsafe`, this applies only as long as the result is
+    at hand; otherwise the call is served via the dispatch wrapper of
+    the host, its formatting included, see `Server.handle`.
+
+    Arguments:
+        lookup (callable): Passed the service along with the arguments
+            of the call, returning the result or None where not cached
+
+    """
+
+    def decorator(func):
+        func.cached = lookup
+        return func
+
+    return decorator
+
+
+class StreamHandler(logging.Handler):
+    """Pass records to `stream` as they are emitted, in batches
+
+    Records are passed at most every `interval` seconds, those emitted
+    in between are held back until the interval has passed. Records
+    still held back as the handler is closed, once processing has
+    finished, are left to the result.
+
+    Records are captured as they are emitted, in the thread processing,
+    such that a timer passing them on later only ever handles plain data,
+    see :func:`formatting.capture_record`.
+
+    Arguments:
+        stream (callable): Passed a list of captured records
+        interval (float): Seconds in between calls to `stream`
+        level (int, optional): Minimum level of records streamed
+        limit (int, optional): Maximum number of records streamed
+
+    """
+
+    def __init__(self, stream, interval, level=logging.NOTSET, limit=None):
+        logging.Handler.__init__(self)
+        self.stream = stream
+        self.interval = interval
+        self.streamed = list()
+
+        self._level = level
+        self._limit = limit
+        self._pending = list()
+        self._last = 0
+        self._timer = None
+        self._closed = False
+
+    def emit(self, record):
+        # As captured by pyblish.plugin.process
+        if not record.name.startswith("pyblish"):
+            return
+
+        if record.levelno < self._level:
+            return
+
+        if (self._limit is not None and
+                len(self.streamed) + len(self._pending) >= self._limit):
+            return
+
+        self._pending.append((record, formatting.capture_record(record)))
+
+        remaining = self.interval - (time.time() - self._last)
+
+        if remaining <= 0:
+            return self.flush()
+
+        # Records may otherwise be held back for as long as
+        # no further records are emitted, e.g. during a long
+        # export following a record about to commence it.
+        if self._timer is None:
+            self._timer = threading.Timer(remaining, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush(self):
+        """Pass records held back to `stream`"""
+        self.acquire()
+
+        try:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+            if self._closed or not self._pending:
+                return
+
+            pending, self._pending = self._pending, list()
+            records = [record for record, captured in pending]
+
+            try:
+                self.stream([captured for record, captured in pending])
+            except Exception:
+                self.handleError(records[-1])
+            else:
+                self.streamed.extend(records)
+
+            self._last = time.time()
+
+        finally:
+            self.release()
+
+    def close(self):
+        """Stop streaming, leaving records held back to the result"""
+        self.acquire()
+
+        try:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+            self._closed = True
+
+        finally:
+            self.release()
+
+        logging.Handler.close(self)
+
+
+class CapturedFilter(logging.Filter):
+    """Pass records only whilst pyblish.plugin.process captures them
+
+    Such as to leave out e.g. the traceback it logs of a failed plug-in,
+    which is not part of its result.
+
+    """
+
+    def filter(self, record):
+        return any(isinstance(handler, pyblish.lib.MessageHandler)
+                   for handler in logging.getLogger().handlers)
+
+
 class Service(object):
     _count = 0
-    __instances = property(lambda self: IdList(self._context))
-    __plugins = property(lambda self: IdList(self._plugins))
+
+    # Callable passed records of the pair being processed, see `process`
+    stream = None
+
+    # Seconds in between streamed records
+    stream_interval = 0.2
+
+    __instances = property(lambda self: self._indexes["instances"])
+    __plugins = property(lambda self: self._indexes["plugins"])
 
     def __init__(self):
         self._context = None
         self._plugins = None
         self._provider = None
+        self._indexes = dict()
+
+        # Changes to the context are tracked by version
+        self._version = 0
+        self._reset_version = 0
+        self._snapshots = dict()  # id -> (fingerprint, added, changed)
+        self._removed = dict()  # id -> (added, removed)
+
+        # Records sent with each result, see set_record_filter
+        self._record_level = logging.NOTSET
+        self._record_limit = None
+        self._dropped = dict()  # (plugin id, instance id) -> records
 
         self.reset()
 
@@ -39,12 +297,14 @@ class Service(object):
 
         return test(**vars)
 
+    @threadsafe
     def ping(self):
         """Used to check connectivity"""
         return {
             "message": "Hello, whomever you are"
         }
 
+    @threadsafe
     def stats(self):
         """Return statistics about the API"""
         return {
@@ -55,6 +315,204 @@ class Service(object):
         self._context = pyblish.api.Context()
         self._plugins = pyblish.api.discover()
         self._provider = pyblish.plugin.Provider()
+        self._reset_indexes()
+        self._reset_tracking()
+        self._dropped.clear()
+
+        # Rediscovered plug-ins are new classes
+        formatting.clear_plugin_cache(keep=self._plugins)
+
+    def _reset_indexes(self):
+        """Look up instances and plug-ins by id, see :class:`IdIndex`"""
+        self._indexes["instances"] = IdIndex(self._context)
+        self._indexes["plugins"] = IdIndex(self._plugins)
+
+    def _reset_tracking(self):
+        """Forget about previous changes, as the context has been replaced"""
+        self._version += 1
+        self._reset_version = self._version
+        self._snapshots.clear()
+        self._removed.clear()
+
+    def _track(self):
+        """Compare the context with how it was when last tracked
+
+        Added and changed instances, along with the Context itself,
+        are marked with a new version, whereas removed instances are
+        remembered until the next reset.
+
+        """
+
+        version = self._version + 1
+        current = set()
+
+        for entity in [self._context] + list(self._context):
+            current.add(entity.id)
+
+            fingerprint = _fingerprint(entity)
+            previous = self._snapshots.get(entity.id)
+
+            if previous is None:
+                self._snapshots[entity.id] = (fingerprint, version, version)
+                self._version = version
+
+            elif previous[0] != fingerprint:
+                self._snapshots[entity.id] = (
+                    fingerprint, previous[1], version)
+                self._version = version
+
+        for id in set(self._snapshots) - current:
+            fingerprint, added, changed = self._snapshots.pop(id)
+            self._removed[id] = (added, version)
+            self._version = version
+
+    def set_record_filter(self, level=logging.NOTSET, limit=None):
+        """Limit the records sent with each result of this session
+
+        Records below `level` and beyond `limit` are left out of results,
+        which instead carry the number of records dropped per level.
+        Dropped records remain available via :func:`dropped_records`
+        until the next reset.
+
+        Arguments:
+            level (int, optional): Minimum level of records sent
+            limit (int, optional): Maximum number of records sent per
+                result, favouring those of a higher level. 0 or None
+                for no limit.
+
+        """
+
+        self._record_level = level or logging.NOTSET
+        self._record_limit = limit or None
+
+    @threadsafe
+    def dropped_records(self, plugin, instance=None):
+        """Return records dropped from the last result of a pair
+
+        Arguments:
+            plugin (str): Id of processed plug-in
+            instance (str, optional): Id of processed instance,
+                None for the Context
+
+        """
+
+        return formatting.format_records(
+            self._dropped.get((plugin, instance), []))
+
+    def _capture(self, result, streamed=()):
+        """Reduce records and error of `result` to plain data
+
+        This is called upon within the dispatch wrapper, e.g. in the
+        host's main thread, as both may refer to objects of the host.
+        Only what remains is formatted by the server, see `formatted`.
+
+        Arguments:
+            result (dict): Result of processing a pair
+            streamed (list, optional): Records of `result` already
+                passed to `stream`, see :func:`_filter_records`
+
+        """
+
+        self._filter_records(result, streamed)
+
+        if result["error"] is not None:
+            result["error"] = formatting.format_error(result["error"])
+
+        return result
+
+    def _filter_records(self, result, streamed=()):
+        """Drop records of `result` as per :func:`set_record_filter`
+
+        Records kept and dropped alike are captured as plain data,
+        see :func:`formatting.capture_record`.
+
+        Arguments:
+            result (dict): Result of processing a pair
+            streamed (list, optional): Records of `result` already
+                passed to `stream`, which are left out too
+
+        """
+
+        records = result["records"]
+        level, limit = self._record_level, self._record_limit
+
+        if streamed:
+            ids = set(id(record) for record in streamed)
+            records = [record for record in records if id(record) not in ids]
+
+            result["streamed"] = dict(collections.Counter(
+                record.levelname for record in streamed))
+
+            if limit is not None:
+                limit = max(0, limit - len(streamed))
+
+        kept = [record for record in records if record.levelno >= level]
+
+        if limit is not None and len(kept) > limit:
+            # Favour records of higher levels, in the order emitted
+            favoured = set(sorted(
+                range(len(kept)),
+                key=lambda index: (-kept[index].levelno, index))[:limit])
+            kept = [record for index, record in enumerate(kept)
+                    if index in favoured]
+
+        key = (result["plugin"].id,
+               result["instance"].id
+               if result["instance"] is not None else None)
+
+        result["records"] = [
+            formatting.capture_record(record) for record in kept]
+
+        if len(kept) == len(records):
+            self._dropped.pop(key, None)
+            return
+
+        ids = set(id(record) for record in kept)
+        dropped = [record for record in records if id(record) not in ids]
+
+        self._dropped[key] = [
+            formatting.capture_record(record) for record in dropped]
+        result["dropped"] = dict(collections.Counter(
+            record.levelname for record in dropped))
+
+    @contextlib.contextmanager
+    def _streaming(self, plugin, instance=None):
+        """Pass records to `stream` whilst processing a pair
+
+        Yields:
+            list: Records streamed so far
+
+        """
+
+        if self.stream is None:
+            yield []
+            return
+
+        reference = {
+            "plugin": {"id": plugin.id},
+            "instance": {"id": instance.id} if instance is not None else None,
+        }
+
+        def stream(records):
+            self.stream(dict(reference,
+                             records=formatting.format_records(records)))
+
+        handler = StreamHandler(stream,
+                                interval=self.stream_interval,
+                                level=self._record_level,
+                                limit=self._record_limit)
+        handler.addFilter(CapturedFilter())
+
+        logger = logging.getLogger()
+        logger.addHandler(handler)
+
+        try:
+            yield handler.streamed
+        finally:
+            logger.removeHandler(handler)
+
+            # Nothing is streamed once the result is formed
+            handler.close()
 
     def context(self):
         # Append additional metadata to context
@@ -70,14 +528,77 @@ class Service(object):
 
             self._context.data[key] = value
 
-        return formatting.format_context(self._context)
+        self._track()
 
+        context = formatting.format_context(self._context)
+        context["version"] = self._version
+        return context
+
+    def context_delta(self, since=None):
+        """Return changes to the context since version `since`
+
+        Arguments:
+            since (int, optional): Version as returned by a previous
+                call to :func:`context` or :func:`context_delta`.
+                If None, or older than the last reset, every instance
+                is considered added and `full` is True.
+
+        Returns:
+            dict: The current "version", whether the delta is "full",
+                "data" of the Context if changed along with "added" and
+                "changed" instances and ids of "removed" instances.
+
+        """
+
+        self._track()
+
+        full = since is None or since < self._reset_version
+        if full:
+            since = -1
+
+        snapshot = self._snapshots[self._context.id]
+
+        delta = {
+            "version": self._version,
+            "full": full,
+            "id": self._context.id,
+            "data": None,
+            "added": list(),
+            "changed": list(),
+            "removed": list(),
+        }
+
+        if snapshot[2] > since:
+            delta["data"] = formatting.format_data(self._context.data)
+
+        for instance in self._context:
+            fingerprint, added, changed = self._snapshots[instance.id]
+
+            if added > since:
+                delta["added"].append(formatting.format_instance(instance))
+
+            elif changed > since:
+                delta["changed"].append(formatting.format_instance(instance))
+
+        for id, (added, removed) in self._removed.items():
+            if added <= since < removed:
+                delta["removed"].append(id)
+
+        return delta
+
+    @cached(lambda self: formatting.format_plugins(self._plugins,
+                                                   cached_only=True))
+    @formatted(formatting.format_plugins)
     def discover(self):
-        return formatting.format_plugins(self._plugins)
+        return self._plugins
 
+    @formatted(formatting.format_result)
     def process(self, plugin, instance=None, action=None):
         """Given JSON objects from client, perform actual processing
 
+        Where a `stream` is set, records are passed to it whilst
+        processing and left out of the result, see :class:`StreamHandler`.
+
         Arguments:
             plugin (dict): JSON representation of plug-in to process
             instance (dict, optional): JSON representation of Instance to
@@ -86,29 +607,100 @@ class Service(object):
 
         """
 
-        plugin_obj = self.__plugins[plugin["id"]]
-        instance_obj = (self.__instances[instance["id"]]
-                        if instance is not None else None)
+        return self._process(
+            plugin["id"],
+            instance["id"] if instance is not None else None,
+            action)
+
+    @formatted(formatting.format_batch)
+    def process_batch(self, pairs, vars, since=None, duration=None):
+        """Process multiple pairs in order, in a single request
 
-        result = pyblish.plugin.process(
-            plugin=plugin_obj,
-            context=self._context,
-            instance=instance_obj,
-            action=action)
+        Processing stops at the first pair for which the registered
+        test fails, as it would had each pair been processed separately.
 
-        return formatting.format_result(result)
+        Arguments:
+            pairs (list): Ids of (plug-in, instance) pairs, where an
+                instance id of None represents the Context.
+            vars (dict): State passed to the test, e.g. "ordersWithError"
+            since (int, optional): Version of the context known to the
+                client, see :func:`context_delta`
+            duration (float, optional): Seconds after which no further
+                pairs are processed, leaving the remaining pairs to the
+                client. At least one pair is processed regardless.
+
+        Returns:
+            dict: "results" of each processed pair, in order, "vars" as
+                of the last test, the "stopped" message of a failed test
+                and the resulting changes to the "context".
 
+        """
+
+        test = pyblish.logic.registered_test()
+
+        # -> Support test, see #364
+        vars["ordersWithError"] = set(vars["ordersWithError"])
+
+        results = list()
+        stopped = None
+        started = time.time()
+
+        for plugin_id, instance_id in pairs:
+            if results and duration is not None and (
+                    time.time() - started >= duration):
+                break
+
+            plugin = self.__plugins[plugin_id]
+            vars["nextOrder"] = plugin.order
+
+            stopped = test(**vars) or None
+            if stopped:
+                break
+
+            result = self._process(plugin_id, instance_id or None)
+
+            if result["error"] is not None:
+                vars["ordersWithError"].add(plugin.order)
+
+            results.append(result)
+
+        vars["ordersWithError"] = list(vars["ordersWithError"])
+
+        return {
+            "results": results,
+            "vars": vars,
+            "stopped": stopped,
+            "context": self.context_delta(since),
+        }
+
+    @formatted(formatting.format_result)
     def repair(self, plugin, instance=None):
         plugin_obj = self.__plugins[plugin["id"]]
         instance_obj = (self.__instances[instance["id"]]
                         if instance is not None else None)
 
-        result = pyblish.plugin.repair(
-            plugin=plugin_obj,
-            context=self._context,
-            instance=instance_obj)
+        with self._streaming(plugin_obj, instance_obj) as streamed:
+            result = pyblish.plugin.repair(
+                plugin=plugin_obj,
+                context=self._context,
+                instance=instance_obj)
 
-        return formatting.format_result(result)
+        return self._capture(result, streamed)
+
+    def _process(self, plugin, instance=None, action=None):
+        """Process a pair by id, returning its result unformatted"""
+        plugin_obj = self.__plugins[plugin]
+        instance_obj = (self.__instances[instance]
+                        if instance is not None else None)
+
+        with self._streaming(plugin_obj, instance_obj) as streamed:
+            result = pyblish.plugin.process(
+                plugin=plugin_obj,
+                context=self._context,
+                instance=instance_obj,
+                action=action)
+
+        return self._capture(result, streamed)
 
     def _dispatch(self, method, params):
         """Customise exception handling"""
@@ -156,14 +748,22 @@ class MockService(Service):
         super(MockService, self).__init__(*args, **kwargs)
         self.delay = delay
 
+    @cached(lambda self: formatting.format_plugins(mocking.plugins,
+                                                   cached_only=True))
+    @formatted(formatting.format_plugins)
     def discover(self):
-        return formatting.format_plugins(mocking.plugins)
+        return mocking.plugins
 
     def reset(self):
         self._context = pyblish.api.Context()
         self._plugins = IdList(mocking.plugins)
         self._provider = pyblish.plugin.Provider()
+        self._reset_indexes()
+        self._reset_tracking()
+        self._dropped.clear()
+
+        formatting.clear_plugin_cache(keep=self._plugins)
 
-    def process(self, *args, **kwargs):
+    def _process(self, *args, **kwargs):
         time.sleep(self.delay)
-        return super(MockService, self).process(*args, **kwargs)
+        return super(MockService, self)._process(*args, **kwargs)
@@ -0,0 +1,217 @@
+"""Speak to the other process over a local socket
+
+An alternative to stdin and stdout, where messages are passed as
+frames over a Unix domain socket, or a TCP socket on the loopback
+interface where Unix domain sockets are unavailable. This leaves
+stdout free for plain output, e.g. from print().
+
+As any local process may connect to the loopback interface, the
+child first presents a random token, passed to it along with the
+address of the parent. Connections without it are turned away.
+
+ _______________          _____________
+|               |        |             |
+|   e.g. Maya   |        | pyblish-qml |
+|               |        |             |
+|      Listener o<-------o connect()   |
+|               |        |             |
+|    Connection o<------>o Connection  |
+|               |        |             |
+|  Popen.stdout <--------o stdout      |
+|_______________|        |_____________|
+
+"""
+
+import os
+import hmac
+import time
+import socket
+import shutil
+import binascii
+import tempfile
+import threading
+import collections
+
+from . import framing
+
+
+class Listener(object):
+    """Await a connection from the child process
+
+    Attributes:
+        address (str): Passed to the child, see :func:`connect`
+
+    """
+
+    def __init__(self):
+        self._path = None
+        self._token = binascii.hexlify(os.urandom(16)).decode("ascii")
+
+        if hasattr(socket, "AF_UNIX"):
+            self._path = os.path.join(
+                tempfile.mkdtemp(prefix="pyblish-qml-"), "ipc.sock")
+
+            self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self._socket.bind(self._path)
+            self.address = "unix:" + self._path
+
+        else:
+            self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self._socket.bind(("127.0.0.1", 0))
+            self.address = "tcp:127.0.0.1:%i" % self._socket.getsockname()[1]
+
+        self._socket.listen(1)
+
+        # The token is passed along with the address, see `connect`
+        self.address += "#" + self._token
+
+    def accept(self, timeout=None):
+        """Block until the child has connected
+
+        Only a single connection is ever accepted, after which the
+        listening socket is closed. Connections not presenting the
+        token of `address` are closed and further awaited.
+
+        Arguments:
+            timeout (float, optional): Seconds to await the child,
+                after which socket.timeout is raised
+
+        Returns:
+            Connection: Connection to the child process
+
+        """
+
+        deadline = None if timeout is None else time.time() + timeout
+
+        try:
+            while True:
+                if deadline is not None:
+                    remaining = deadline - time.time()
+
+                    if remaining <= 0:
+                        raise socket.timeout("Child did not connect "
+                                             "within %s seconds" % timeout)
+
+                    self._socket.settimeout(remaining)
+
+                connection, _ = self._socket.accept()
+                connection.settimeout(self._socket.gettimeout())
+                connection = Connection(connection)
+
+                if self._authenticate(connection):
+                    connection._socket.settimeout(None)
+                    return connection
+
+                connection.close()
+
+        finally:
+            self.close()
+
+    def _authenticate(self, connection):
+        """Return whether `connection` presented the token"""
+        token = connection.receive()
+        return token is not None and hmac.compare_digest(
+            token, self._token.encode("ascii"))
+
+    def close(self):
+        self._socket.close()
+
+        if self._path is not None:
+            shutil.rmtree(os.path.dirname(self._path), ignore_errors=True)
+            self._path = None
+
+
+def connect(address):
+    """Connect to the parent process at `address`
+
+    Arguments:
+        address (str): Address of a :class:`Listener`, along
+            with its token, e.g. "unix:/tmp/ipc.sock#token"
+
+    Returns:
+        Connection: Connection to the parent process
+
+    """
+
+    if "#" not in address:
+        raise ValueError("Missing token: %s" % address)
+
+    location, _, token = address.rpartition("#")
+    kind, _, location = location.partition(":")
+
+    if kind == "unix":
+        connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        connection.connect(location)
+
+    elif kind == "tcp":
+        host, port = location.rsplit(":", 1)
+        connection = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        connection.connect((host, int(port)))
+
+    else:
+        raise ValueError("Unsupported address: %s" % address)
+
+    connection = Connection(connection)
+    connection.send(token.encode("ascii"))
+
+    return connection
+
+
+class Connection(object):
+    """Pass messages as frames over a connected socket
+
+    Messages may be sent from any thread, and are
+    received by iterating over :func:`messages`.
+
+    """
+
+    def __init__(self, connection):
+        self._socket = connection
+        self._lock = threading.Lock()
+
+        # Messages received, but not yet returned by `receive`
+        self._decoder = framing.Decoder()
+        self._received = collections.deque()
+
+    def send(self, payload):
+        """Send serialised message `payload` in full"""
+        data = framing.encode(payload)
+
+        with self._lock:
+            self._socket.sendall(data)
+
+    def receive(self):
+        """Return the next serialised message, or None once closed"""
+        while not self._received:
+            try:
+                data = self._socket.recv(65536)
+            except socket.error:
+                return None
+
+            if not data:
+                return None
+
+            self._received.extend(
+                chunk for kind, chunk in self._decoder.feed(data)
+                if kind == framing.MESSAGE
+            )
+
+        return self._received.popleft()
+
+    def messages(self):
+        """Yield serialised messages until the socket is closed"""
+        while True:
+            message = self.receive()
+
+            if message is None:
+                break
+
+            yield message
+
+    def close(self):
+        try:
+            self._socket.shutdown(socket.SHUT_RDWR)
+        except socket.error:
+            pass
+
+        self._socket.close()
@@ -1,8 +1,13 @@
 import re
 import time
+import array
+import bisect
 import logging
+import operator
+import contextlib
 
 from . import util, settings
+from .ipc import serialization
 from .vendor import six
 from .vendor.Qt5 import QtCore
 
@@ -181,24 +186,175 @@ def Item(**kwargs):
     """
 
     parent = kwargs.pop("parent", None)
-    cls = type("Item", (AbstractItem,), kwargs.copy())
+    cls = _item_class(kwargs)
 
     self = cls(parent)
     self.json = kwargs  # Store as json
 
     for key, value in kwargs.items():
-        if hasattr(self, key):
+        if not key.startswith("__"):
             key = PropertyType.prefix + key
         setattr(self, key, value)
 
     return self
 
 
+def _item_class(kwargs):
+    """Return class of item with properties `kwargs`
+
+    Classes are generated once per distinct set of property
+    names and types, and shared by every item of that kind.
+
+    """
+
+    properties = dict(
+        (key, type(value) if value is not None else None)
+        for key, value in kwargs.items()
+
+        # Not converted into properties, see PropertyType
+        if not key.startswith("__")
+    )
+
+    signature = tuple(sorted(properties.items(), key=lambda item: item[0]))
+
+    try:
+        return _item_classes[signature]
+    except KeyError:
+        pass
+
+    cls = type("Item", (AbstractItem,), dict(
+        (key, kwargs[key]) for key in properties
+    ))
+
+    _item_classes[signature] = cls
+
+    return cls
+
+
+# Signature of properties -> Item class, see _item_class
+_item_classes = dict()
+
+
+class AbstractRow(tuple):
+    """Read-only model row
+
+    A lightweight alternative to :func:`Item` for rows that
+    never change once added, such as log records. Values are
+    stored in a plain tuple and accessed by name.
+
+    """
+
+    __slots__ = ()
+
+    # Names of values, in order
+    _fields = ()
+
+    @property
+    def json(self):
+        return dict(zip(self._fields, self))
+
+    def __str__(self):
+        return str(getattr(self, "name", ""))
+
+    def __repr__(self):
+        return "%s.%s(%r)" % (__name__, type(self).__name__, self.__str__())
+
+
+def Row(**kwargs):
+    """Factory function for read-only model rows
+
+    Usage:
+        >>> row = Row(name="default name",
+        ...           age=5)
+        >>> assert row.name == "default name"
+        >>> assert row.age == 5
+        >>>
+        >>> # Jsonifyable content
+        >>> assert row.json == {
+        ...     "name": "default name",
+        ...     "age": 5,
+        ...     }, row.json
+
+    """
+
+    cls = _row_class(kwargs)
+    return cls(kwargs[key] for key in cls._fields)
+
+
+def _row_class(kwargs):
+    """Return class of row with values `kwargs`
+
+    Like items, classes are generated once per distinct
+    set of names and shared by every row of that kind.
+
+    """
+
+    signature = tuple(sorted(kwargs))
+
+    try:
+        return _row_classes[signature]
+    except KeyError:
+        pass
+
+    attrs = {
+        "__slots__": (),
+        "_fields": signature,
+    }
+
+    for index, key in enumerate(signature):
+
+        # Not accessible by name, as with items
+        if key.startswith("__"):
+            continue
+
+        attrs[key] = property(operator.itemgetter(index))
+
+    cls = type("Row", (AbstractRow,), attrs)
+
+    _row_classes[signature] = cls
+
+    return cls
+
+
+# Names of values -> Row class, see _row_class
+_row_classes = dict()
+
+
 class AbstractModel(QtCore.QAbstractListModel):
     def __init__(self, parent=None):
         super(AbstractModel, self).__init__(parent)
         self.items = util.ItemList(key="id")
 
+        # Items changed during a batch, see `batch`
+        self._batch_depth = 0
+        self._changed = dict()
+
+    @contextlib.contextmanager
+    def batch(self):
+        """Emit dataChanged once for all items changed within
+
+        Rather than once per property of each item, dataChanged is
+        emitted once per contiguous range of changed rows as the
+        outermost batch is exited.
+
+        Usage:
+            >>> model = AbstractModel()
+            >>> with model.batch():
+            ...     for item in model.items:
+            ...         item.isProcessing = False
+
+        """
+
+        self._batch_depth += 1
+
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+
+            if not self._batch_depth:
+                self._emit_changed()
+
     @QtCore.Slot(int, result=QtCore.QObject)
     def item(self, index):
         return self.items[index]
@@ -224,6 +380,40 @@ class AbstractModel(QtCore.QAbstractListModel):
 
         return item
 
+    def add_items(self, items):
+        """Add many new items to model at once
+
+        All items are created prior to being inserted, with
+        a single notification for the whole range of rows.
+
+        Arguments:
+            items (list): Keyword arguments per item, see :func:`add_item`
+
+        Returns:
+            list: Added items
+
+        """
+
+        if not items:
+            return []
+
+        for item in items:
+            item["parent"] = self
+
+        items = [Item(**item) for item in items]
+
+        first = self.rowCount()
+        self.beginInsertRows(QtCore.QModelIndex(),
+                             first,
+                             first + len(items) - 1)
+        self.items.extend(items)
+        self.endInsertRows()
+
+        for item in items:
+            item.__datachanged__.connect(self._dataChanged)
+
+        return items
+
     def remove_item(self, item):
         """Remove item from model"""
         index = self.items.index(item)
@@ -232,11 +422,47 @@ class AbstractModel(QtCore.QAbstractListModel):
         self.endRemoveRows()
 
     def _dataChanged(self, item):
-        """Explicitly emit dataChanged upon item changing"""
+        """Explicitly emit dataChanged upon item changing
+
+        The row of `item` is looked up via the index
+        maintained by `items`, see :class:`util.ItemList`
+
+        """
+
+        if self._batch_depth:
+            self._changed[id(item)] = item
+            return
+
         index = self.items.index(item)
         qindex = self.createIndex(index, 0)
         self.dataChanged.emit(qindex, qindex)
 
+    def _emit_changed(self):
+        """Emit dataChanged per contiguous range of changed rows"""
+        rows = list()
+
+        for item in self._changed.values():
+            try:
+                rows.append(self.items.index(item))
+            except ValueError:
+                # Removed since it changed
+                continue
+
+        self._changed.clear()
+
+        rows.sort()
+        ranges = list()
+
+        for row in rows:
+            if ranges and row == ranges[-1][1] + 1:
+                ranges[-1][1] = row
+            else:
+                ranges.append([row, row])
+
+        for first, last in ranges:
+            self.dataChanged.emit(self.createIndex(first, 0),
+                                  self.createIndex(last, 0))
+
     def rowCount(self, parent=QtCore.QModelIndex()):
         return len(self.items)
 
@@ -280,7 +506,10 @@ class ItemModel(AbstractModel):
         super(ItemModel, self).__init__(*args, **kwargs)
         self.plugins = util.ItemList(key="id")
         self.instances = util.ItemList(key="id")
-        self.sections = util.ItemList(key="id")
+        self.sections = util.ItemList(key="name")
+
+        # Plug-ins per compatible instance, see `update_compatibility`
+        self._compatibility = None
 
     def instance_count(self):
         """Return the number of `instance` in model"""
@@ -321,6 +550,32 @@ class ItemModel(AbstractModel):
 
         """
 
+        return self.add_plugins([plugin])[0]
+
+    def add_plugins(self, plugins):
+        """Append many `plugins` to model at once
+
+        Arguments:
+            plugins (list): Serialised plug-ins, see :func:`add_plugin`
+
+        Returns:
+            list: Added items
+
+        """
+
+        items = [self._plugin_item(plugin) for plugin in plugins]
+
+        for item in items:
+            self.add_section(item["verb"])
+
+        items = self.add_items(items)
+        self.plugins.extend(items)
+        self._compatibility = None
+
+        return items
+
+    def _plugin_item(self, plugin):
+        """Return keyword arguments of item representing `plugin`"""
         item = {}
         item.update(defaults["common"])
         item.update(defaults["plugin"])
@@ -376,10 +631,7 @@ class ItemModel(AbstractModel):
             if action["on"] == "all":
                 item["actionsIconVisible"] = True
 
-        self.add_section(item["verb"])
-
-        item = self.add_item(item)
-        self.plugins.append(item)
+        return item
 
     @QtCore.Slot("QVariant")
     def add_instance(self, instance):
@@ -393,6 +645,32 @@ class ItemModel(AbstractModel):
 
         """
 
+        return self.add_instances([instance])[0]
+
+    def add_instances(self, instances):
+        """Append many `instances` to model at once
+
+        Arguments:
+            instances (list): Serialised instances, see :func:`add_instance`
+
+        Returns:
+            list: Added items
+
+        """
+
+        items = [self._instance_item(instance) for instance in instances]
+
+        for item in items:
+            self.add_section(item["category"])
+
+        items = self.add_items(items)
+        self.instances.extend(items)
+        self._compatibility = None
+
+        return items
+
+    def _instance_item(self, instance):
+        """Return keyword arguments of item representing `instance`"""
         assert isinstance(instance, dict)
 
         item = defaults["common"].copy()
@@ -406,20 +684,18 @@ class ItemModel(AbstractModel):
         item["hasCompatible"] = True
         item["category"] = item["category"] or item["family"]
 
-        self.add_section(item["category"])
-
         # Visualised in Perspective
         families = [instance["data"]["family"]]
         families.extend(instance["data"].get("families", []))
         item["familiesConcatenated"] += ", ".join(families)
 
-        item = self.add_item(item)
-        self.instances.append(item)
+        return item
 
     def remove_instance(self, item):
         """Remove `instance` from model"""
         self.instances.remove(item)
         self.remove_item(item)
+        self._compatibility = None
 
     def add_section(self, name):
         """Append `section` to model
@@ -431,9 +707,9 @@ class ItemModel(AbstractModel):
         assert isinstance(name, str)
 
         # Skip existing sections
-        for section in self.sections:
-            if section.name == name:
-                return section
+        section = self.sections.get(name)
+        if section is not None:
+            return section
 
         item = defaults["common"].copy()
         item["name"] = name
@@ -472,6 +748,7 @@ class ItemModel(AbstractModel):
 
         item = self.add_item(item)
         self.instances.append(item)
+        self._compatibility = None
 
     def update_with_result(self, result):
         """Update item-model with result from host
@@ -487,83 +764,90 @@ class ItemModel(AbstractModel):
 
         assert isinstance(result, dict), "%s is not a dictionary" % result
 
-        for type in ("instance", "plugin"):
-            id = (result[type] or {}).get("id")
-
-            is_context = not id
-            if is_context:
-                item = self.instances[0]
-            else:
-                item = self.items.get(id)
-
-            if item is None:
-                # If an item isn't there yet
-                # no worries. It's probably because
-                # reset is still running and the
-                # item in question is a new instance
-                # not yet added to the model.
-                continue
-
-            item.isProcessing = False
-            item.currentProgress = 1
-            item.processed = True
-            item.hasWarning = item.hasWarning or any([
-                record["levelno"] == logging.WARNING
-                for record in result["records"]
-            ])
-
-            if result.get("error"):
-                item.hasError = True
-                item.amountFailed += 1
+        with self.batch():
+            for type in ("instance", "plugin"):
+                id = (result[type] or {}).get("id")
+
+                is_context = not id
+                if is_context:
+                    item = self.instances[0]
+                else:
+                    item = self.items.get(id)
+
+                if item is None:
+                    # If an item isn't there yet
+                    # no worries. It's probably because
+                    # reset is still running and the
+                    # item in question is a new instance
+                    # not yet added to the model.
+                    continue
+
+                item.isProcessing = False
+                item.currentProgress = 1
+                item.processed = True
+                item.hasWarning = item.hasWarning or any([
+                    record["levelno"] == logging.WARNING
+                    for record in result["records"]
+                ]) or any(
+                    "WARNING" in (result.get(key) or {})
+                    for key in ("streamed", "dropped")
+                )
+
+                if result.get("error"):
+                    item.hasError = True
+                    item.amountFailed += 1
+
+                else:
+                    item.succeeded = True
+                    item.amountPassed += 1
+
+                item.duration += result["duration"]
+                item.finishedAt = time.time()
+
+                if item.itemType == "plugin" and not item.actionsIconVisible:
+
+                    actions = list(item.actions)
+
+                    # Context specific actions
+                    for action in list(actions):
+                        if action["on"] == "failed" and not item.hasError:
+                            actions.remove(action)
+                        if action["on"] == "warning" and not item.hasWarning:
+                            actions.remove(action)
+                        if action["on"] == "failedOrWarning" and not (item.hasError or item.hasWarning):
+                            actions.remove(action)
+                        if action["on"] == "succeeded" and not item.succeeded:
+                            actions.remove(action)
+                        if action["on"] == "processed" and not item.processed:
+                            actions.remove(action)
 
-            else:
-                item.succeeded = True
-                item.amountPassed += 1
-
-            item.duration += result["duration"]
-            item.finishedAt = time.time()
-
-            if item.itemType == "plugin" and not item.actionsIconVisible:
-
-                actions = list(item.actions)
-
-                # Context specific actions
-                for action in list(actions):
-                    if action["on"] == "failed" and not item.hasError:
-                        actions.remove(action)
-                    if action["on"] == "warning" and not item.hasWarning:
-                        actions.remove(action)
-                    if action["on"] == "failedOrWarning" and not (item.hasError or item.hasWarning):
-                        actions.remove(action)
-                    if action["on"] == "succeeded" and not item.succeeded:
-                        actions.remove(action)
-                    if action["on"] == "processed" and not item.processed:
-                        actions.remove(action)
-
-                if any(action["__type__"] == "action" for action in actions):
                     # Consider only Actions, ignore Categories
-                    item.actionsIconVisible = True
-
-            # Update section item
-            class DummySection(object):
-                hasWarning = False
-                hasError = False
-                succeeded = False
-
-            section_item = DummySection()
-            for section in self.sections:
-                if item.itemType == "plugin" and section.name == item.verb:
-                    section_item = section
-                if (item.itemType == "instance" and
-                        section.name == item.category):
-                    section_item = section
-
-            section_item.hasWarning = (
-                section_item.hasWarning or item.hasWarning
-            )
-            section_item.hasError = section_item.hasError or item.hasError
-            section_item.succeeded = section_item.succeeded or item.succeeded
-            section_item.isProcessing = False
+                    if any(action["__type__"] == "action"
+                           for action in actions):
+                        item.actionsIconVisible = True
+
+                # Update section item
+                class DummySection(object):
+                    hasWarning = False
+                    hasError = False
+                    succeeded = False
+
+                section_item = DummySection()
+                for section in self.sections:
+                    if item.itemType == "plugin" and section.name == item.verb:
+                        section_item = section
+                    if (item.itemType == "instance" and
+                            section.name == item.category):
+                        section_item = section
+
+                section_item.hasWarning = (
+                    section_item.hasWarning or item.hasWarning
+                )
+                section_item.hasError = section_item.hasError or item.hasError
+                section_item.succeeded = (
+                    section_item.succeeded or item.succeeded
+                )
+                section_item.isProcessing = False
 
     def has_failed_validator(self):
         for validator in self.plugins:
@@ -575,49 +859,367 @@ class ItemModel(AbstractModel):
 
     def reset_status(self):
         """Reset progress bars"""
-        for item in self.items:
-            item.isProcessing = False
-            item.currentProgress = 0
+        with self.batch():
+            for item in self.items:
+                item.isProcessing = False
+                item.currentProgress = 0
 
-    def update_compatibility(self):
-        for plugin in self.plugins:
-            has_compatible = False
+    def update_compatibility(self, instance=None):
+        """Update whether each plug-in has a toggled instance to process
 
-            # A special clause for plug-ins only compatible
-            # with the Context itself.
-            if "Context" in plugin.compatibleInstances:
-                has_compatible = True
+        Plug-ins are related to their compatible instances as this is
+        first called, such that when called again following a toggle
+        of `instance`, only plug-ins compatible with it are updated.
 
-            else:
-                for instance in self.instances:
-                    if not instance.isToggled:
-                        continue
+        Arguments:
+            instance (Item, optional): Instance toggled since last called,
+                or None to update every plug-in, e.g. having changed
+                which instances are compatible with plug-ins.
+
+        """
+
+        if instance is None or self._compatibility is None:
+            return self._relate_compatibility()
+
+        plugins, counts, toggled = self._compatibility
+
+        if instance.id not in toggled:
+            return self._relate_compatibility()
+
+        if toggled[instance.id] == instance.isToggled:
+            return
+
+        toggled[instance.id] = instance.isToggled
+        difference = 1 if instance.isToggled else -1
+
+        with self.batch():
+            for plugin in plugins.get(instance.id, []):
+                count = counts[plugin] = counts[plugin] + difference
+
+                # Only as the first or last compatible instance is toggled
+                if count == 0 or (count == 1 and difference > 0):
+                    plugin.hasCompatible = count > 0
+
+    def _relate_compatibility(self):
+        """Relate plug-ins to compatible instances, see `update_compatibility`
+
+        Each plug-in is given a count of its compatible instances
+        currently toggled, and is compatible whilst above zero.
+
+        """
+
+        plugins = dict()
+        counts = dict()
+        toggled = dict()
+
+        for instance in self.instances:
+            toggled.setdefault(instance.id, instance.isToggled)
+
+        with self.batch():
+            for plugin in self.plugins:
+                count = 0
+
+                for id in set(plugin.compatibleInstances):
+                    plugins.setdefault(id, list()).append(plugin)
+                    count += 1 if toggled.get(id) else 0
 
-                    if instance.id in plugin.compatibleInstances:
-                        has_compatible = True
-                        break
+                # A special clause for plug-ins only compatible
+                # with the Context itself.
+                if "Context" in plugin.compatibleInstances:
+                    count = float("inf")
 
-            plugin.hasCompatible = has_compatible
+                counts[plugin] = count
+                plugin.hasCompatible = count > 0
+
+        self._compatibility = (plugins, counts, toggled)
 
     def reset(self):
         self.instances[:] = []
         self.plugins[:] = []
         self.sections[:] = []
+        self._compatibility = None
         super(ItemModel, self).reset()
 
 
 class ResultModel(AbstractModel):
+    """Results of processing, one row per message
+
+    Results never change once added, and are stored as
+    read-only :func:`Row` rather than :func:`Item`. Views
+    access them per role, or all at once via "object".
+
+    Only the most recent results are held in memory, as many
+    as settings.ResultLimit, with older results written to
+    disk and read back as views access them.
+
+    Rows are indexed by value of the roles in `indexed`, such
+    that proxies may look rows up rather than scan every row,
+    see :func:`lookup`, and by words of their "filter", see
+    :func:`search`. Rows are held by position in arrays, and
+    words only found in rows written to disk are forgotten,
+    such that indexes too remain bounded in memory.
+
+    """
 
     added = QtCore.Signal()
 
+    # Roles by which results are told apart, see ResultProxyModel
+    indexed = ("type", "levelname", "plugin", "instance")
+
+    def __init__(self, *args, **kwargs):
+        super(ResultModel, self).__init__(*args, **kwargs)
+        self.items = self._rows()
+        self._indexes = dict((role, dict()) for role in self.indexed)
+
+        # Rows by lowercase word of their "filter", see `search`
+        self._words = dict()
+        self._unsearchable = array.array("l")
+
+        # Rows of words since forgotten, see `_forget_words`
+        self._forgotten = list()
+        self._forgotten_until = 0
+
+        # Pairs of which records are streamed, see `update_with_stream`
+        self._streaming = None
+        self._streamed = set()
+
+        # Exposed as roles of their own, following "item" and "object"
+        self.roles = sorted(defaults["result"]) + ["levelname", "levelno"]
+
+    @QtCore.Slot(int, result="QVariant")
+    def item(self, index):
+        return self.items[index].json
+
     def add_item(self, item):
-        item_ = defaults["result"].copy()
-        item_.update(item)
+        return self.add_items([item])[0]
+
+    def add_items(self, items):
+        """Add many new results to model at once
 
+        Arguments:
+            items (list): Dictionaries of values per result
+
+        Returns:
+            list: Added rows
+
+        """
+
+        if not items:
+            return []
+
+        rows = list()
+        for item in items:
+            row = defaults["result"].copy()
+            row.update(item)
+            rows.append(Row(**row))
+
+        first = self.rowCount()
+
+        for role, index in list(self._indexes.items()):
+            try:
+                for position, row in enumerate(rows, first):
+                    value = getattr(row, role, None)
+                    positions = index.get(value)
+
+                    if positions is None:
+                        positions = index[value] = array.array("l")
+
+                    positions.append(position)
+
+            except TypeError:
+                # Unhashable values are looked up by scanning
+                self._indexes.pop(role)
+
+        for position, row in enumerate(rows, first):
+            text = getattr(row, "filter", None)
+
+            if text is None:
+                self._unsearchable.append(position)
+                continue
+
+            for word in set(_words(text)):
+                positions = self._words.get(word)
+
+                # Many words occur once, e.g. numbers
+                if positions is None:
+                    self._words[word] = position
+                elif isinstance(positions, int):
+                    self._words[word] = array.array("l", [positions, position])
+                else:
+                    positions.append(position)
+
+        self.beginInsertRows(QtCore.QModelIndex(),
+                             first,
+                             first + len(rows) - 1)
+        self.items.extend(rows)
+        self.endInsertRows()
+
+        if self.items.spilled > self._forgotten_until:
+            self._forget_words()
+
+        self.added.emit()
+
+        return rows
+
+    def _forget_words(self):
+        """Forget words found only in rows written to disk
+
+        Unlike values of roles, most words are few and far between,
+        e.g. numbers. Rows of words forgotten are remembered on their
+        own, and searched by their "filter" as a whole.
+
+        """
+
+        spilled = self.items.spilled
+        forgotten = set()
+
+        for word, positions in list(self._words.items()):
+            if isinstance(positions, int):
+                if positions < spilled:
+                    forgotten.add(positions)
+                    del self._words[word]
+
+            elif positions[-1] < spilled:
+                forgotten.update(positions)
+                del self._words[word]
+
+        if forgotten:
+            self._forgotten.append(array.array("l", sorted(forgotten)))
+
+        self._forgotten_until = spilled
+
+    def lookup(self, role, value, first=0):
+        """Return rows whose `role` equals `value`
+
+        Arguments:
+            role (str): Name of role, one of `indexed`
+            value (object): Value of role
+            first (int, optional): Return only this row and those after
+
+        Returns:
+            array: Rows, in ascending order
+
+        Raises:
+            KeyError: If rows are not indexed by `role`
+
+        """
+
+        rows = self._indexes[role].get(value, array.array("l"))
+
+        if first:
+            rows = rows[bisect.bisect_left(rows, first):]
+
+        return rows
+
+    def search(self, text, first=0):
+        """Return rows whose "filter" contains `text`, ignoring case
+
+        Rows are looked up by the words of `text`, and only those
+        containing every word compared against `text` as a whole,
+        along with rows of words since forgotten.
+
+        Arguments:
+            text (str): Text to search for
+            first (int, optional): Return only this row and those after
+
+        Returns:
+            list: Rows in ascending order, or None if `text`
+                has no words to look up rows by.
+
+        """
+
+        text = six.text_type(text).lower()
+        words = _words(text)
+
+        if not words:
+            return None
+
+        rows = None
+
+        for word in set(words):
+            found = set()
+
+            # Words of rows containing this word, e.g. "valid" of "invalid"
+            for key, positions in self._words.items():
+                if word not in key:
+                    continue
+
+                if isinstance(positions, int):
+                    if positions >= first:
+                        found.add(positions)
+                else:
+                    found.update(
+                        positions[bisect.bisect_left(positions, first):])
+
+            if rows is None:
+                rows = found
+            else:
+                rows &= found
+
+        def contains(row):
+            return text in six.text_type(self.items[row].filter).lower()
+
+        # Whole words of `text` are found as they are
+        if words != [text]:
+            rows = set(row for row in rows if contains(row))
+
+        # Rows of words forgotten may contain `text` too
+        forgotten = set()
+        for positions in self._forgotten:
+            forgotten.update(positions[bisect.bisect_left(positions, first):])
+
+        rows.update(row for row in forgotten - rows if contains(row))
+
+        return sorted(rows)
+
+    def unsearchable(self, first=0):
+        """Return rows without a "filter", never found by `search`"""
+        rows = self._unsearchable
+        return rows[bisect.bisect_left(rows, first):]
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
         try:
-            return super(ResultModel, self).add_item(item_)
-        finally:
-            self.added.emit()
+            row = self.items[index.row()]
+        except IndexError:
+            return "QVariant"
+
+        if role in (QtCore.Qt.UserRole + 0, QtCore.Qt.UserRole + 1):
+            return row.json
+
+        offset = role - (QtCore.Qt.UserRole + 2)
+
+        if not 0 <= offset < len(self.roles):
+            return "QVariant"
+
+        return getattr(row, self.roles[offset], None)
+
+    def roleNames(self):
+        roles = super(ResultModel, self).roleNames()
+
+        for index, key in enumerate(self.roles):
+            roles[QtCore.Qt.UserRole + 2 + index] = key.encode("ascii")
+
+        return roles
+
+    def reset(self):
+        self.beginResetModel()
+        self.items.close()
+        self.items = self._rows()
+        self._indexes = dict((role, dict()) for role in self.indexed)
+        self._words = dict()
+        self._unsearchable = array.array("l")
+        self._forgotten = list()
+        self._forgotten_until = 0
+        self._streaming = None
+        self._streamed = set()
+        self.endResetModel()
+
+    def _rows(self):
+        return util.SpillList(
+            limit=settings.ResultLimit,
+            dumps=lambda row: serialization.JSON.dumps(row.json),
+            loads=lambda data: Row(**serialization.JSON.loads(data)),
+        )
 
     def add_context(self, context):
         item = defaults["result"].copy()
@@ -629,33 +1231,82 @@ class ResultModel(AbstractModel):
         })
         self.add_item(item)
 
-    def update_with_result(self, result):
-        parsed = self.parse_result(result)
+    def update_with_result(self, result, items=None):
+        parsed = self.parse_result(result, items)
 
         error = parsed.get("error")
-        plugin = parsed.get("plugin")
-        instance = parsed.get("instance")
         records = parsed.get("records")
 
+        reference = _reference(result)
+        streamed = reference in self._streamed
+        self._streamed.discard(reference)
+
+        items = list(records)
+
+        if error is not None:
+            items.append(error)
+
+        # Records streamed already follow the plug-in and instance,
+        # unless those of another pair were streamed since
+        if self._streaming != reference and (items or not streamed):
+            items[:0] = self._headings(parsed)
+
+        # Whatever follows is preceded by headings of its own
+        if items or self._streaming == reference:
+            self._streaming = None
+
+        self.add_items(items)
+
+    def update_with_stream(self, stream, items=None):
+        """Append records of a pair still being processed
+
+        Arguments:
+            stream (dict): References to plug-in and instance along
+                with records, as passed by the host during `process`
+            items (ItemList, optional): Plug-ins and instances by id
+
+        """
+
+        parsed = self.parse_result(
+            dict(stream, duration=0, error=None), items)
+
+        reference = _reference(stream)
+        rows = list()
+
+        if self._streaming != reference:
+            self._streaming = reference
+            rows.extend(self._headings(parsed))
+
+        self._streamed.add(reference)
+
+        rows.extend(parsed["records"])
+        self.add_items(rows)
+
+    def _headings(self, parsed):
+        """Return rows preceding the records of a pair"""
+        rows = list()
+        plugin = parsed["plugin"]
+
         if getattr(self, "_last_plugin", None) != plugin["plugin"]:
             self._last_plugin = plugin["plugin"]
-            self.add_item(plugin)
+            rows.append(plugin)
 
-        self.add_item(instance)
+        rows.append(parsed["instance"])
 
-        for record in records:
-            self.add_item(record)
+        return rows
 
-        if error is not None:
-            self.add_item(error)
+    def parse_result(self, result, items=None):
+        """Return rows of `result`, by type
 
-    def parse_result(self, result):
-        plugin_name = result["plugin"]["name"]
+        Arguments:
+            result (dict): Dictionary following the Result schema
+            items (ItemList, optional): Plug-ins and instances by id,
+                by which the plug-in and instance of `result` are named
 
-        try:
-            instance_name = result["instance"]["name"]
-        except Exception:
-            instance_name = None
+        """
+
+        plugin_name = _resolve_name(result["plugin"], items)
+        instance_name = _resolve_name(result["instance"], items)
 
         plugin_msg = {
             "type": "plugin",
@@ -688,6 +1339,27 @@ class ResultModel(AbstractModel):
 
             record_msgs.append(record)
 
+        # Records left out by the host, see Service.set_record_filter
+        dropped = result.get("dropped")
+
+        if dropped:
+            message = "%i records left out (%s)" % (
+                sum(dropped.values()),
+                ", ".join("%s: %i" % (level, dropped[level])
+                          for level in sorted(dropped)))
+
+            record_msgs.append({
+                "type": "message",
+                "message": message,
+                "filter": message,
+
+                "plugin": plugin_name,
+                "instance": instance_name,
+
+                # Fetched on demand, see Controller.showDropped
+                "dropped": list(_reference(result)),
+            })
+
         error_msg = {
             "type": "error",
             "message": "No error",
@@ -718,7 +1390,191 @@ class ResultModel(AbstractModel):
         }
 
 
-class ProxyModel(QtCore.QSortFilterProxyModel):
+def _reference(result):
+    """Return ids of plug-in and instance of `result`"""
+    return (result["plugin"]["id"], (result["instance"] or {}).get("id"))
+
+
+def _resolve_name(reference, items):
+    """Return name of item referenced by id, None for the Context"""
+    if reference is None:
+        return None
+
+    try:
+        return items[reference["id"]].name
+    except (KeyError, TypeError):
+        return reference.get("name", reference["id"])
+
+
+class AbstractFilter(object):
+    """Exclude and include rules, shared by proxy models
+
+    Rules are compiled into a single predicate of an item, and
+    the proxy filtered anew via `invalidate` as rules change.
+
+    """
+
+    def _init_rules(self, excludes, includes):
+        self.excludes = excludes or dict()
+        self.includes = includes or dict()
+
+        # Rules compiled into a predicate of an item, see `_compile`
+        self._rules = self._freeze()
+        self._predicate = self._compile()
+
+    def _add_rule(self, group, role, value):
+        """Implementation detail"""
+        if role not in group:
+            group[role] = list()
+
+        group[role].append(value)
+
+        self._rules_changed()
+
+    def _remove_rule(self, group, role, value=None):
+        """Implementation detail"""
+        if role not in group:
+            return
+
+        if value is None:
+            group.pop(role, None)
+        else:
+            group[role].remove(value)
+
+        self._rules_changed()
+
+    def _set_rules(self, group, rules):
+        """Implementation detail"""
+        group.clear()
+
+        for role, value in rules:
+            group.setdefault(role, list()).append(value)
+
+        self._rules_changed()
+
+    def _clear_group(self, group):
+        group.clear()
+
+        self._rules_changed()
+
+    def _rules_changed(self):
+        """Filter anew, unless rules remain effectively the same
+
+        E.g. adding an exclusion already present, or clearing
+        rules only to add the same rules again.
+
+        """
+
+        rules = self._freeze()
+
+        if rules is not None and rules == self._rules:
+            return
+
+        self._rules = rules
+        self._predicate = self._compile()
+        self.invalidate()
+
+    def _freeze(self):
+        """Return rules in a comparable form, or None if unhashable"""
+        try:
+            return tuple(
+                frozenset((role, frozenset(values))
+                          for role, values in group.items())
+                for group in (self.includes, self.excludes)
+            )
+        except TypeError:
+            return None
+
+    def _compile(self):
+        """Return rules as a single predicate of an item
+
+        Rules are tested in turn, such that an item is rejected
+        as soon as it fails one, each against a set of values.
+        Roles given as integers are looked up by name up front,
+        see :func:`_role_name`.
+
+        """
+
+        includes = list()
+        excludes = list()
+
+        for rules, group in ((includes, self.includes),
+                             (excludes, self.excludes)):
+            for role, values in group.items():
+                try:
+                    values = frozenset(values)
+                except TypeError:
+                    values = list(values)
+
+                name = self._role_name(role)
+
+                if name is not None:
+                    rules.append((name, values))
+
+                # Items hold no data of roles unknown to the source
+                elif (None in values) is not (rules is includes):
+                    return lambda item: False
+
+        def compare(item):
+            # Unhashable data is never among hashable values
+            for rules, included in ((includes, True), (excludes, False)):
+                for name, values in rules:
+                    try:
+                        contained = getattr(item, name, None) in values
+                    except TypeError:
+                        contained = False
+
+                    if contained is not included:
+                        return False
+
+            return True
+
+        def predicate(item):
+            try:
+                for name, values in includes:
+                    if getattr(item, name, None) not in values:
+                        return False
+
+                for name, values in excludes:
+                    if getattr(item, name, None) in values:
+                        return False
+
+            except TypeError:
+                return compare(item)
+
+            return True
+
+        return predicate
+
+    def _role_name(self, role):
+        """Return name of attribute holding `role` of items
+
+        Arguments:
+            role (int, str): Qt role, or name of role
+
+        Returns:
+            str: Name of role, or None if unknown to the source model
+
+        """
+
+        if isinstance(role, six.string_types):
+            return role
+
+        source = self.sourceModel()
+        name = source.roleNames().get(role) if source is not None else None
+
+        if name is None:
+            return None
+
+        return six.ensure_str(bytes(name), "ascii")
+
+
+def _words(text):
+    """Return lowercase words of `text`, as looked up by ResultModel"""
+    return re.findall(r"\w+", six.text_type(text).lower(), re.UNICODE)
+
+
+class ProxyModel(AbstractFilter, QtCore.QSortFilterProxyModel):
     """A QSortFilterProxyModel with custom exclude and include rules
 
     Role may be either an integer or string, and each
@@ -741,13 +1597,20 @@ class ProxyModel(QtCore.QSortFilterProxyModel):
 
     def __init__(self, source, excludes=None, includes=None, parent=None):
         super(ProxyModel, self).__init__(parent)
-        self.setSourceModel(source)
+        self._init_rules(excludes, includes)
 
-        self.excludes = excludes or dict()
-        self.includes = includes or dict()
+        # Filter expression, fetched once per change, see `_filter_changed`
+        self._regex = None
 
+        self.setSourceModel(source)
         self.setFilterCaseSensitivity(QtCore.Qt.CaseInsensitive)
 
+    def setSourceModel(self, source):
+        super(ProxyModel, self).setSourceModel(source)
+
+        # Integer roles are named by the source, see `_role_name`
+        self._predicate = self._compile()
+
     @QtCore.Slot(int, result=QtCore.QObject)
     def item(self, index):
         index = self.index(index, 0, QtCore.QModelIndex())
@@ -787,6 +1650,7 @@ class ProxyModel(QtCore.QSortFilterProxyModel):
 
         self._remove_rule(self.excludes, role, value)
 
+    @QtCore.Slot("QVariantList")
     def set_exclusion(self, rules):
         """Set excludes
 
@@ -820,6 +1684,7 @@ class ProxyModel(QtCore.QSortFilterProxyModel):
         """Remove exclusion rule"""
         self._remove_rule(self.includes, role, value)
 
+    @QtCore.Slot("QVariantList")
     def set_inclusion(self, rules):
         self._set_rules(self.includes, rules)
 
@@ -827,64 +1692,50 @@ class ProxyModel(QtCore.QSortFilterProxyModel):
     def clear_inclusion(self):
         self._clear_group(self.includes)
 
-    def _add_rule(self, group, role, value):
-        """Implementation detail"""
-        if role not in group:
-            group[role] = list()
-
-        group[role].append(value)
-
-        self.invalidate()
-
-    def _remove_rule(self, group, role, value=None):
-        """Implementation detail"""
-        if role not in group:
-            return
+    def _filter_changed(self):
+        """Fetch the filter expression anew, as rows are next filtered"""
+        self._regex = None
 
-        if value is None:
-            group.pop(role, None)
-        else:
-            group[role].remove(value)
-
-        self.invalidate()
-
-    def _set_rules(self, group, rules):
-        """Implementation detail"""
-        group.clear()
+    # Overridden methods
 
-        for rule in rules:
-            self._add_rule(group, *rule)
+    @QtCore.Slot(str)
+    def setFilterFixedString(self, pattern):
+        self._filter_changed()
+        super(ProxyModel, self).setFilterFixedString(pattern)
 
-        self.invalidate()
+    def setFilterRegExp(self, *args):
+        self._filter_changed()
+        super(ProxyModel, self).setFilterRegExp(*args)
 
-    def _clear_group(self, group):
-        group.clear()
-
-        self.invalidate()
+    def setFilterWildcard(self, pattern):
+        self._filter_changed()
+        super(ProxyModel, self).setFilterWildcard(pattern)
 
-    # Overridden methods
+    def setFilterCaseSensitivity(self, sensitivity):
+        self._filter_changed()
+        super(ProxyModel, self).setFilterCaseSensitivity(sensitivity)
 
     def filterAcceptsRow(self, source_row, source_parent):
         """Exclude items in `self.excludes`"""
         model = self.sourceModel()
         item = model.items[source_row]
 
-        key = getattr(item, "filter", None)
-        if key is not None:
+        regex = self._regex
+        if regex is None:
             regex = self.filterRegExp()
-            if regex.pattern():
+            regex = self._regex = regex if regex.pattern() else False
+
+        if regex is not False:
+            key = getattr(item, "filter", None)
+            if key is not None:
                 match = regex.indexIn(key)
                 return False if match == -1 else True
 
-        for role, values in self.includes.items():
-            data = getattr(item, role, None)
-            if data not in values:
-                return False
+        if not self._predicate(item):
+            return False
 
-        for role, values in self.excludes.items():
-            data = getattr(item, role, None)
-            if data in values:
-                return False
+        if regex is False:
+            return True
 
         return super(ProxyModel, self).filterAcceptsRow(
             source_row, source_parent)
@@ -892,3 +1743,200 @@ class ProxyModel(QtCore.QSortFilterProxyModel):
     @QtCore.Slot(result=int)
     def rowCount(self, parent=QtCore.QModelIndex()):
         return super(ProxyModel, self).rowCount(parent)
+
+
+class ResultProxyModel(AbstractFilter, QtCore.QAbstractListModel):
+    """A proxy of a ResultModel, with the rules of a ProxyModel
+
+    Rather than filter every row anew, rows are looked up by value
+    of the roles indexed by the ResultModel, and only rows remaining
+    are filtered by any rules involving other roles.
+
+    Filtering by fixed string, as with ProxyModel, takes
+    precedence over rules for results with a "filter" role.
+    Results are looked up by words of the string, see
+    :func:`ResultModel.search`.
+
+    """
+
+    # Milliseconds to wait for typing to pause, see `search`
+    search_delay = 150
+
+    def __init__(self, source, excludes=None, includes=None, parent=None):
+        super(ResultProxyModel, self).__init__(parent)
+
+        self._source = source
+        self._pattern = ""
+
+        self._init_rules(excludes, includes)
+
+        # Rows of source, in ascending order
+        self._rows = array.array("l", self._filter(0, source.rowCount()))
+
+        source.rowsInserted.connect(self._on_rows_inserted)
+        source.modelAboutToBeReset.connect(self.beginResetModel)
+        source.modelReset.connect(self._on_model_reset)
+
+    def sourceModel(self):
+        return self._source
+
+    @QtCore.Slot(int, result="QVariant")
+    def item(self, index):
+        return self._source.item(self._rows[index])
+
+    @QtCore.Slot(str, str)
+    def add_exclusion(self, role, value):
+        self._add_rule(self.excludes, role, value)
+
+    @QtCore.Slot(str, str)
+    def remove_exclusion(self, role, value=None):
+        self._remove_rule(self.excludes, role, value)
+
+    @QtCore.Slot("QVariantList")
+    def set_exclusion(self, rules):
+        self._set_rules(self.excludes, rules)
+
+    @QtCore.Slot()
+    def clear_exclusion(self):
+        self._clear_group(self.excludes)
+
+    @QtCore.Slot(str, str)
+    def add_inclusion(self, role, value):
+        self._add_rule(self.includes, role, value)
+
+    @QtCore.Slot(str, str)
+    def remove_inclusion(self, role, value=None):
+        self._remove_rule(self.includes, role, value)
+
+    @QtCore.Slot("QVariantList")
+    def set_inclusion(self, rules):
+        self._set_rules(self.includes, rules)
+
+    @QtCore.Slot()
+    def clear_inclusion(self):
+        self._clear_group(self.includes)
+
+    @QtCore.Slot(str)
+    def setFilterFixedString(self, pattern):
+        """Include only results whose "filter" contains `pattern`"""
+        pattern = pattern.lower()
+
+        if pattern != self._pattern:
+            self._pattern = pattern
+            self.invalidate()
+
+    @QtCore.Slot(str)
+    def search(self, text):
+        """Filter by `text` once typing has paused, see setFilterFixedString
+
+        Rather than once per keystroke, whilst typing into the terminal.
+
+        """
+
+        util.schedule(lambda: self.setFilterFixedString(text),
+                      self.search_delay,
+                      channel="search%i" % id(self))
+
+    def invalidate(self):
+        self.beginResetModel()
+        self._rows = array.array(
+            "l", self._filter(0, self._source.rowCount()))
+        self.endResetModel()
+
+    def _filter(self, first, last):
+        """Return rows from `first` up to `last` of source passing filter"""
+        source = self._source
+
+        if self._pattern:
+            rows = source.search(self._pattern, first)
+
+            if rows is None:
+                return [
+                    row for row in range(first, last)
+                    if self._accepts(source.items[row])
+                ]
+
+            # Rows that cannot be searched are filtered by rules
+            rows.extend(
+                row for row in source.unsearchable(first)
+                if self._predicate(source.items[row])
+            )
+
+            return sorted(rows)
+
+        # Look up rows by value of roles indexed
+        rows = None
+        excluded = set()
+        remaining = False
+
+        for group in (self.includes, self.excludes):
+            for role, values in group.items():
+                try:
+                    found = set()
+                    for value in values:
+                        found.update(source.lookup(role, value, first))
+
+                except (KeyError, TypeError):
+                    # Not indexed, or unhashable value
+                    remaining = True
+                    continue
+
+                if group is self.excludes:
+                    excluded |= found
+                elif rows is None:
+                    rows = found
+                else:
+                    rows &= found
+
+        if rows is None:
+            rows = range(first, last)
+        else:
+            rows = sorted(rows)
+
+        rows = [row for row in rows if row not in excluded]
+
+        # Filter by rules of roles not indexed
+        if remaining:
+            rows = [row for row in rows if self._predicate(source.items[row])]
+
+        return rows
+
+    def _accepts(self, item):
+        key = getattr(item, "filter", None)
+        if key is not None:
+            return self._pattern in six.text_type(key).lower()
+        return self._predicate(item)
+
+    def _on_rows_inserted(self, parent, first, last):
+        rows = self._filter(first, last + 1)
+
+        if not rows:
+            return
+
+        self.beginInsertRows(QtCore.QModelIndex(),
+                             len(self._rows),
+                             len(self._rows) + len(rows) - 1)
+        self._rows.extend(rows)
+        self.endInsertRows()
+
+    def _on_model_reset(self):
+        self._rows = array.array(
+            "l", self._filter(0, self._source.rowCount()))
+        self.endResetModel()
+
+    # Overridden methods
+
+    @QtCore.Slot(result=int)
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return len(self._rows)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        try:
+            row = self._rows[index.row()]
+        except IndexError:
+            return "QVariant"
+
+        return self._source.data(self._source.index(row, 0), role)
+
+    def roleNames(self):
+        return self._source.roleNames()
@@ -69,7 +69,7 @@ Column {
                     placeholderTextColor: Qt.darker(textColor, 1.5)
                 }
 
-                onTextChanged: app.resultProxy.setFilterFixedString(text)
+                onTextChanged: app.resultProxy.search(text)
             }
 
             Row {
@@ -21,17 +21,14 @@ StackView {
      * relevant to the currently entered item.
     */
     function setup(item, commenting) {
-        app.recordProxy.clear_inclusion()
-        app.recordProxy.add_inclusion("type", "record")
-        app.recordProxy.add_inclusion(item.itemType, item.name)
+        app.recordProxy.set_inclusion([["type", "record"],
+                                       [item.itemType, item.name]])
 
-        app.errorProxy.clear_inclusion()
-        app.errorProxy.add_inclusion("type", "error")
-        app.errorProxy.add_inclusion(item.itemType, item.name)
+        app.errorProxy.set_inclusion([["type", "error"],
+                                      [item.itemType, item.name]])
 
         var otherItem = item.itemType == "instance" ? "plugin" : "instance"
-        app.itemProxy.clear_inclusion()
-        app.itemProxy.add_inclusion("itemType", otherItem)
+        app.itemProxy.set_inclusion([["itemType", otherItem]])
 
         stack.push({
             item: perspective,
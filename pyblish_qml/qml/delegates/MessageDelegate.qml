@@ -22,11 +22,23 @@ BaseDelegate {
 
         Label {
             id: label
-            text: object.message
+
+            // Records left out by the host may be fetched on demand
+            text: object.dropped ?
+                object.message + ' <a href="#">Show</a>' :
+                object.message
 
             elide: Text.ElideRight
             
             width: content.width - toggle.width - content.spacing
+
+            onLinkActivated: app.showDropped(JSON.stringify(object.dropped))
+
+            MouseArea {
+                anchors.fill: parent
+                acceptedButtons: Qt.NoButton // we don't want to eat clicks on the Text
+                cursorShape: parent.hoveredLink ? Qt.PointingHandCursor : Qt.ArrowCursor
+            }
         }
     }
 }
\ No newline at end of file
@@ -8,6 +8,9 @@ WindowSize = (430, 600)
 WindowPosition = (100, 100)
 HeartbeatInterval = 60
 HiddenSections = ["Collect"]
+ResultLimit = 20000  # Results held in memory, the rest on disk
+RecordLevel = 0  # Minimum level of records sent with results
+RecordLimit = 0  # Records sent per result, 0 for no limit
 
 # Implementation details below.
 
@@ -36,5 +39,8 @@ def to_dict():
         "WindowSize",
         "WindowPosition",
         "HeartbeatInterval",
-        "HiddenSections"
+        "HiddenSections",
+        "ResultLimit",
+        "RecordLevel",
+        "RecordLimit",
     })
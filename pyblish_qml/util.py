@@ -1,8 +1,11 @@
 import json
 import re
 import time
+import array
 import types
+import tempfile
 import traceback
+import collections
 
 from functools import wraps
 
@@ -40,6 +43,12 @@ class QState(QtCore.QState):
 class ItemList(list):
     """List with keys
 
+    Items are looked up by key, and positions of items looked up
+    via :func:`index`, by way of indexes kept up to date as items
+    are appended and rebuilt on the first lookup following any other
+    change to the list. Keys of items are expected to remain unchanged
+    whilst in the list.
+
     Raises:
         KeyError is item is not in list
 
@@ -63,16 +72,24 @@ class ItemList(list):
 
     def __init__(self, key):
         self.key = key
+        self._index = None
+        self._positions = None
 
     def __getitem__(self, index):
-        if isinstance(index, int):
+        if isinstance(index, (int, slice)):
             return super(ItemList, self).__getitem__(index)
 
-        for item in self:
-            if getattr(item, self.key) == index:
-                return item
+        if self._index is None:
+            self._index = dict()
+
+            # The first of any items sharing a key takes precedence
+            for item in reversed(self):
+                self._index[getattr(item, self.key)] = item
 
-        raise KeyError("%s not in list" % index)
+        try:
+            return self._index[index]
+        except KeyError:
+            raise KeyError("%s not in list" % index)
 
     def get(self, key, default=None):
         try:
@@ -80,6 +97,198 @@ class ItemList(list):
         except KeyError:
             return default
 
+    def index(self, item, *args):
+        """Return position of `item`, without scanning the list"""
+        if args:
+            return super(ItemList, self).index(item, *args)
+
+        if self._positions is None:
+            self._positions = dict(
+                (id(self[position]), position)
+                for position in range(len(self) - 1, -1, -1)
+            )
+
+        position = self._positions.get(id(item))
+
+        if position is not None and self[position] is item:
+            return position
+
+        # Not in list, or merely equal to an item in the list
+        return super(ItemList, self).index(item)
+
+    def append(self, item):
+        if self._index is not None:
+            self._index.setdefault(getattr(item, self.key), item)
+
+        if self._positions is not None:
+            self._positions.setdefault(id(item), len(self))
+
+        super(ItemList, self).append(item)
+
+
+def _invalidates_index(name):
+    method = getattr(list, name)
+
+    def wrapper(self, *args, **kwargs):
+        self._index = None
+        self._positions = None
+        return method(self, *args, **kwargs)
+
+    wrapper.__name__ = name
+    wrapper.__doc__ = method.__doc__
+
+    return wrapper
+
+
+for _name in ("__setitem__",
+              "__delitem__",
+              "__setslice__",  # Python 2
+              "__delslice__",  # Python 2
+              "__iadd__",
+              "__imul__",
+              "extend",
+              "insert",
+              "pop",
+              "remove",
+              "clear",  # Python 3
+              "sort",
+              "reverse"):
+    if hasattr(list, _name):
+        setattr(ItemList, _name, _invalidates_index(_name))
+
+
+class SpillList(object):
+    """Append-only list holding only its most recent items in memory
+
+    Once more than `limit` items are held, the oldest are written to
+    a temporary file and read back a page at a time when accessed,
+    such that memory remains bounded however many items are appended.
+
+    Arguments:
+        limit (int): Maximum number of items held in memory,
+            or 0 for no limit
+        dumps (callable): Serialise an item into bytes
+        loads (callable): Deserialise an item from bytes
+
+    Example:
+        >>> items = SpillList(2, dumps=lambda item: b"%i" % item, loads=int)
+        >>> items.extend(range(4))
+        >>> len(items)
+        4
+        >>> items[0], items[-1]
+        (0, 3)
+
+    """
+
+    # Number of items read back at a time, and held in memory thereafter
+    page_size = 256
+    page_count = 8
+
+    def __init__(self, limit, dumps, loads):
+        self.limit = limit
+        self._dumps = dumps
+        self._loads = loads
+
+        self._items = list()  # Held in memory, following those spilled
+        self._spilled = 0
+        self._offsets = array.array("l" if six.PY2 else "q", [0])
+        self._file = None
+        self._pages = collections.OrderedDict()
+
+    @property
+    def spilled(self):
+        """Number of items written to disk, the first of all items"""
+        return self._spilled
+
+    def __len__(self):
+        return self._spilled + len(self._items)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        if index >= self._spilled:
+            return self._items[index - self._spilled]
+
+        if index < 0:
+            index += len(self)
+
+            if index < 0:
+                raise IndexError("list index out of range")
+
+            return self[index]
+
+        page, position = divmod(index, self.page_size)
+        return self._page(page)[position]
+
+    def append(self, item):
+        self._items.append(item)
+        self._spill()
+
+    def extend(self, items):
+        self._items.extend(items)
+        self._spill()
+
+    def close(self):
+        """Remove items, including those spilled"""
+        if self._file is not None:
+            self._file.close()
+
+        self.__init__(self.limit, self._dumps, self._loads)
+
+    def _spill(self):
+        if not self.limit or len(self._items) <= self.limit:
+            return
+
+        # Make room for more than one item at a time
+        count = len(self._items) - self.limit + self.limit // 4
+        count = min(count, len(self._items))
+
+        if self._file is None:
+            self._file = tempfile.TemporaryFile(prefix="pyblish-qml-")
+
+        self._file.seek(0, 2)
+
+        for item in self._items[:count]:
+            data = self._dumps(item)
+            self._file.write(data)
+            self._offsets.append(self._offsets[-1] + len(data))
+
+        # The last page read back may since have grown
+        self._pages.pop(self._spilled // self.page_size, None)
+
+        del self._items[:count]
+        self._spilled += count
+
+    def _page(self, page):
+        try:
+            items = self._pages.pop(page)
+
+        except KeyError:
+            first = page * self.page_size
+            last = min(first + self.page_size, self._spilled)
+
+            self._file.seek(self._offsets[first])
+            data = self._file.read(self._offsets[last] - self._offsets[first])
+
+            start = self._offsets[first]
+            items = [
+                self._loads(data[self._offsets[index] - start:
+                                 self._offsets[index + 1] - start])
+                for index in range(first, last)
+            ]
+
+            if len(self._pages) >= self.page_count:
+                self._pages.popitem(last=False)
+
+        self._pages[page] = items
+
+        return items
+
 
 def echo(text=""):
     print(text)
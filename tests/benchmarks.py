@@ -0,0 +1,626 @@
+"""Benchmarks, not collected as tests
+
+Run from the root of the repository.
+
+    $ python -m tests.benchmarks
+
+"""
+
+import os
+import json
+import timeit
+import logging
+import tracemalloc
+
+import pyblish.api
+import pyblish.plugin
+
+from pyblish_qml.ipc import formatting, serialization, service
+
+
+def _time(func, number):
+    """Return best time per call of `func`, in milliseconds"""
+    return min(timeit.repeat(func, number=number, repeat=3)) / number * 1000
+
+
+def serialization_throughput(records=500, number=50):
+    """Encode and decode a result carrying `records` log records"""
+
+    class Validate(pyblish.api.InstancePlugin):
+        order = pyblish.api.ValidatorOrder
+
+        def process(self, instance):
+            for index in range(records):
+                self.log.info("Validated %s, step %i of %i",
+                              instance, index, records)
+
+    context = pyblish.api.Context()
+    instance = context.create_instance("MyInstance", family="myFamily")
+
+    logging.getLogger("pyblish").setLevel(logging.DEBUG)
+    result = pyblish.plugin.process(Validate, context, instance)
+    message = {
+        "header": "pyblish-qml:popen.response",
+        "id": 1,
+        "payload": formatting.format_result(result),
+    }
+
+    codecs = [("stdlib json", json.dumps, json.loads)]
+
+    for name in serialization.available():
+        codec = serialization.get(name)
+
+        if codec is serialization.JSON and serialization.orjson:
+            name = "orjson"
+
+        codecs.append((name, codec.dumps, codec.loads))
+
+    print("Result with %i records" % records)
+
+    for name, dumps, loads in codecs:
+        data = dumps(message)
+        print("  %-12s %8i bytes  encode %7.3f ms  decode %7.3f ms" % (
+            name, len(data),
+            _time(lambda: dumps(message), number),
+            _time(lambda: loads(data), number),
+        ))
+
+
+def discover(plugins=300, number=20):
+    """Serialise `plugins` repeatedly, as on reset and actions"""
+
+    def create(index):
+        class Validate(pyblish.api.InstancePlugin):
+            """Validate something, in great detail"""
+            order = pyblish.api.ValidatorOrder
+            families = ["myFamily"]
+
+            def process(self, instance):
+                pass
+
+            def repair(self, instance):
+                pass
+
+        Validate.__name__ = "Validate%i" % index
+        return Validate
+
+    pyblish.api.deregister_all_plugins()
+
+    for index in range(plugins):
+        pyblish.api.register_plugin(create(index))
+
+    svc = service.Service()
+
+    def uncached():
+        formatting.clear_plugin_cache()
+        svc.discover()
+
+    print("Discover %i plug-ins" % plugins)
+    print("  uncached %7.3f ms" % _time(uncached, number))
+    print("  cached   %7.3f ms" % _time(svc.discover, number))
+
+    pyblish.api.deregister_all_plugins()
+
+
+def safe_formatting(records=200, number=5):
+    """Format a result carrying `records` records, validated or not"""
+
+    class Validate(pyblish.api.InstancePlugin):
+        order = pyblish.api.ValidatorOrder
+
+        def process(self, instance):
+            for index in range(records):
+                self.log.info("Step %i", index)
+
+    context = pyblish.api.Context()
+    instance = context.create_instance("MyInstance", family="myFamily")
+
+    logging.getLogger("pyblish").setLevel(logging.DEBUG)
+    result = pyblish.plugin.process(Validate, context, instance)
+
+    print("Format result with %i records" % records)
+
+    for safe, sample in ((None, None), ("1", None), ("1", "10")):
+        for key, value in (("PYBLISH_SAFE", safe),
+                           ("PYBLISH_SAFE_SAMPLE", sample)):
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+        print("  safe=%-4s sample=%-4s %8.3f ms" % (
+            safe, sample,
+            _time(lambda: formatting.format_result(result), number)))
+
+    os.environ.pop("PYBLISH_SAFE", None)
+    os.environ.pop("PYBLISH_SAFE_SAMPLE", None)
+
+
+def result_payload(records=10, number=50):
+    """Encode a result of a plug-in with a long docstring and actions"""
+
+    class Repair(pyblish.api.Action):
+        label = "Repair"
+        on = "failed"
+
+    class Validate(pyblish.api.InstancePlugin):
+        order = pyblish.api.ValidatorOrder
+        families = ["myFamily"]
+        actions = [Repair] * 5
+
+        def process(self, instance):
+            for index in range(records):
+                self.log.info("Step %i", index)
+
+    Validate.__doc__ = "Validate something, in great detail\n\n" * 50
+
+    context = pyblish.api.Context()
+    instance = context.create_instance("MyInstance", family="myFamily")
+    instance.data.update(("key%i" % index, index) for index in range(50))
+
+    logging.getLogger("pyblish").setLevel(logging.DEBUG)
+    result = pyblish.plugin.process(Validate, context, instance)
+
+    referenced = formatting.format_result(result)
+    embedded = dict(referenced,
+                    plugin=formatting.format_plugin(Validate),
+                    instance=formatting.format_instance(instance))
+
+    print("Result with %i records" % records)
+
+    for name, payload in (("embedded", embedded),
+                          ("referenced", referenced)):
+        data = serialization.JSON.dumps(payload)
+        print("  %-10s %8i bytes  encode %7.3f ms" % (
+            name, len(data),
+            _time(lambda: serialization.JSON.dumps(payload), number)))
+
+
+def main_thread(records=500, number=20):
+    """Time spent processing a pair within the dispatch wrapper"""
+
+    class Validate(pyblish.api.ContextPlugin):
+        order = pyblish.api.ValidatorOrder
+
+        def process(self, context):
+            for index in range(records):
+                self.log.info("Step %i", index)
+
+    pyblish.api.deregister_all_plugins()
+    pyblish.api.register_plugin(Validate)
+
+    svc = service.Service()
+    logging.getLogger("pyblish").setLevel(logging.DEBUG)
+
+    plugin = {"id": Validate.id}
+
+    print("Process a pair logging %i records" % records)
+    print("  formatted   %8.3f ms" % _time(
+        lambda: svc.process(plugin), number))
+    print("  unformatted %8.3f ms" % _time(
+        lambda: svc.process.unformatted(svc, plugin), number))
+
+    pyblish.api.deregister_all_plugins()
+
+
+def context_delta(instances=2000, number=20):
+    """Look for changes to a context of many instances"""
+
+    pyblish.api.deregister_all_plugins()
+    svc = service.Service()
+
+    for index in range(instances):
+        instance = svc._context.create_instance(
+            "Instance%i" % index,
+            family="myFamily",
+            families=["myOtherFamily"])
+        instance.data.update(("key%i" % key, key) for key in range(20))
+
+    version = svc.context_delta()["version"]
+
+    print("Context delta of %i unchanged instances" % instances)
+    print("  delta       %8.3f ms" % _time(
+        lambda: svc.context_delta(version), number))
+
+
+def data_changed(items=5000, number=1):
+    """Change a property of each of `items` items of a model"""
+
+    # Models require Qt, unlike the above
+    from pyblish_qml import models
+    from pyblish_qml.vendor.Qt5 import QtCore
+
+    if not QtCore.QCoreApplication.instance():
+        QtCore.QCoreApplication([])
+
+    class ScanningModel(models.AbstractModel):
+        """Look up rows as prior to the index"""
+        def _dataChanged(self, item):
+            index = list.index(self.items, item)
+            qindex = self.createIndex(index, 0)
+            self.dataChanged.emit(qindex, qindex)
+
+    print("Change %i items" % items)
+
+    for name, cls in (("scanning", ScanningModel),
+                      ("indexed", models.AbstractModel)):
+        model = cls()
+
+        for index in range(items):
+            model.add_item({"id": str(index), "name": str(index)})
+
+        def change():
+            for item in model.items:
+                item.name = item.name
+
+        print("  %-8s %9.3f ms" % (name, _time(change, number)))
+
+
+def insert_items(plugins=500, instances=2000, number=1):
+    """Add `plugins` and `instances` to a model, as on reset"""
+
+    from pyblish_qml import models
+    from pyblish_qml.vendor.Qt5 import QtCore
+
+    if not QtCore.QCoreApplication.instance():
+        QtCore.QCoreApplication([])
+
+    serialised_plugins = [
+        {
+            "pre11": False,
+            "name": "Plugin%i" % index,
+            "label": None,
+            "optional": True,
+            "category": None,
+            "actions": [],
+            "id": "plugin%i" % index,
+            "order": 1,
+            "doc": None,
+            "type": "Validator",
+            "module": "mymodule",
+            "match": 1,
+            "hasRepair": False,
+            "families": ["*"],
+            "contextEnabled": False,
+            "instanceEnabled": True,
+            "__instanceEnabled__": True,
+            "path": "mymodule.py",
+        }
+        for index in range(plugins)
+    ]
+
+    serialised_instances = [
+        {
+            "name": "Instance%i" % index,
+            "id": "instance%i" % index,
+            "data": {"family": "family%i" % (index % 10)},
+            "children": [],
+        }
+        for index in range(instances)
+    ]
+
+    def one_by_one(model):
+        for plugin in serialised_plugins:
+            model.add_plugin(dict(plugin))
+        for instance in serialised_instances:
+            model.add_instance(dict(instance))
+
+    def at_once(model):
+        model.add_plugins([dict(plugin) for plugin in serialised_plugins])
+        model.add_instances(
+            [dict(instance) for instance in serialised_instances])
+
+    print("Add %i plug-ins and %i instances" % (plugins, instances))
+
+    for name, add in (("one by one", one_by_one),
+                      ("at once", at_once)):
+        inserts = list()
+
+        def reset():
+            model = models.ItemModel()
+            model.rowsInserted.connect(lambda *args: inserts.append(args))
+
+            # As filtered for the GUI, see Controller
+            proxies = [models.ProxyModel(model) for _ in range(3)]
+            proxies[0].add_inclusion("itemType", "instance")
+            proxies[1].add_inclusion("itemType", "plugin")
+
+            add(model)
+
+        duration = _time(reset, number)
+        print("  %-10s %9.3f ms  %6i inserts" % (
+            name, duration, len(inserts) / (number * 3)))
+
+
+def result_rows(records=20000, number=1):
+    """Add a result carrying `records` log records to a model"""
+
+    from pyblish_qml import models, settings
+    from pyblish_qml.vendor.Qt5 import QtCore
+
+    if not QtCore.QCoreApplication.instance():
+        QtCore.QCoreApplication([])
+
+    class ItemResultModel(models.AbstractModel):
+        """Store results as items, as prior to rows"""
+        def add_items(self, items):
+            for item in items:
+                result = models.defaults["result"].copy()
+                result.update(item)
+                self.add_item(result)
+
+    record = {
+        "threadName": "MainThread",
+        "name": "pyblish.Validate",
+        "filename": "validate.py",
+        "pathname": "/path/to/validate.py",
+        "lineno": 10,
+        "levelname": "INFO",
+        "levelno": 20,
+        "funcName": "process",
+        "msecs": 0.5,
+        "module": "validate",
+        "type": "record",
+        "plugin": "Validate",
+        "instance": "MyInstance",
+    }
+
+    print("Add %i records" % records)
+
+    settings_limit = settings.ResultLimit
+
+    for name, cls, limit in (("items", ItemResultModel, 0),
+                             ("rows", models.ResultModel, 0),
+                             ("capped", models.ResultModel, records // 10)):
+        settings.ResultLimit = limit
+        items = [
+            dict(record, message="Step %i" % index, filter="Step %i" % index)
+            for index in range(records)
+        ]
+
+        duration = _time(lambda: cls().add_items(items), number)
+
+        tracemalloc.start()
+        model = cls()
+        model.add_items(items)
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        # Excludes memory allocated by Qt itself, such as each QObject
+        print("  %-6s %9.3f ms  %7.1f MB" % (
+            name, duration, size / 1024.0 ** 2))
+
+        # Read back in full, e.g. when filtering
+        if limit:
+            print("  %-6s %9.3f ms  read back" % (
+                name, _time(lambda: list(model.items), number)))
+
+    settings.ResultLimit = settings_limit
+
+
+def proxy_filter(records=50000, number=3):
+    """Filter `records` log records, as on entering an item"""
+
+    from pyblish_qml import models, settings
+    from pyblish_qml.vendor.Qt5 import QtCore
+
+    if not QtCore.QCoreApplication.instance():
+        QtCore.QCoreApplication([])
+
+    class UncompiledProxyModel(models.ProxyModel):
+        """Filter per rule of each row, as prior to compiled rules"""
+
+        def _rules_changed(self):
+            self.invalidate()
+
+        def _compile(self):
+            return self._uncompiled
+
+        def _uncompiled(self, item):
+            for role, values in self.includes.items():
+                if getattr(item, role, None) not in values:
+                    return False
+
+            for role, values in self.excludes.items():
+                if getattr(item, role, None) in values:
+                    return False
+
+            return True
+
+    settings_limit = settings.ResultLimit
+    settings.ResultLimit = 0
+
+    model = models.ResultModel()
+    model.add_items([
+        {
+            "type": "record",
+            "levelname": ("DEBUG", "INFO", "WARNING")[index % 3],
+            "plugin": "Plugin%i" % (index % 50),
+            "message": "Step %i" % index,
+        }
+        for index in range(records)
+    ])
+
+    settings.ResultLimit = settings_limit
+
+    print("Filter %i records" % records)
+
+    for name, cls in (("uncompiled", UncompiledProxyModel),
+                      ("compiled", models.ProxyModel),
+                      ("indexed", models.ResultProxyModel)):
+        proxy = cls(model)
+
+        # Views query rows as rules change, filtering rows anew
+        def one_by_one():
+            proxy.clear_inclusion()
+            proxy.add_inclusion("type", "record")
+            proxy.add_inclusion("plugin", "Plugin1")
+            proxy.rowCount()
+
+        def at_once():
+            proxy.set_inclusion([("type", "record"), ("plugin", "Plugin1")])
+            proxy.rowCount()
+
+        def toggle_level():
+            proxy.add_exclusion("levelname", "DEBUG")
+            proxy.rowCount()
+            proxy.remove_exclusion("levelname", "DEBUG")
+            proxy.rowCount()
+
+        print("  %-10s %9.3f ms  one by one  %9.3f ms  at once"
+              "  %9.3f ms  toggle level" % (
+                  name,
+                  _time(one_by_one, number),
+                  _time(at_once, number),
+                  _time(toggle_level, number)))
+
+
+def search(records=100000, number=3):
+    """Search `records` log records, as typed into the terminal"""
+
+    from pyblish_qml import models, settings
+    from pyblish_qml.vendor.Qt5 import QtCore
+
+    if not QtCore.QCoreApplication.instance():
+        QtCore.QCoreApplication([])
+
+    settings_limit = settings.ResultLimit
+    settings.ResultLimit = 0
+
+    model = models.ResultModel()
+    model.add_items([
+        {
+            "type": "record",
+            "filter": "Extracted frame %i of shot%i to /path/file.%04i.exr" % (
+                index % 1000, index // 1000, index % 1000),
+        }
+        for index in range(records)
+    ])
+
+    settings.ResultLimit = settings_limit
+
+    print("Search %i records" % records)
+
+    for name, cls in (("scanning", models.ProxyModel),
+                      ("indexed", models.ResultProxyModel)):
+        proxy = cls(model)
+
+        for text in ("shot42", "frame 999 of"):
+            def search():
+                proxy.setFilterFixedString(text)
+                proxy.rowCount()
+                proxy.setFilterFixedString("")
+
+            print("  %-10s %-14r %9.3f ms" % (
+                name, text, _time(search, number)))
+
+
+def toggle_section(plugins=100, instances=1000, number=1):
+    """Toggle off every instance of a section, one at a time"""
+
+    from pyblish_qml import models
+    from pyblish_qml.vendor.Qt5 import QtCore
+
+    if not QtCore.QCoreApplication.instance():
+        QtCore.QCoreApplication([])
+
+    class ScanningItemModel(models.ItemModel):
+        """Update every plug-in, as prior to relating instances"""
+        def update_compatibility(self, instance=None):
+            for plugin in self.plugins:
+                has_compatible = False
+
+                for instance in self.instances:
+                    if not instance.isToggled:
+                        continue
+
+                    if instance.id in plugin.compatibleInstances:
+                        has_compatible = True
+                        break
+
+                plugin.hasCompatible = has_compatible
+
+    print("Toggle %i instances of %i plug-ins" % (instances, plugins))
+
+    for name, cls in (("scanning", ScanningItemModel),
+                      ("related", models.ItemModel)):
+        model = cls()
+
+        items = model.add_instances([
+            {
+                "name": "Instance%i" % index,
+                "id": "instance%i" % index,
+                "data": {"family": "myFamily"},
+                "children": [],
+            }
+            for index in range(instances)
+        ])
+
+        for index in range(plugins):
+            plugin = models.Item(
+                id="plugin%i" % index,
+                name="Plugin%i" % index,
+                hasCompatible=True,
+                compatibleInstances=[item.id for item in items],
+            )
+            model.plugins.append(plugin)
+
+        model.update_compatibility()
+
+        def toggle():
+            for item in items:
+                item.isToggled = not item.isToggled
+                model.update_compatibility(item)
+
+        print("  %-8s %9.3f ms" % (name, _time(toggle, number)))
+
+
+def compatibility(plugins=400, instances=3000, number=1):
+    """Match instances to plug-ins, as on reset"""
+
+    import pyblish.logic
+    from pyblish_qml import control
+
+    context = pyblish.api.Context()
+
+    for index in range(instances):
+        instance = context.create_instance("Instance%i" % index,
+                                           family="family%i" % (index % 30))
+        instance.data["families"] = ["extra%i" % (index % 7)]
+
+    serialised = [
+        type("Plugin", (object,), {
+            "families": ["family%i" % (index % 30), "extra%i" % (index % 7)],
+            "match": (pyblish.logic.Intersection,
+                      pyblish.logic.Subset,
+                      pyblish.logic.Exact)[index % 3],
+        })
+        for index in range(plugins)
+    ]
+
+    def per_plugin():
+        for plugin in serialised:
+            pyblish.logic.instances_by_plugin(context, plugin)
+
+    def indexed():
+        list(control.instances_by_plugins(context, serialised))
+
+    print("Match %i instances to %i plug-ins" % (instances, plugins))
+    print("  per plug-in %9.3f ms" % _time(per_plugin, number))
+    print("  indexed     %9.3f ms" % _time(indexed, number))
+
+
+if __name__ == "__main__":
+    serialization_throughput()
+    discover()
+    safe_formatting()
+    result_payload()
+    main_thread()
+    context_delta()
+    data_changed()
+    insert_items()
+    result_rows()
+    proxy_filter()
+    search()
+    toggle_section()
+    compatibility()
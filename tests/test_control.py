@@ -1,5 +1,10 @@
 from PyQt5 import QtTest
 
+import pyblish.api
+import pyblish.logic
+
+from pyblish_qml import control
+
 # Vendor libraries
 from nose.tools import (
     assert_in,
@@ -7,3 +12,82 @@ from nose.tools import (
     assert_equals,
     with_setup
 )
+
+
+def test_instances_by_plugins():
+    """Instances are matched by family, as per instances_by_plugin"""
+
+    context = pyblish.api.Context()
+
+    for name, family, families in (("A", "a", []),
+                                   ("B", "b", ["a"]),
+                                   ("AB", "a", ["b"]),
+                                   ("C", "c", ["a", "b"]),
+                                   ("None", None, [])):
+        instance = context.create_instance(name, family=family)
+        instance.data["families"] = families
+
+    plugins = [
+        type("Plugin", (object,), {"families": families, "match": match})
+        for families in (["*"], [], ["a"], ["a", "b"], ["c", "d"])
+        for match in (pyblish.logic.Intersection,
+                      pyblish.logic.Subset,
+                      pyblish.logic.Exact)
+    ]
+
+    for plugin, instances in zip(
+            plugins, control.instances_by_plugins(context, plugins)):
+        assert_equals(instances,
+                      pyblish.logic.instances_by_plugin(context, plugin))
+
+
+def test_stop_between_batches():
+    """Publishing stops between batches of a plug-in's instances"""
+
+    class Extract(pyblish.api.InstancePlugin):
+        order = pyblish.api.ExtractorOrder
+
+    context = pyblish.api.Context()
+    for name in ("A", "B", "C", "D"):
+        context.create_instance(name)
+
+    processed = list()
+    about_to_process = list()
+
+    class Host(object):
+        def process_batch(self, pairs, duration=None, **vars):
+            # A batch lasting for a single pair
+            plugin, instance = pairs[0]
+            processed.append(instance.name)
+
+            # Stop is pressed whilst processing the second instance
+            if len(processed) == 2:
+                controller.stop()
+
+            return {
+                "results": [{"instance": {"id": instance.id}}],
+                "stopped": None,
+                "vars": vars,
+            }
+
+    controller = control.Controller(Host())
+    controller.about_to_process.disconnect()
+    controller.about_to_process.connect(
+        lambda plugin, instance: about_to_process.append(instance.name))
+    controller.data["state"]["is_running"] = True
+
+    iterator = controller.iterator([Extract], context)
+    batches = list()
+
+    try:
+        while True:
+            batches.append(next(iterator))
+    except StopIteration as e:
+        stopped = e.args[0]
+
+    assert_equals(processed, ["A", "B"])
+    assert_equals(len(batches), 2)
+    assert_equals(str(stopped), "Stopped")
+
+    # Only pairs about to be processed are reflected as such
+    assert_equals(about_to_process, ["A", "B"])
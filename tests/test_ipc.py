@@ -0,0 +1,954 @@
+import os
+import json
+import socket
+import time
+import logging
+import threading
+
+import pyblish.api
+import pyblish.plugin
+
+from pyblish_qml import _state
+from pyblish_qml.ipc import (
+    client,
+    framing,
+    formatting,
+    schema,
+    serialization,
+    server,
+    service,
+    sockets,
+)
+
+# Vendor libraries
+from nose.tools import (
+    assert_in,
+    assert_true,
+    assert_equals,
+    assert_raises,
+)
+
+
+def test_framing_split():
+    """framing.Decoder reassembles messages split across reads"""
+
+    messages = [b'{"id": %i}' % index for index in range(10)]
+    stream = b"".join(
+        b"Printed %i\n" % index + framing.encode(message)
+        for index, message in enumerate(messages)
+    )
+
+    decoder = framing.Decoder()
+    chunks = list()
+
+    # Feed a few bytes at a time, splitting headers and payloads
+    for index in range(0, len(stream), 5):
+        chunks.extend(decoder.feed(stream[index:index + 5]))
+
+    assert_equals(
+        [chunk for kind, chunk in chunks if kind == framing.MESSAGE],
+        messages
+    )
+
+    assert_equals(
+        b"".join(chunk for kind, chunk in chunks if kind == framing.TEXT),
+        b"".join(b"Printed %i\n" % index for index in range(10))
+    )
+
+
+def test_framing_write():
+    """framing.write writes a frame once, however much a write returns"""
+
+    class Stream(object):
+        def __init__(self, chunk):
+            self.chunk = chunk
+            self.data = b""
+
+        def write(self, data):
+            data = bytes(data)
+
+            if self.chunk is None:
+                # As files of Python 2
+                self.data += data
+                return None
+
+            self.data += data[:self.chunk]
+            return len(data[:self.chunk])
+
+        def flush(self):
+            pass
+
+    for chunk in (None, 3, 1000):
+        stream = Stream(chunk)
+        framing.write(stream, b'{"id": 1}')
+        assert_equals(stream.data, framing.encode(b'{"id": 1}'))
+
+
+def test_format_plugin_cache():
+    """Serialised plug-ins are cached until they change"""
+
+    class MyPlugin(pyblish.api.InstancePlugin):
+        """My plug-in"""
+        order = pyblish.api.ValidatorOrder
+
+    formatting.clear_plugin_cache()
+    first = formatting.format_plugin(MyPlugin)
+    second = formatting.format_plugin(MyPlugin)
+
+    assert_equals(first, second)
+    assert_equals(second["type"], "Validator")
+    assert_equals(second["doc"], "My plug-in")
+
+    MyPlugin.order = pyblish.api.ExtractorOrder
+    MyPlugin.label = "Mine"
+    third = formatting.format_plugin(MyPlugin)
+
+    assert_equals(third["type"], "Extractor")
+    assert_equals(third["label"], "Mine")
+
+    formatting.clear_plugin_cache(keep=[])
+    assert_equals(formatting._plugin_cache, {})
+
+
+def test_safe_sampled():
+    """Only every Nth message is validated with PYBLISH_SAFE_SAMPLE=N"""
+
+    os.environ["PYBLISH_SAFE"] = "1"
+    os.environ["PYBLISH_SAFE_SAMPLE"] = "2"
+
+    invalid = 0
+
+    try:
+        assert_raises(schema.ValidationError,
+                      schema.validate, {"message": 1}, "record")
+
+        for _ in range(4):
+            try:
+                formatting._validate({"message": 1}, "record")
+            except schema.ValidationError:
+                invalid += 1
+
+    finally:
+        os.environ.pop("PYBLISH_SAFE")
+        os.environ.pop("PYBLISH_SAFE_SAMPLE")
+
+    assert_equals(invalid, 2)
+
+
+def test_shared_validators():
+    """Validators are built once, and shared by threads"""
+
+    built = list()
+
+    def validate():
+        schema.validate({"message": "Hello"}, "record")
+        built.append(schema.validator("record"))
+
+    threads = [threading.Thread(target=validate) for _ in range(10)]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert_equals(len(built), 10)
+    assert_equals(len(set(map(id, built))), 1)
+
+
+def test_result_references():
+    """Results reference their plug-in and instance by id"""
+
+    class MyPlugin(pyblish.api.InstancePlugin):
+        """A long description, not to be sent with each result"""
+        order = pyblish.api.ValidatorOrder
+
+        def process(self, instance):
+            self.log.info("Processed")
+
+    context = pyblish.api.Context()
+    instance = context.create_instance("MyInstance")
+
+    result = formatting.format_result(
+        pyblish.plugin.process(MyPlugin, context, instance))
+    schema.validate(result, "result")
+
+    assert_equals(result["plugin"], {"id": MyPlugin.id})
+    assert_equals(result["instance"], {"id": instance.id})
+    assert_equals(result["records"][0]["message"], "Processed")
+
+    class MyContextPlugin(pyblish.api.ContextPlugin):
+        order = pyblish.api.ValidatorOrder
+
+        def process(self, context):
+            pass
+
+    result = formatting.format_result(
+        pyblish.plugin.process(MyContextPlugin, context, None))
+    schema.validate(result, "result")
+
+    assert_equals(result["instance"], None)
+
+
+def test_record_filter():
+    """Records below the level or beyond the limit are left out"""
+
+    class MyPlugin(pyblish.api.ContextPlugin):
+        order = pyblish.api.ValidatorOrder
+
+        def process(self, context):
+            for index in range(5):
+                self.log.debug("Debug %i" % index)
+            self.log.warning("Warning")
+            self.log.info("Info")
+
+    pyblish.api.register_plugin(MyPlugin)
+
+    try:
+        svc = service.Service()
+    finally:
+        pyblish.api.deregister_plugin(MyPlugin)
+
+    def process():
+        result = svc.process({"id": MyPlugin.id})
+        schema.validate(result, "result")
+        return [record["message"] for record in result["records"]], result
+
+    assert_equals(len(process()[0]), 7)
+
+    svc.set_record_filter(logging.INFO)
+    assert_equals(process()[0], ["Warning", "Info"])
+
+    svc.set_record_filter(limit=3)
+    messages, result = process()
+    assert_equals(messages, ["Debug 0", "Warning", "Info"])
+    assert_equals(result["dropped"], {"DEBUG": 4})
+
+    assert_equals(
+        [record["message"] for record in svc.dropped_records(MyPlugin.id)],
+        ["Debug %i" % index for index in range(1, 5)])
+
+    svc.reset()
+    assert_equals(svc.dropped_records(MyPlugin.id), [])
+
+
+def test_stream_records():
+    """Records are streamed whilst processing, and left out of the result"""
+
+    class MyPlugin(pyblish.api.ContextPlugin):
+        order = pyblish.api.ValidatorOrder
+
+        def process(self, context):
+            for index in range(3):
+                self.log.info("Step %i" % index)
+
+    pyblish.api.register_plugin(MyPlugin)
+
+    try:
+        svc = service.Service()
+    finally:
+        pyblish.api.deregister_plugin(MyPlugin)
+
+    streams = list()
+    svc.stream = streams.append
+
+    def messages(records):
+        return [record["message"] for record in records]
+
+    # Records emitted within the interval are held back for the result
+    svc.stream_interval = 60
+    result = svc.process({"id": MyPlugin.id})
+
+    assert_equals([stream["plugin"] for stream in streams],
+                  [{"id": MyPlugin.id}])
+    assert_equals(messages(streams[0]["records"]), ["Step 0"])
+    assert_equals(messages(result["records"]), ["Step 1", "Step 2"])
+
+    # Streamed records count towards the limit
+    del streams[:]
+    svc.stream_interval = 0
+    svc.set_record_filter(limit=2)
+    result = svc.process({"id": MyPlugin.id})
+
+    assert_equals([messages(stream["records"]) for stream in streams],
+                  [["Step 0"], ["Step 1"]])
+    assert_equals(result["records"], [])
+    assert_equals(result["streamed"], {"INFO": 2})
+    assert_equals(result["dropped"], {"INFO": 1})
+
+
+def test_stream_timer():
+    """Records held back are streamed once the interval has passed"""
+
+    streams = list()
+    streamed = threading.Event()
+
+    def stream(records):
+        streams.append([record["message"] for record in records])
+        streamed.set()
+
+    def record(message):
+        return logging.LogRecord(
+            "pyblish.plugin", logging.INFO, __file__, 0, message, None, None)
+
+    handler = service.StreamHandler(stream, interval=0.1)
+    handler.handle(record("First"))
+    streamed.clear()
+
+    handler.handle(record("Second"))
+    handler.handle(record("Third"))
+
+    assert_equals(streams, [["First"]])
+    assert_true(streamed.wait(timeout=5))
+    assert_equals(streams, [["First"], ["Second", "Third"]])
+
+    # Records held back as the handler is closed are left to the result
+    handler = service.StreamHandler(stream, interval=60)
+    handler.handle(record("First"))
+    handler.handle(record("Second"))
+    handler.close()
+
+    assert_equals(handler.streamed[0].msg, "First")
+    assert_equals(handler._pending[0][0].msg, "Second")
+    assert_equals(handler._timer, None)
+
+
+def test_stream_captured():
+    """Records are captured as emitted, and streamed in the codec in use"""
+
+    threads = list()
+
+    class Node(object):
+        def __str__(self):
+            threads.append(threading.current_thread())
+            return "|node"
+
+    class MyPlugin(pyblish.api.ContextPlugin):
+        order = pyblish.api.ValidatorOrder
+
+        def process(self, context):
+            self.log.info(Node())
+
+            # Held back, and streamed by the timer whilst processing
+            self.log.info("Validated %s", Node())
+            time.sleep(0.5)
+
+            assert False, "Failed"
+
+    pyblish.api.register_plugin(MyPlugin)
+
+    try:
+        svc = service.Service()
+    finally:
+        pyblish.api.deregister_plugin(MyPlugin)
+
+    written = list()
+
+    srv = server.Server.__new__(server.Server)
+    srv.service = svc
+    srv.modal = True
+    srv.write = written.append
+
+    # The child picks msgpack, making its first request
+    srv._receive({"header": "pyblish-qml:popen.request", "id": 1,
+                  "payload": {"name": "ping", "args": [], "kwargs": {}}},
+                 codec=serialization.MSGPACK)
+
+    del written[:]
+
+    proxy = server.Proxy.__new__(server.Proxy)
+    proxy.server = srv
+
+    svc.stream = proxy.stream
+    svc.stream_interval = 0.1
+    result = svc.process({"id": MyPlugin.id})
+
+    assert_equals(set(threads), set([threading.current_thread()]))
+
+    # The traceback logged of the failed plug-in is not streamed
+    assert_equals(result["streamed"], {"INFO": 2})
+    assert_equals(len(written), 2)
+
+    streams = list()
+
+    for data in written:
+        assert_equals(serialization.detect(data), serialization.MSGPACK)
+        streams.append(serialization.MSGPACK.loads(data)["payload"]["args"][0])
+
+    assert_equals([[record["message"] for record in stream["records"]]
+                   for stream in streams],
+                  [["|node"], ["Validated %s"]])
+    assert_equals(streams[1]["records"][0]["args"], ["|node"])
+
+
+def test_format_apart():
+    """Results are serialised apart from the dispatch wrapper"""
+
+    calls = list()
+
+    class MyService(object):
+        @service.formatted(lambda value: calls.append("format") or value * 2)
+        def double(self, value):
+            calls.append("call")
+            return value
+
+    def wrapper(func, *args, **kwargs):
+        calls.append("wrapper")
+        result = func(*args, **kwargs)
+        calls.append("unwrapper")
+        return result
+
+    assert_equals(MyService().double(2), 4)
+    assert_equals(calls, ["call", "format"])
+
+    # Without a child process, see Server.__init__
+    srv = server.Server.__new__(server.Server)
+    srv.service = MyService()
+    srv.write = lambda data: calls.append(json.loads(data)["payload"])
+
+    del calls[:]
+    _state["dispatchWrapper"] = wrapper
+
+    try:
+        srv.handle({"id": 1, "payload": {
+            "name": "double", "args": [3], "kwargs": {}}})
+    finally:
+        _state.pop("dispatchWrapper")
+
+    assert_equals(calls, ["wrapper", "call", "unwrapper", "format", 6])
+
+
+def test_capture_in_wrapper():
+    """Objects of the host logged or raised are converted within the wrapper"""
+
+    state = {"wrapped": False}
+    converted = list()
+
+    class Node(object):
+        def __str__(self):
+            converted.append(state["wrapped"])
+            return "|node"
+
+    class MyPlugin(pyblish.api.ContextPlugin):
+        order = pyblish.api.ValidatorOrder
+
+        def process(self, context):
+            self.log.info(Node())
+            self.log.info("Validated %s", Node())
+            raise ValueError(Node())
+
+    pyblish.api.register_plugin(MyPlugin)
+
+    try:
+        svc = service.Service()
+    finally:
+        pyblish.api.deregister_plugin(MyPlugin)
+
+    def wrapper(func, *args, **kwargs):
+        state["wrapped"] = True
+
+        try:
+            return func(*args, **kwargs)
+        finally:
+            state["wrapped"] = False
+
+    responses = list()
+
+    srv = server.Server.__new__(server.Server)
+    srv.service = svc
+    srv.write = lambda data: responses.append(json.loads(data)["payload"])
+
+    _state["dispatchWrapper"] = wrapper
+
+    try:
+        srv.handle({"id": 1, "payload": {
+            "name": "process", "args": [{"id": MyPlugin.id}], "kwargs": {}}})
+    finally:
+        _state.pop("dispatchWrapper")
+
+    result = responses[0]
+
+    assert_true(converted)
+    assert_true(all(converted))
+    assert_equals([record["message"] for record in result["records"]],
+                  ["|node", "Validated %s"])
+    assert_equals(result["records"][1]["args"], ["|node"])
+    assert_equals(result["error"]["message"], "|node")
+
+
+def test_threadsafe():
+    """Thread-safe calls are served without the dispatch wrapper"""
+
+    calls = list()
+
+    class MyService(object):
+        @service.threadsafe
+        def ping(self):
+            return "pong"
+
+        def process(self):
+            return "processed"
+
+    def wrapper(func, *args, **kwargs):
+        calls.append("wrapper")
+        return func(*args, **kwargs)
+
+    srv = server.Server.__new__(server.Server)
+    srv.service = MyService()
+    srv.write = lambda data: calls.append(json.loads(data)["payload"])
+
+    _state["dispatchWrapper"] = wrapper
+
+    try:
+        for name in ("ping", "process"):
+            srv.handle({"id": 1, "payload": {
+                "name": name, "args": [], "kwargs": {}}})
+    finally:
+        _state.pop("dispatchWrapper")
+
+    assert_equals(calls, ["pong", "wrapper", "processed"])
+
+
+def test_process_batch():
+    """Pairs of a batch are processed in order, until the test fails"""
+
+    processed = list()
+
+    class Validate(pyblish.api.InstancePlugin):
+        order = pyblish.api.ValidatorOrder
+
+        def process(self, instance):
+            processed.append(instance.name)
+            assert instance.name != "Invalid", "Invalid"
+
+    class Extract(pyblish.api.InstancePlugin):
+        order = pyblish.api.ExtractorOrder
+
+        def process(self, instance):
+            processed.append(instance.name)
+
+    for plugin in (Validate, Extract):
+        pyblish.api.register_plugin(plugin)
+
+    try:
+        svc = service.Service()
+    finally:
+        pyblish.api.deregister_all_plugins()
+
+    for name in ("First", "Invalid", "Last"):
+        svc._context.create_instance(name)
+
+    def pairs(plugin):
+        return [[plugin.id, instance.id] for instance in svc._context]
+
+    vars = {"nextOrder": None, "ordersWithError": []}
+    batch = svc.process_batch(pairs(Validate), vars)
+
+    assert_equals(processed, ["First", "Invalid", "Last"])
+    assert_equals([result["instance"]["id"] for result in batch["results"]],
+                  [instance.id for instance in svc._context])
+    assert_equals([result["success"] for result in batch["results"]],
+                  [True, False, True])
+    assert_equals(batch["stopped"], None)
+
+    # Extractors are stopped by the failed validator
+    del processed[:]
+    batch = svc.process_batch(pairs(Extract), batch["vars"])
+
+    assert_equals(processed, [])
+    assert_equals(batch["results"], [])
+    assert_true(batch["stopped"])
+
+    # Remaining pairs are left to the client after the duration
+    batch = svc.process_batch(pairs(Validate), vars, duration=0)
+
+    assert_equals(len(batch["results"]), 1)
+    assert_equals(batch["stopped"], None)
+
+
+def test_context_delta():
+    """Added, changed and removed instances are passed to the client"""
+
+    pyblish.api.deregister_all_plugins()
+    svc = service.Service()
+
+    proxy = client.Proxy.__new__(client.Proxy)
+    proxy.cached_context = list()
+    proxy.context_version = None
+
+    def delta():
+        # As passed from host to client
+        data = json.loads(json.dumps(svc.context_delta(
+            proxy.context_version)))
+        return proxy._apply_delta(data)
+
+    def names(instances):
+        return sorted(instance.name for instance in instances)
+
+    first = svc._context.create_instance("First", family="myFamily")
+    second = svc._context.create_instance("Second", family="myFamily")
+
+    full = delta()
+    assert_true(full["full"])
+    assert_equals(names(full["added"]), ["First", "Second"])
+
+    # Nothing has changed since
+    unchanged = delta()
+    assert_equals(unchanged["full"], False)
+    assert_equals([unchanged["added"], unchanged["changed"],
+                   unchanged["removed"]], [[], [], []])
+    assert_equals(unchanged["data"], None)
+
+    third = svc._context.create_instance("Third", family="myFamily")
+    first.data["publish"] = False
+    second.data["families"] = ["otherFamily"]
+    second.data["families"].append("anotherFamily")
+    second.data["unsent"] = "Not passed to the client"
+
+    changed = delta()
+    assert_equals(names(changed["added"]), ["Third"])
+    assert_equals(names(changed["changed"]), ["First", "Second"])
+
+    # Members of data changed in-place
+    second.data["families"].append("yetAnotherFamily")
+    assert_equals(names(delta()["changed"]), ["Second"])
+
+    svc._context.remove(first)
+
+    removed = delta()
+    assert_equals(removed["removed"], [first.id])
+
+    # The client mirrors the context of the host
+    assert_equals(names(proxy.cached_context),
+                  ["Second", "Third"])
+    assert_equals(
+        [instance.data.get("families") for instance in proxy.cached_context],
+        [["otherFamily", "anotherFamily", "yetAnotherFamily"], None])
+
+    # A reset passes every instance anew
+    version = proxy.context_version
+    svc.reset()
+    svc._context.create_instance("Fourth", family="myFamily")
+
+    reset = delta()
+    assert_true(reset["full"])
+    assert_true(proxy.context_version > version)
+    assert_equals(names(reset["added"]), ["Fourth"])
+    assert_equals(sorted(reset["removed"]), sorted([second.id, third.id]))
+
+
+def test_cached_discover():
+    """Discover is served without the dispatch wrapper only when cached"""
+
+    class MyPlugin(pyblish.api.ContextPlugin):
+        pass
+
+    pyblish.api.register_plugin(MyPlugin)
+
+    try:
+        svc = service.Service()
+    finally:
+        pyblish.api.deregister_plugin(MyPlugin)
+
+    state = {"wrapped": False, "count": 0}
+    calls = list()
+
+    def wrapper(func, *args, **kwargs):
+        state["wrapped"] = True
+        state["count"] += 1
+
+        try:
+            return func(*args, **kwargs)
+        finally:
+            state["wrapped"] = False
+
+    # Called upon serialising what is cached of each plug-in
+    def get_arg_spec(func):
+        calls.append(state["wrapped"])
+        return original(func)
+
+    responses = list()
+
+    srv = server.Server.__new__(server.Server)
+    srv.service = svc
+    srv.write = lambda data: responses.append(json.loads(data)["payload"])
+
+    def discover():
+        del calls[:]
+        srv.handle({"id": 1, "payload": {
+            "name": "discover", "args": [], "kwargs": {}}})
+        return responses.pop()
+
+    original = formatting.get_arg_spec
+    formatting.get_arg_spec = get_arg_spec
+    _state["dispatchWrapper"] = wrapper
+
+    try:
+        formatting.clear_plugin_cache()
+
+        # Formatted within the wrapper
+        cold = discover()
+        assert_equals(state["count"], 1)
+        assert_true(calls)
+        assert_true(all(calls))
+
+        # Served from the cache, without the wrapper
+        warm = discover()
+        assert_equals(state["count"], 1)
+        assert_equals(calls, [])
+
+    finally:
+        formatting.get_arg_spec = original
+        _state.pop("dispatchWrapper")
+
+    assert_equals(cold, warm)
+    assert_in("MyPlugin", [plugin["name"] for plugin in warm])
+
+
+def test_id_index():
+    """service.IdIndex follows changes to the list it indexes"""
+
+    context = pyblish.api.Context()
+    first = context.create_instance("First")
+    index = service.IdIndex(context)
+
+    assert_true(index[first.id] is first)
+
+    second = context.create_instance("Second")
+    context.remove(first)
+
+    assert_true(index[second.id] is second)
+    assert_raises(KeyError, index.__getitem__, first.id)
+
+
+def test_serialization_detect():
+    """Messages are decoded with whichever codec encoded them"""
+
+    message = {"header": "pyblish-qml:popen.request", "id": 1}
+
+    for name in serialization.available():
+        data = serialization.get(name).dumps(message)
+        assert_equals(serialization.detect(data).name, name)
+        assert_equals(serialization.loads(data), message)
+
+
+def test_serialization_keys():
+    """Maps with keys other than strings are decoded by either codec"""
+
+    message = {"payload": {"data": {1: "one", "two": 2}}}
+
+    assert_equals(serialization.JSON.loads(serialization.JSON.dumps(message)),
+                  {"payload": {"data": {"1": "one", "two": 2}}})
+
+    if serialization.msgpack is not None:
+        data = serialization.MSGPACK.dumps(message)
+        assert_equals(serialization.MSGPACK.loads(data), message)
+
+
+def _connect_proxy():
+    """Return a Proxy along with the parent end of its socket"""
+    listener = sockets.Listener()
+    proxy = client.Proxy(socket=listener.address)
+    proxy._kill.cancel()
+
+    return proxy, listener.accept()
+
+
+def _respond(connection, request, payload):
+    connection.send(json.dumps({
+        "header": "pyblish-qml:popen.response",
+        "id": request["id"],
+        "payload": payload,
+    }).encode("utf8"))
+
+
+def test_request_ids():
+    """Each request is given a unique id, echoed with its response"""
+
+    proxy, connection = _connect_proxy()
+    messages = connection.messages()
+
+    try:
+        requests = [proxy._request("ping") for _ in range(3)]
+        received = [json.loads(next(messages).decode("utf8"))
+                    for _ in requests]
+
+        assert_equals([message["id"] for message in received],
+                      [request.id for request in requests])
+        assert_equals(len(set(request.id for request in requests)), 3)
+
+        # Responses may arrive in any order
+        for message in reversed(received):
+            _respond(connection, message, message["id"])
+
+        assert_equals([request.result() for request in requests],
+                      [request.id for request in requests])
+
+    finally:
+        connection.close()
+        proxy.connection.close()
+
+
+def test_concurrent_requests():
+    """Concurrent requests are each given their own response"""
+
+    proxy, connection = _connect_proxy()
+    messages = connection.messages()
+    results = dict()
+
+    def request(index):
+        results[index] = proxy._dispatch("echo", args=[index])
+
+    threads = [threading.Thread(target=request, args=[index])
+               for index in range(10)]
+
+    for thread in threads:
+        thread.daemon = True
+        thread.start()
+
+    try:
+        received = [json.loads(next(messages).decode("utf8"))
+                    for _ in threads]
+
+        # A response to no request in flight is dropped
+        _respond(connection, {"id": 0}, "unrequested")
+
+        for message in reversed(received):
+            _respond(connection, message, message["payload"]["args"][0])
+
+        for thread in threads:
+            thread.join(timeout=5)
+
+        assert_equals(results, dict((index, index) for index in range(10)))
+        assert_equals(proxy._pending, {})
+
+    finally:
+        connection.close()
+        proxy.connection.close()
+
+
+def test_stream_ahead():
+    """Records streamed by the parent are passed on ahead of the result"""
+
+    proxy, connection = _connect_proxy()
+    messages = connection.messages()
+    streams = list()
+    proxy.stream = streams.append
+
+    try:
+        request = proxy._request("process")
+        message = json.loads(next(messages).decode("utf8"))
+
+        connection.send(json.dumps({
+            "header": "pyblish-qml:popen.parent",
+            "payload": {
+                "name": "stream",
+                "args": [{"records": []}],
+                "kwargs": {},
+            }
+        }).encode("utf8"))
+
+        _respond(connection, message, "result")
+
+        assert_equals(request.result(), "result")
+        assert_equals(streams, [{"records": []}])
+
+    finally:
+        connection.close()
+        proxy.connection.close()
+
+
+def test_socket_token():
+    """Connections to a listener must present its token"""
+
+    listener = sockets.Listener()
+    address, _, token = listener.address.rpartition("#")
+    connected = list()
+
+    def connect():
+        # Without the token, and then with it
+        connected.append(sockets.connect(address + "#" + "0" * len(token)))
+        connected.append(sockets.connect(listener.address))
+
+    thread = threading.Thread(target=connect)
+    thread.daemon = True
+    thread.start()
+
+    connection = listener.accept(timeout=5)
+    thread.join(timeout=5)
+
+    try:
+        # The first connection was turned away
+        assert_equals(connected[0].receive(), None)
+
+        connected[1].send(b"message")
+        assert_equals(connection.receive(), b"message")
+
+        assert_raises(ValueError, sockets.connect, address)
+
+    finally:
+        connection.close()
+
+        for other in connected:
+            other.close()
+
+
+def test_socket_accept_timeout():
+    """Listeners give up on a child which never connects"""
+
+    listener = sockets.Listener()
+    assert_raises(socket.timeout, listener.accept, timeout=0.1)
+
+
+def test_undecodable_frame():
+    """Frames failing to decode are reported, rather than raised"""
+
+    received = list()
+
+    srv = server.Server.__new__(server.Server)
+    srv._receive = lambda message, codec: received.append(message)
+
+    srv._receive_frame(b"{not json")
+    srv._receive_frame(b"\xc1")
+    srv._receive_frame(b'{"header": "unknown"}')
+
+    assert_equals(received, [{"header": "unknown"}])
+
+
+def test_socket_transport():
+    """Requests and responses are passed over a local socket"""
+
+    proxy, connection = _connect_proxy()
+    mock = service.MockService()
+
+    def serve():
+        for message in connection.messages():
+            request = json.loads(message.decode("utf8"))
+            payload = request["payload"]
+            func = getattr(mock, payload["name"])
+
+            _respond(connection, request,
+                     func(*payload["args"], **payload["kwargs"]))
+
+    thread = threading.Thread(target=serve)
+    thread.daemon = True
+    thread.start()
+
+    try:
+        proxy.reset()
+        plugins = proxy.discover()
+        context = proxy.context()
+
+        assert_equals(
+            [plugin.id for plugin in plugins],
+            [plugin.id for plugin in mock._plugins]
+        )
+
+        assert_equals(
+            [instance.id for instance in context],
+            [instance.id for instance in mock._context]
+        )
+
+    finally:
+        connection.close()
+        proxy.connection.close()
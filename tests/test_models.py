@@ -0,0 +1,541 @@
+import sys
+
+import pyblish.api
+
+from pyblish_qml import control, models, settings
+from pyblish_qml.ipc import formatting
+from pyblish_qml.vendor.Qt5 import QtCore
+
+# Vendor libraries
+from nose.tools import (
+    assert_true,
+    assert_equals,
+    assert_not_equals,
+)
+
+app = QtCore.QCoreApplication.instance() or QtCore.QCoreApplication(sys.argv)
+
+
+def test_batch():
+    """Changes within a batch are emitted once per range of rows"""
+
+    model = models.AbstractModel()
+
+    for index in range(5):
+        model.add_item({"id": str(index), "isProcessing": True})
+
+    emitted = list()
+    model.dataChanged.connect(
+        lambda first, last: emitted.append((first.row(), last.row())))
+
+    with model.batch():
+        for item in model.items:
+            if item.id != "2":
+                item.isProcessing = False
+                item.isProcessing = False
+
+        # Nested batches are emitted with the outermost one
+        with model.batch():
+            model.items[4].isProcessing = True
+
+    assert_equals(emitted, [(0, 1), (3, 4)])
+
+    model.items[0].isProcessing = True
+    assert_equals(emitted[-1], (0, 0))
+
+
+def test_add_instances():
+    """Instances are inserted into the model at once"""
+
+    model = models.ItemModel()
+
+    inserted = list()
+    model.rowsInserted.connect(
+        lambda parent, first, last: inserted.append((first, last)))
+
+    model.add_instances([
+        {
+            "name": "Instance%i" % index,
+            "id": "instance%i" % index,
+            "data": {"family": "myFamily"},
+            "children": [],
+        }
+        for index in range(3)
+    ])
+
+    # One section, followed by each instance
+    assert_equals(inserted, [(0, 0), (1, 3)])
+    assert_equals(model.sections["myFamily"].itemType, "section")
+    assert_equals(
+        [instance.name for instance in model.instances],
+        ["Instance0", "Instance1", "Instance2"]
+    )
+
+
+def test_item_classes():
+    """Items of the same kind share a class"""
+
+    first = models.Item(name="First", order=1, __private__=True)
+    second = models.Item(name="Second", order=2, __private__=False)
+    other = models.Item(name="Other", order=None)
+
+    assert_equals(type(first), type(second))
+    assert_not_equals(type(first), type(other))
+
+    assert_equals(first.name, "First")
+    assert_equals(second.order, 2)
+    assert_equals(second.__private__, False)
+
+    second.order = 3
+    assert_equals((first.order, second.order), (1, 3))
+
+
+def test_result_rows():
+    """Results are stored as read-only rows, exposed per role"""
+
+    model = models.ResultModel()
+    proxy = models.ProxyModel(model, includes={"type": ["record"]})
+
+    model.add_items([
+        {"type": "instance", "message": "MyInstance"},
+        {"type": "record", "message": "Hello", "levelname": "INFO"},
+        {"type": "record", "message": "World", "levelname": "DEBUG"},
+    ])
+
+    row = model.items[1]
+    assert_equals(type(row), type(model.items[2]))
+    assert_equals((row.type, row.message, row.plugin),
+                  ("record", "Hello", "default"))
+
+    roles = dict((name, role) for role, name in model.roleNames().items())
+    index = model.index(1, 0)
+
+    assert_equals(model.data(index, roles[b"levelname"]), "INFO")
+    assert_equals(model.data(index, roles[b"object"])["message"], "Hello")
+
+    # Filtered by value, as with items
+    assert_equals(proxy.rowCount(), 2)
+    proxy.add_exclusion("levelname", "DEBUG")
+    assert_equals(proxy.rowCount(), 1)
+
+
+def test_result_limit():
+    """Results beyond the limit are read back from disk"""
+
+    limit = settings.ResultLimit
+    settings.ResultLimit = 10
+
+    try:
+        model = models.ResultModel()
+        model.add_items([
+            {"type": "record", "message": "Message %i" % index}
+            for index in range(100)
+        ])
+
+    finally:
+        settings.ResultLimit = limit
+
+    assert_equals(model.rowCount(), 100)
+    assert_equals(model.items[0].message, "Message 0")
+    assert_equals(model.data(model.index(50, 0), QtCore.Qt.UserRole + 1),
+                  model.items[50].json)
+
+    model.reset()
+    assert_equals(model.rowCount(), 0)
+
+
+def test_proxy_rules():
+    """Rows are filtered anew only as rules change in effect"""
+
+    model = models.ResultModel()
+    model.add_items([
+        {"type": "record", "levelname": level, "plugin": plugin}
+        for level in ("DEBUG", "INFO")
+        for plugin in ("A", "B")
+    ])
+
+    filtered = list()
+
+    class Proxy(models.ProxyModel):
+        def filterAcceptsRow(self, source_row, source_parent):
+            filtered.append(source_row)
+            return super(Proxy, self).filterAcceptsRow(
+                source_row, source_parent)
+
+    proxy = Proxy(model, excludes={"levelname": ["DEBUG"]})
+    assert_equals(proxy.rowCount(), 2)
+
+    del filtered[:]
+    proxy.add_exclusion("levelname", "DEBUG")
+    proxy.set_exclusion([("levelname", "DEBUG")])
+    assert_equals(filtered, [])
+
+    proxy.set_inclusion([("type", "record"), ("plugin", "A")])
+    assert_equals(proxy.rowCount(), 1)
+    assert_equals(len(filtered), 4)
+
+    # Unknown roles are never equal to a value
+    proxy.set_inclusion([("unknown", "A")])
+    assert_equals(proxy.rowCount(), 0)
+
+    # Qt roles are looked up by name
+    roles = dict((name, role) for role, name in model.roleNames().items())
+
+    for proxy in (Proxy(model), models.ResultProxyModel(model)):
+        proxy.set_inclusion([(roles[b"levelname"], "INFO")])
+        assert_equals(proxy.rowCount(), 2)
+
+        proxy.set_inclusion([(roles[b"levelname"], "INFO"),
+                             (roles[b"plugin"], "B")])
+        assert_equals(proxy.rowCount(), 1)
+
+        proxy.set_inclusion([(QtCore.Qt.UserRole + 1000, "INFO")])
+        assert_equals(proxy.rowCount(), 0)
+
+        proxy.set_inclusion([])
+        proxy.set_exclusion([(QtCore.Qt.UserRole + 1000, "INFO")])
+        assert_equals(proxy.rowCount(), 4)
+
+
+def test_result_proxy():
+    """Results are looked up by value, as filtered by ProxyModel"""
+
+    model = models.ResultModel()
+
+    def add(count):
+        model.add_items([
+            {
+                "type": ("record", "error")[index % 2],
+                "levelname": ("DEBUG", "INFO", "WARNING")[index % 3],
+                "plugin": "Plugin%i" % (index % 4),
+                "filter": "Message %i" % index,
+                "lineno": index % 5,
+            }
+            for index in range(count)
+        ])
+
+    add(30)
+
+    proxy = models.ResultProxyModel(model)
+    reference = models.ProxyModel(model)
+
+    def rows(proxy):
+        return [proxy.item(row) for row in range(proxy.rowCount())]
+
+    for rules in ([("levelname", "DEBUG")],
+                  [("type", "record"), ("plugin", "Plugin1")],
+                  [("type", "record"), ("lineno", 3)],
+                  [("type", "error"), ("type", "record")]):
+        for name in ("inclusion", "exclusion"):
+            for model_ in (proxy, reference):
+                getattr(model_, "set_" + name)(rules)
+
+            assert_equals(rows(proxy), [item.json for item in rows(reference)])
+
+        # Rows added are filtered too
+        add(5)
+        assert_equals(rows(proxy), [item.json for item in rows(reference)])
+
+    proxy.setFilterFixedString("message 1")
+    reference.setFilterFixedString("message 1")
+    assert_equals(rows(proxy), [item.json for item in rows(reference)])
+
+    model.reset()
+    assert_equals(proxy.rowCount(), 0)
+
+
+def test_result_search():
+    """Results are searched by the words they contain"""
+
+    model = models.ResultModel()
+    proxy = models.ResultProxyModel(model)
+
+    model.add_items([
+        {"type": "record", "filter": "Validated instance: MyInstance"},
+        {"type": "record", "filter": "Instance is invalid"},
+        {"type": "record", "filter": "Nothing to see (here)"},
+        {"type": "instance", "filter": None},
+    ])
+
+    assert_equals(model.search("valid"), [0, 1])
+    assert_equals(model.search("INSTANCE: my"), [0])
+    assert_equals(model.search("instance is"), [1])
+    assert_equals(model.search("valid", first=1), [1])
+    assert_equals(model.search("("), None)
+
+    def messages():
+        return [proxy.item(row)["filter"] for row in range(proxy.rowCount())]
+
+    # Results without a filter are not searched
+    proxy.setFilterFixedString("here)")
+    assert_equals(messages(), ["Nothing to see (here)", None])
+
+    proxy.add_exclusion("type", "instance")
+    proxy.setFilterFixedString("nvalid")
+    model.add_item({"type": "record", "filter": "Also invalid"})
+    assert_equals(messages(), ["Instance is invalid", "Also invalid"])
+
+    # Searches are made once typing has paused
+    proxy.search_delay = 0
+    proxy.search("nothing")
+    proxy.search("to see")
+    assert_equals(messages(), ["Instance is invalid", "Also invalid"])
+
+    app.processEvents()
+    assert_equals(messages(), ["Nothing to see (here)"])
+
+
+def test_result_search_limit():
+    """Words of results only on disk are forgotten, and still searched"""
+
+    limit = settings.ResultLimit
+    settings.ResultLimit = 10
+
+    try:
+        model = models.ResultModel()
+        proxy = models.ResultProxyModel(model)
+
+        for index in range(100):
+            model.add_item({
+                "type": "record",
+                "filter": "Step %i of %s" % (index, "odd" if index % 2
+                                             else "even %i" % index),
+            })
+
+    finally:
+        settings.ResultLimit = limit
+
+    # Words of results in memory, along with words they share
+    assert_true(len(model._words) < 30)
+
+    assert_equals(model.search("step 3 "), [3])
+    assert_equals(model.search("even 4"), [4, 40] + list(range(42, 50, 2)))
+    assert_equals(model.search("5 of odd"),
+                  [5, 15, 25, 35, 45, 55, 65, 75, 85, 95])
+    assert_equals(model.search("7", first=90), [97])
+    assert_equals(len(model.search("step")), 100)
+
+    proxy.setFilterFixedString("step 1 of")
+    assert_equals(proxy.rowCount(), 1)
+
+
+def test_result_references():
+    """Plug-ins and instances of results are named by their items"""
+
+    items = models.ItemModel()
+    items.add_instances([
+        {
+            "name": "MyInstance",
+            "id": "instance0",
+            "data": {"family": "myFamily"},
+            "children": [],
+        }
+    ])
+
+    model = models.ResultModel()
+    model.update_with_result({
+        "success": True,
+        "plugin": {"id": "plugin0"},
+        "instance": {"id": "instance0"},
+        "error": None,
+        "records": [{"message": "Hello", "levelno": 20}],
+        "duration": 1.0,
+    }, items.items)
+
+    # Unknown plug-ins are named by their id
+    assert_equals(
+        [(row.type, row.plugin, row.instance) for row in model.items],
+        [("plugin", "plugin0", "MyInstance"),
+         ("instance", "plugin0", "MyInstance"),
+         ("record", "plugin0", "MyInstance")]
+    )
+
+
+def test_result_stream():
+    """Records streamed whilst processing precede those of the result"""
+
+    model = models.ResultModel()
+
+    def record(message):
+        return {"message": message, "levelno": 20}
+
+    reference = {"plugin": {"id": "plugin0"}, "instance": None}
+
+    model.update_with_stream(dict(reference, records=[record("First")]))
+    model.update_with_stream(dict(reference, records=[record("Second")]))
+    model.update_with_result(dict(reference,
+                                  success=True,
+                                  error=None,
+                                  duration=1.0,
+                                  records=[record("Third")]))
+
+    assert_equals(
+        [(row.type, row.message) for row in model.items],
+        [("plugin", "plugin0"),
+         ("instance", "Context"),
+         ("record", "First"),
+         ("record", "Second"),
+         ("record", "Third")]
+    )
+
+
+def test_result_dropped():
+    """Results tell of records left out, to be fetched on demand"""
+
+    model = models.ResultModel()
+
+    reference = {"plugin": {"id": "plugin0"},
+                 "instance": {"id": "instance0"}}
+
+    model.update_with_result(dict(reference,
+                                  success=True,
+                                  error=None,
+                                  duration=1.0,
+                                  records=[],
+                                  dropped={"DEBUG": 2}))
+
+    message = model.items[-1]
+    assert_equals(message.message, "2 records left out (DEBUG: 2)")
+    assert_equals(message.dropped, ["plugin0", "instance0"])
+
+    # As passed by Controller.showDropped
+    plugin, instance = message.dropped
+    model.update_with_stream({
+        "plugin": {"id": plugin},
+        "instance": {"id": instance},
+        "records": [{"message": "Left out", "levelno": 10}],
+    })
+
+    assert_equals([(row.type, row.message) for row in model.items[-2:]],
+                  [("instance", "instance0"),
+                   ("record", "Left out")])
+
+
+def test_update_compatibility():
+    """Plug-ins are compatible whilst a compatible instance is toggled"""
+
+    model = models.ItemModel()
+
+    instances = model.add_instances([
+        {
+            "name": "Instance%i" % index,
+            "id": "instance%i" % index,
+            "data": {"family": "myFamily"},
+            "children": [],
+        }
+        for index in range(3)
+    ])
+
+    first, second, third = model.add_plugins([
+        {
+            "pre11": False,
+            "name": "Plugin%i" % index,
+            "label": None,
+            "optional": True,
+            "category": None,
+            "actions": [],
+            "id": "plugin%i" % index,
+            "order": 1,
+            "doc": None,
+            "type": "Validator",
+            "module": "mymodule",
+            "match": 1,
+            "hasRepair": False,
+            "families": ["*"],
+            "contextEnabled": False,
+            "instanceEnabled": True,
+            "__instanceEnabled__": True,
+            "path": "mymodule.py",
+        }
+        for index in range(3)
+    ])
+
+    first.compatibleInstances = ["instance0", "instance1"]
+    second.compatibleInstances = ["instance2"]
+    third.compatibleInstances = ["Context"]
+    model.update_compatibility()
+
+    def compatible():
+        return [plugin.hasCompatible for plugin in (first, second, third)]
+
+    assert_equals(compatible(), [True, True, True])
+
+    for instance in instances:
+        instance.isToggled = False
+        model.update_compatibility(instance)
+
+    assert_equals(compatible(), [False, False, True])
+
+    # Updating twice per toggle is harmless
+    instances[1].isToggled = True
+    model.update_compatibility(instances[1])
+    model.update_compatibility(instances[1])
+    assert_equals(compatible(), [True, False, True])
+
+    instances[1].isToggled = False
+    model.update_compatibility(instances[1])
+    assert_equals(compatible(), [False, False, True])
+
+
+def test_host_toggles_instance():
+    """Plug-ins follow the compatibility of instances toggled by the host"""
+
+    class Collect(pyblish.api.ContextPlugin):
+        order = pyblish.api.CollectorOrder
+
+    class Validate(pyblish.api.InstancePlugin):
+        order = pyblish.api.ValidatorOrder
+
+    context = pyblish.api.Context()
+    instance = context.create_instance("Instance", family="myFamily")
+
+    class Changed(object):
+        """An instance as passed with a context delta"""
+        id = instance.id
+        data = {"family": "myFamily", "publish": False}
+
+    class Host(object):
+        cached_context = None
+
+        def stats(self):
+            return {"totalRequestCount": 0}
+
+        def process_batch(self, pairs, duration=None, **vars):
+            # The collector toggles the instance off
+            return {
+                "results": [{
+                    "success": True,
+                    "plugin": {"id": plugin.id},
+                    "instance": None,
+                    "error": None,
+                    "records": [],
+                    "duration": 0,
+                } for plugin, instance in pairs],
+                "stopped": None,
+                "vars": vars,
+                "context": {"removed": [],
+                            "added": [],
+                            "changed": [Changed()]},
+            }
+
+    controller = control.Controller(Host())
+    model = controller.data["models"]["item"]
+
+    model.add_instances([formatting.format_instance(instance)])
+    collect, validate = model.add_plugins(
+        [formatting.format_plugin(Collect),
+         formatting.format_plugin(Validate)])
+
+    validate.compatibleInstances = [instance.id]
+    model.update_compatibility()
+    assert_true(validate.hasCompatible)
+
+    loop = QtCore.QEventLoop()
+    controller.finished.connect(loop.quit)
+    QtCore.QTimer.singleShot(5000, loop.quit)
+
+    controller.run([Collect, Validate], context)
+    loop.exec_()
+
+    assert_equals(model.instances[instance.id].isToggled, False)
+    assert_equals(validate.hasCompatible, False)
@@ -55,3 +55,62 @@ def test_chain_with_lambdas():
     """util.chain works with lambdas"""
     result = util.chain(lambda result: 5, lambda result: result * 2)
     assert_equals(result, 10)
+
+
+def test_itemlist_index():
+    """util.ItemList lookups by key follow changes to the list"""
+
+    Obj = type("Object", (object,), {})
+
+    def create(id):
+        obj = Obj()
+        obj.id = id
+        return obj
+
+    a, b, c = create("a"), create("b"), create("a")
+
+    items = util.ItemList(key="id")
+    items.extend([a, b, c])
+
+    # The first of many items sharing a key is returned
+    assert_true(items["a"] is a)
+
+    items.remove(a)
+    assert_true(items["a"] is c)
+
+    items[:] = [b]
+    assert_equals(items.get("a"), None)
+
+    items.insert(0, a)
+    assert_true(items["a"] is a)
+    assert_equals(items[0:1], [a])
+
+    # Positions follow appends and removals
+    items.append(c)
+    assert_equals(items.index(c), 2)
+
+    items.remove(b)
+    assert_equals(items.index(c), 1)
+    assert_equals(items.index(a), 0)
+
+
+def test_spill_list():
+    """util.SpillList holds at most `limit` items in memory"""
+
+    items = util.SpillList(limit=10,
+                           dumps=lambda item: str(item).encode("ascii"),
+                           loads=int)
+    items.page_size = 4
+
+    for index in range(25):
+        items.append(index)
+    items.extend(range(25, 50))
+
+    assert_true(len(items._items) <= 10)
+    assert_equals(len(items), 50)
+    assert_equals(list(items), list(range(50)))
+    assert_equals(items[-1], 49)
+    assert_equals(items[3:6], [3, 4, 5])
+
+    items.close()
+    assert_equals(len(items), 0)